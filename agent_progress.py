@@ -3,10 +3,16 @@ Real-time Agent Progress Tracking
 Provides observable status for agent pipeline execution.
 """
 import time
-from typing import Dict, List, Optional, Callable
+import weakref
+from contextvars import ContextVar, Token
+from typing import Dict, List, Optional, Callable, Tuple
 from datetime import datetime
 from enum import Enum
 
+from utils import get_logger
+
+logger = get_logger(__name__)
+
 
 class AgentStatus(Enum):
     """Agent execution status."""
@@ -20,7 +26,13 @@ class AgentStatus(Enum):
 class AgentProgress:
     """Tracks progress of a single agent."""
 
-    def __init__(self, name: str, description: str):
+    __slots__ = (
+        'name', 'description', 'status', 'progress', 'current_item',
+        'total_items', 'message', 'result', 'error', 'start_time',
+        'end_time', 'mono_start', 'mono_end', 'emoji', '_pipeline'
+    )
+
+    def __init__(self, name: str, description: str, pipeline: Optional["PipelineProgress"] = None):
         self.name = name
         self.description = description
         self.status = AgentStatus.PENDING
@@ -30,60 +42,88 @@ class AgentProgress:
         self.message = ""
         self.result = None
         self.error = None
-        self.start_time = None
+        self.start_time = None  # wall clock, exported
         self.end_time = None
+        self.mono_start = None  # monotonic, for durations
+        self.mono_end = None
         self.emoji = "⏳"
+        self._pipeline = weakref.ref(pipeline) if pipeline is not None else None
+
+    def _changed(self, old_progress: float, old_status: AgentStatus):
+        """Report a state change to the owning pipeline, which may notify subscribers."""
+        pipeline = self._pipeline() if self._pipeline is not None else None
+        if pipeline is not None:
+            pipeline._on_agent_delta(old_progress, self.progress, old_status, self.status)
+            pipeline.notify_if_changed()
 
     def start(self, total_items: int = 0, message: str = ""):
         """Mark agent as started."""
+        old_progress, old_status = self.progress, self.status
         self.status = AgentStatus.RUNNING
         self.start_time = time.time()
+        self.mono_start = time.monotonic()
         self.total_items = total_items
         self.message = message or f"Starting {self.name}..."
         self.emoji = "🔄"
+        self._changed(old_progress, old_status)
 
     def update(self, current: int = None, message: str = None):
         """Update progress."""
+        old_progress, old_status = self.progress, self.status
         if current is not None:
             self.current_item = current
             if self.total_items > 0:
                 self.progress = current / self.total_items
         if message:
             self.message = message
+        self._changed(old_progress, old_status)
 
     def complete(self, result=None, message: str = None):
         """Mark agent as completed."""
+        old_progress, old_status = self.progress, self.status
         self.status = AgentStatus.COMPLETED
         self.end_time = time.time()
+        self.mono_end = time.monotonic()
         self.progress = 1.0
         self.result = result
         self.message = message or f"{self.name} completed"
         self.emoji = "✅"
+        self._changed(old_progress, old_status)
 
     def fail(self, error: str):
         """Mark agent as failed."""
+        old_progress, old_status = self.progress, self.status
         self.status = AgentStatus.FAILED
         self.end_time = time.time()
+        self.mono_end = time.monotonic()
         self.error = error
         self.message = f"Failed: {error}"
         self.emoji = "❌"
+        self._changed(old_progress, old_status)
 
     def skip(self, reason: str):
         """Mark agent as skipped."""
+        old_progress, old_status = self.progress, self.status
         self.status = AgentStatus.SKIPPED
         self.message = reason
         self.emoji = "⏭️"
+        self._changed(old_progress, old_status)
+
+    def _elapsed_at(self, now: float) -> Optional[float]:
+        """Elapsed seconds using a caller-supplied time.monotonic() reading."""
+        if self.mono_start is None:
+            return None
+        return (self.mono_end or now) - self.mono_start
 
     @property
     def elapsed_time(self) -> Optional[float]:
         """Get elapsed time in seconds."""
-        if not self.start_time:
-            return None
-        end = self.end_time or time.time()
-        return end - self.start_time
+        return self._elapsed_at(time.monotonic())
 
-    def to_dict(self) -> Dict:
+    def to_dict(self, now: Optional[float] = None) -> Dict:
         """Convert to dictionary for JSON serialization."""
+        if now is None:
+            now = time.monotonic()
         return {
             'name': self.name,
             'description': self.description,
@@ -93,50 +133,134 @@ class AgentProgress:
             'total_items': self.total_items,
             'message': self.message,
             'emoji': self.emoji,
-            'elapsed_time': self.elapsed_time,
+            'elapsed_time': self._elapsed_at(now),
             'error': self.error
         }
 
+    def to_dict_fast(self, now: float) -> Dict:
+        """Compact snapshot for high-frequency updates; None-valued fields are omitted."""
+        start = self.mono_start
+        pairs = (
+            ('name', self.name),
+            ('description', self.description),
+            ('status', self.status.value),
+            ('progress', self.progress),
+            ('current_item', self.current_item),
+            ('total_items', self.total_items),
+            ('message', self.message),
+            ('emoji', self.emoji),
+            ('elapsed_time', (self.mono_end or now) - start if start is not None else None),
+            ('error', self.error),
+        )
+        return {k: v for k, v in pairs if v is not None}
+
 
 class PipelineProgress:
     """Tracks progress of entire agent pipeline."""
 
+    __slots__ = (
+        'agents', 'callbacks', 'start_time', 'end_time', 'mono_start',
+        'mono_end', '_by_name',
+        '_progress_sum', '_completed_count', '_status_version',
+        '_last_notified_progress', '_last_notified_status_version',
+        '__weakref__'
+    )
+
     def __init__(self):
         self.agents: List[AgentProgress] = []
-        self.callbacks: List[Callable] = []
-        self.start_time = None
+        self._by_name: Dict[str, AgentProgress] = {}
+        self._progress_sum = 0.0
+        self._completed_count = 0
+        self._status_version = 0
+        self.callbacks: Tuple[Callable, ...] = ()
+        self.start_time = None  # wall clock, exported
         self.end_time = None
+        self.mono_start = None  # monotonic, for durations
+        self.mono_end = None
+        self._last_notified_progress: Optional[float] = None
+        self._last_notified_status_version: Optional[int] = None
 
     def add_agent(self, name: str, description: str) -> AgentProgress:
         """Add agent to pipeline."""
-        agent = AgentProgress(name, description)
+        agent = AgentProgress(name, description, pipeline=self)
         self.agents.append(agent)
+        self._by_name.setdefault(name, agent)
         return agent
 
     def get_agent(self, name: str) -> Optional[AgentProgress]:
         """Get agent by name."""
-        return next((a for a in self.agents if a.name == name), None)
+        return self._by_name.get(name)
 
     def on_update(self, callback: Callable):
         """Register callback for updates."""
-        self.callbacks.append(callback)
+        if not callable(callback):
+            raise TypeError(f"Progress callback must be callable, got {type(callback).__name__}")
+        # Copy-on-write: readers iterate whichever tuple they grabbed
+        self.callbacks = self.callbacks + (callback,)
+
+    def _on_agent_delta(
+        self,
+        old_progress: float,
+        new_progress: float,
+        old_status: AgentStatus,
+        new_status: AgentStatus
+    ):
+        """Keep cached progress/completion totals in sync with one agent's change."""
+        self._progress_sum += new_progress - old_progress
+        if old_status is not new_status:
+            self._status_version += 1
+            if old_status is AgentStatus.COMPLETED:
+                self._completed_count -= 1
+            if new_status is AgentStatus.COMPLETED:
+                self._completed_count += 1
 
     def notify(self):
         """Notify all callbacks of update."""
-        for callback in self.callbacks:
+        callbacks = self.callbacks
+        if not callbacks:
+            return
+        self._last_notified_progress = self.overall_progress
+        self._last_notified_status_version = self._status_version
+        # One guard for the whole loop; a failing callback is logged once,
+        # dropped, and the remaining callbacks still run.
+        failed = []
+        pending = iter(callbacks)
+        while True:
             try:
-                callback(self)
-            except Exception as e:
-                print(f"Callback error: {e}")
+                for callback in pending:
+                    callback(self)
+                break
+            except Exception:
+                logger.exception(f"Progress callback {callback!r} failed; unregistering it")
+                failed.append(callback)
+        if failed:
+            self.callbacks = tuple(cb for cb in self.callbacks if cb not in failed)
+
+    def notify_if_changed(self, min_delta: float = 0.005):
+        """
+        Notify callbacks only if progress moved by at least ``min_delta``
+        or any agent changed status since the last notification.
+        """
+        if not self.callbacks:
+            return
+        if (
+            self._last_notified_progress is not None
+            and abs(self.overall_progress - self._last_notified_progress) < min_delta
+            and self._status_version == self._last_notified_status_version
+        ):
+            return
+        self.notify()
 
     def start(self):
         """Start pipeline."""
         self.start_time = time.time()
+        self.mono_start = time.monotonic()
         self.notify()
 
     def complete(self):
         """Complete pipeline."""
         self.end_time = time.time()
+        self.mono_end = time.monotonic()
         self.notify()
 
     @property
@@ -144,67 +268,89 @@ class PipelineProgress:
         """Calculate overall progress (0.0 to 1.0)."""
         if not self.agents:
             return 0.0
-        return sum(a.progress for a in self.agents) / len(self.agents)
+        return self._progress_sum / len(self.agents)
 
     @property
     def completed_agents(self) -> int:
         """Count completed agents."""
-        return sum(1 for a in self.agents if a.status == AgentStatus.COMPLETED)
+        return self._completed_count
 
     @property
     def total_agents(self) -> int:
         """Total number of agents."""
         return len(self.agents)
 
+    def _elapsed_at(self, now: float) -> Optional[float]:
+        """Elapsed seconds using a caller-supplied time.monotonic() reading."""
+        if self.mono_start is None:
+            return None
+        return (self.mono_end or now) - self.mono_start
+
     @property
     def elapsed_time(self) -> Optional[float]:
         """Get elapsed time in seconds."""
-        if not self.start_time:
+        return self._elapsed_at(time.monotonic())
+
+    def _remaining_for(self, elapsed: Optional[float], progress: float) -> Optional[float]:
+        """Estimate remaining seconds from an already computed elapsed/progress pair."""
+        if not elapsed or progress == 0:
             return None
-        end = self.end_time or time.time()
-        return end - self.start_time
+        total_estimated = elapsed / progress
+        return total_estimated - elapsed
 
     @property
     def estimated_time_remaining(self) -> Optional[float]:
         """Estimate remaining time in seconds."""
-        if not self.start_time or self.overall_progress == 0:
-            return None
-        elapsed = self.elapsed_time
-        if not elapsed:
-            return None
-        total_estimated = elapsed / self.overall_progress
-        return total_estimated - elapsed
+        return self._remaining_for(self.elapsed_time, self.overall_progress)
 
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization."""
+        now = time.monotonic()
+        elapsed = self._elapsed_at(now)
+        progress = self.overall_progress
         return {
-            'agents': [a.to_dict() for a in self.agents],
-            'overall_progress': self.overall_progress,
+            'agents': [a.to_dict_fast(now) for a in self.agents],
+            'overall_progress': progress,
             'completed_agents': self.completed_agents,
             'total_agents': self.total_agents,
-            'elapsed_time': self.elapsed_time,
-            'estimated_time_remaining': self.estimated_time_remaining,
+            'elapsed_time': elapsed,
+            'estimated_time_remaining': self._remaining_for(elapsed, progress),
             'start_time': self.start_time,
             'end_time': self.end_time
         }
 
 
-# Global progress tracker for current operation
-_current_progress: Optional[PipelineProgress] = None
+# Progress tracker for the current operation. A ContextVar keeps concurrent
+# pipelines (threads or asyncio tasks) from clobbering each other; the
+# module-level fallback lets observers in other threads (e.g. the dashboard
+# WebSocket) still see the most recently started pipeline.
+_current_progress: ContextVar[Optional[PipelineProgress]] = ContextVar('_current_progress', default=None)
+_last_published: Optional[PipelineProgress] = None
 
 
 def get_current_progress() -> Optional[PipelineProgress]:
     """Get current pipeline progress."""
-    return _current_progress
+    return _current_progress.get() or _last_published
+
+
+def set_current_progress(progress: PipelineProgress) -> Token:
+    """Set current pipeline progress; pass the returned token to reset_current_progress."""
+    global _last_published
+    _last_published = progress
+    return _current_progress.set(progress)
 
 
-def set_current_progress(progress: PipelineProgress):
-    """Set current pipeline progress."""
-    global _current_progress
-    _current_progress = progress
+def reset_current_progress(token: Token):
+    """Restore the progress tracker that was current before set_current_progress."""
+    global _last_published
+    if _last_published is _current_progress.get():
+        _last_published = None
+    _current_progress.reset(token)
 
 
 def clear_current_progress():
     """Clear current pipeline progress."""
-    global _current_progress
-    _current_progress = None
+    global _last_published
+    if _last_published is _current_progress.get():
+        _last_published = None
+    _current_progress.set(None)
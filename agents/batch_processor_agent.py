@@ -2,19 +2,206 @@
 Batch Processor Agent using OpenAI's Batch API.
 Processes hundreds/thousands of job postings asynchronously at 50% cost reduction.
 """
+import asyncio
+import hashlib
 import json
+import os
+import shutil
 import time
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Iterator, NamedTuple, Optional, Set, Union
 from pathlib import Path
-from datetime import datetime
+from types import MappingProxyType
 from openai import OpenAI
 
+from agents.client_agent import _get_http_client
 from config import Config
 from utils import get_logger
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
 logger = get_logger(__name__)
 
 
+def _dumps_bytes(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def _loads(data: Union[str, bytes]) -> Any:
+    """Deserialize JSON text or bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class _JobView(NamedTuple):
+    """Prompt fields of a job posting, with descriptions trimmed once."""
+    company: str
+    title: str
+    location: str
+    desc2k: str
+    desc1_5k: str
+    
+    @classmethod
+    def from_job(cls, job: Dict[str, Any]) -> "_JobView":
+        desc2k = job.get('description', 'N/A')[:2000]
+        return cls(
+            job.get('company_name', 'Unknown'),
+            job.get('title', 'Unknown'),
+            job.get('location', 'Unknown'),
+            desc2k,
+            desc2k[:1500]
+        )
+
+
+# Prompt templates are built once at import and shared by every request.
+_SYS_ANALYZE = {"role": "system", "content": "You are an expert sales analyst for workforce analytics software."}
+_TPL_ANALYZE = """Analyze this job posting for Forecasta (workforce analytics platform):
+
+Company: {job.company}
+Title: {job.title}
+Location: {job.location}
+Description: {job.desc2k}
+
+Provide:
+1. Qualification tier (TIER 1-5, where TIER 1 = best fit)
+2. Pain points (workforce challenges this company faces)
+3. Company size estimate
+4. Industry
+5. Forecasta fit score (0-100)
+6. Recommended next steps
+
+Format as JSON with keys: tier, pain_points, company_size, industry, fit_score, next_steps"""
+
+_SYS_QUALIFY = {"role": "system", "content": "You are a sales qualification expert."}
+_TPL_QUALIFY = """Qualify this company as a sales lead (quick analysis):
+
+Company: {job.company}
+Title: {job.title}
+Description: {job.desc1_5k}
+
+Return JSON:
+- qualified: true/false
+- tier: TIER 1-5 (if qualified)
+- reason: brief explanation"""
+
+_SYS_PAIN_POINTS = {"role": "system", "content": "You are an expert at identifying business pain points."}
+_TPL_PAIN_POINTS = """Extract workforce pain points from this job posting:
+
+{job.desc2k}
+
+Return JSON array of pain points as strings.
+Focus on: turnover, scaling, hiring challenges, retention, optimization needs."""
+
+_SYS_PARSE = {"role": "system", "content": "You are an expert job posting parser."}
+_TPL_PARSE = """Parse this job posting into structured data:
+
+{job.desc2k}
+
+Return JSON:
+- title: job title
+- company: company name
+- location: location
+- required_skills: array of required skills
+- nice_to_have_skills: array of preferred skills
+- salary_range: if mentioned
+- work_arrangement: remote/hybrid/onsite
+- experience_years: required years"""
+
+
+def _build_analysis_messages(job: _JobView) -> List[Dict[str, str]]:
+    """Build messages for complete job analysis."""
+    return [_SYS_ANALYZE, {"role": "user", "content": _TPL_ANALYZE.format(job=job)}]
+
+
+def _build_qualification_messages(job: _JobView) -> List[Dict[str, str]]:
+    """Build messages for quick qualification."""
+    return [_SYS_QUALIFY, {"role": "user", "content": _TPL_QUALIFY.format(job=job)}]
+
+
+def _build_pain_point_messages(job: _JobView) -> List[Dict[str, str]]:
+    """Build messages for pain point extraction."""
+    return [_SYS_PAIN_POINTS, {"role": "user", "content": _TPL_PAIN_POINTS.format(job=job)}]
+
+
+def _build_parse_messages(job: _JobView) -> List[Dict[str, str]]:
+    """Build messages for structured parsing."""
+    return [_SYS_PARSE, {"role": "user", "content": _TPL_PARSE.format(job=job)}]
+
+
+_MESSAGE_BUILDERS = {
+    "analyze": _build_analysis_messages,
+    "qualify": _build_qualification_messages,
+    "extract_pain_points": _build_pain_point_messages,
+    "parse": _build_parse_messages,
+}
+
+# Request parameters shared by every batch line; never mutated
+_BASE_BODY = MappingProxyType({
+    "max_tokens": 2000,
+    "temperature": 0.3,
+    "response_format": {"type": "json_object"}
+})
+
+_TERMINAL_STATUSES = frozenset({'completed', 'failed', 'expired', 'cancelled'})
+
+
+def _custom_id(task_type: str, job: Dict[str, Any], idx: int) -> str:
+    """Batch request id for a job posting."""
+    return f"{task_type}_{job.get('url', f'job_{idx}')}"
+
+
+def _prompt_key(task_type: str, model: str, job: Dict[str, Any]) -> bytes:
+    """16-byte digest of every field that shapes a job's prompt."""
+    digest = hashlib.blake2b(digest_size=16)
+    for value in (
+        task_type,
+        model,
+        job.get('description'),
+        job.get('company_name'),
+        job.get('title'),
+        job.get('location'),
+    ):
+        digest.update(repr(value).encode('utf-8'))
+        digest.update(b'\x00')
+    return digest.digest()
+
+
+def _iter_request_lines(
+    job_postings: List[Dict[str, Any]],
+    custom_ids: List[str],
+    task_type: str,
+    model: str
+) -> Iterator[bytes]:
+    """Yield one serialized batch request line per job posting."""
+    build_messages = _MESSAGE_BUILDERS[task_type]
+    
+    # Static request scaffold: only custom_id and messages change per job
+    body = {"model": model, "messages": None, **_BASE_BODY}
+    request = {
+        "custom_id": None,
+        "method": "POST",
+        "url": "/v1/chat/completions",
+        "body": body
+    }
+    
+    for custom_id, job in zip(custom_ids, job_postings):
+        request["custom_id"] = custom_id
+        body["messages"] = build_messages(_JobView.from_job(job))
+        yield _dumps_bytes(request) + b'\n'
+
+
+def _dup_map_path(path: Union[str, Path]) -> Path:
+    """Sidecar file mapping duplicate custom_ids to the request that answers them."""
+    return Path(path).with_suffix('.dups.json')
+
+
 class BatchProcessorAgent:
     """
     Agent for processing large volumes of job postings using OpenAI Batch API.
@@ -33,7 +220,9 @@ class BatchProcessorAgent:
         Args:
             output_dir: Directory for batch files and results
         """
-        self.client = OpenAI(api_key=Config.OPENAI_API_KEY)
+        # Uploads reuse ClientAgent's keep-alive pool, which warm_up primes
+        self._http_client = _get_http_client()
+        self.client = OpenAI(api_key=Config.OPENAI_API_KEY, http_client=self._http_client)
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
@@ -43,7 +232,8 @@ class BatchProcessorAgent:
         self,
         job_postings: List[Dict[str, Any]],
         task_type: str = "analyze",
-        model: str = "gpt-4o-mini"
+        model: str = "gpt-4o-mini",
+        deduplicate: bool = True
     ) -> str:
         """
         Create .jsonl batch input file from job postings.
@@ -52,126 +242,62 @@ class BatchProcessorAgent:
             job_postings: List of job posting dictionaries
             task_type: Type of task (analyze, qualify, extract_pain_points, etc.)
             model: OpenAI model to use
+            deduplicate: Send one request per identical prompt; results are
+                fanned back out to every duplicate custom_id when parsed
         
         Returns:
             Path to created .jsonl file
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = self.output_dir / f"batch_input_{task_type}_{timestamp}.jsonl"
+        if task_type not in _MESSAGE_BUILDERS:
+            raise ValueError(f"Unknown task_type: {task_type}")
         
-        logger.info(f"Creating batch input file: {filename}")
+        # time_ns keeps names unique across calls within the same second
+        filename = self.output_dir / f"batch_input_{task_type}_{time.strftime('%Y%m%d')}_{time.time_ns()}.jsonl"
         
-        with open(filename, 'w') as f:
-            for idx, job in enumerate(job_postings):
-                custom_id = f"{task_type}_{job.get('url', f'job_{idx}')}"
-                
-                # Build request based on task type
-                if task_type == "analyze":
-                    messages = self._build_analysis_messages(job)
-                elif task_type == "qualify":
-                    messages = self._build_qualification_messages(job)
-                elif task_type == "extract_pain_points":
-                    messages = self._build_pain_point_messages(job)
-                elif task_type == "parse":
-                    messages = self._build_parse_messages(job)
-                else:
-                    raise ValueError(f"Unknown task_type: {task_type}")
-                
-                # Create batch request line
-                request = {
-                    "custom_id": custom_id,
-                    "method": "POST",
-                    "url": "/v1/chat/completions",
-                    "body": {
-                        "model": model,
-                        "messages": messages,
-                        "max_tokens": 2000,
-                        "temperature": 0.3,
-                        "response_format": {"type": "json_object"}
-                    }
-                }
-                
-                f.write(json.dumps(request) + '\n')
+        logger.info(f"Creating batch input file: {filename}")
         
-        logger.info(f"Created batch input with {len(job_postings)} requests")
+        jobs = []
+        custom_ids = []
+        duplicates: Dict[str, str] = {}
+        seen: Dict[bytes, str] = {}
+        for idx, job in enumerate(job_postings):
+            custom_id = _custom_id(task_type, job, idx)
+            if deduplicate:
+                key = _prompt_key(task_type, model, job)
+                canonical_id = seen.get(key)
+                if canonical_id is not None:
+                    if canonical_id != custom_id:
+                        duplicates[custom_id] = canonical_id
+                    continue
+                seen[key] = custom_id
+            jobs.append(job)
+            custom_ids.append(custom_id)
+        
+        with open(filename, 'wb', buffering=1 << 20) as f:
+            f.writelines(_iter_request_lines(jobs, custom_ids, task_type, model))
+        
+        if duplicates:
+            with open(_dup_map_path(filename), 'wb') as f:
+                f.write(_dumps_bytes(duplicates))
+            logger.info(f"Skipped {len(job_postings) - len(jobs)} duplicate prompts")
+        
+        logger.info(f"Created batch input with {len(jobs)} requests")
         return str(filename)
     
-    def _build_analysis_messages(self, job: Dict[str, Any]) -> List[Dict[str, str]]:
-        """Build messages for complete job analysis."""
-        prompt = f"""Analyze this job posting for Forecasta (workforce analytics platform):
-
-Company: {job.get('company_name', 'Unknown')}
-Title: {job.get('title', 'Unknown')}
-Location: {job.get('location', 'Unknown')}
-Description: {job.get('description', 'N/A')[:2000]}
-
-Provide:
-1. Qualification tier (TIER 1-5, where TIER 1 = best fit)
-2. Pain points (workforce challenges this company faces)
-3. Company size estimate
-4. Industry
-5. Forecasta fit score (0-100)
-6. Recommended next steps
-
-Format as JSON with keys: tier, pain_points, company_size, industry, fit_score, next_steps"""
-        
-        return [
-            {"role": "system", "content": "You are an expert sales analyst for workforce analytics software."},
-            {"role": "user", "content": prompt}
-        ]
-    
-    def _build_qualification_messages(self, job: Dict[str, Any]) -> List[Dict[str, str]]:
-        """Build messages for quick qualification."""
-        prompt = f"""Qualify this company as a sales lead (quick analysis):
-
-Company: {job.get('company_name', 'Unknown')}
-Title: {job.get('title', 'Unknown')}
-Description: {job.get('description', 'N/A')[:1500]}
-
-Return JSON:
-- qualified: true/false
-- tier: TIER 1-5 (if qualified)
-- reason: brief explanation"""
-        
-        return [
-            {"role": "system", "content": "You are a sales qualification expert."},
-            {"role": "user", "content": prompt}
-        ]
-    
-    def _build_pain_point_messages(self, job: Dict[str, Any]) -> List[Dict[str, str]]:
-        """Build messages for pain point extraction."""
-        prompt = f"""Extract workforce pain points from this job posting:
-
-{job.get('description', 'N/A')[:2000]}
-
-Return JSON array of pain points as strings.
-Focus on: turnover, scaling, hiring challenges, retention, optimization needs."""
-        
-        return [
-            {"role": "system", "content": "You are an expert at identifying business pain points."},
-            {"role": "user", "content": prompt}
-        ]
-    
-    def _build_parse_messages(self, job: Dict[str, Any]) -> List[Dict[str, str]]:
-        """Build messages for structured parsing."""
-        prompt = f"""Parse this job posting into structured data:
-
-{job.get('description', 'N/A')[:2000]}
-
-Return JSON:
-- title: job title
-- company: company name
-- location: location
-- required_skills: array of required skills
-- nice_to_have_skills: array of preferred skills
-- salary_range: if mentioned
-- work_arrangement: remote/hybrid/onsite
-- experience_years: required years"""
+    def warm_up(self):
+        """
+        Open the HTTPS connection to the Files API ahead of an upload.
         
-        return [
-            {"role": "system", "content": "You are an expert job posting parser."},
-            {"role": "user", "content": prompt}
-        ]
+        Sends an unauthenticated HEAD, so nothing is billed or counted
+        against rate limits. Failures are logged and ignored; the upload will
+        simply connect itself.
+        """
+        if self._http_client is None:
+            return
+        try:
+            self._http_client.head(str(self.client.base_url))
+        except Exception as e:
+            logger.debug(f"Files API warm-up failed: {e}")
     
     def upload_batch_file(self, input_file: str) -> str:
         """
@@ -192,6 +318,12 @@ Return JSON:
             )
         
         logger.info(f"File uploaded: {file_obj.id}")
+        
+        # Re-key the duplicate map by file id so download_results can find it
+        dup_map = _dup_map_path(input_file)
+        if dup_map.exists():
+            os.replace(dup_map, self.output_dir / f"dup_map_{file_obj.id}.json")
+        
         return file_obj.id
     
     def create_batch(
@@ -227,18 +359,9 @@ Return JSON:
         logger.info(f"Batch created: {batch.id} (status: {batch.status})")
         return batch.id
     
-    def check_batch_status(self, batch_id: str) -> Dict[str, Any]:
-        """
-        Check the status of a batch.
-        
-        Args:
-            batch_id: Batch ID
-        
-        Returns:
-            Batch status information
-        """
-        batch = self.client.batches.retrieve(batch_id)
-        
+    @staticmethod
+    def _batch_status(batch: Any) -> Dict[str, Any]:
+        """Project an OpenAI batch object into a status dictionary."""
         return {
             'id': batch.id,
             'status': batch.status,
@@ -251,10 +374,109 @@ Return JSON:
                 'completed': batch.request_counts.completed,
                 'failed': batch.request_counts.failed
             },
+            'input_file_id': batch.input_file_id,
             'output_file_id': batch.output_file_id,
             'error_file_id': batch.error_file_id
         }
     
+    def check_batch_status(self, batch_id: str) -> Dict[str, Any]:
+        """
+        Check the status of a batch.
+        
+        Args:
+            batch_id: Batch ID
+        
+        Returns:
+            Batch status information
+        """
+        return self._batch_status(self.client.batches.retrieve(batch_id))
+    
+    def check_many(self, batch_ids: Set[str], max_pages: int = 10) -> Dict[str, Dict[str, Any]]:
+        """
+        Check the status of several batches with paginated list calls.
+        
+        Pages through recent batches (100 per call) until every requested
+        id has been seen or ``max_pages`` is reached; ids older than that
+        window are retrieved individually.
+        
+        Args:
+            batch_ids: Batch IDs to check
+            max_pages: Maximum list pages to request
+        
+        Returns:
+            Mapping of batch ID to batch status information
+        """
+        pending = set(batch_ids)
+        statuses: Dict[str, Dict[str, Any]] = {}
+        after = None
+        
+        for _ in range(max_pages):
+            if not pending:
+                break
+            params = {'limit': 100}
+            if after:
+                params['after'] = after
+            page = self.client.batches.list(**params)
+            for batch in page.data:
+                if batch.id in pending:
+                    statuses[batch.id] = self._batch_status(batch)
+                    pending.discard(batch.id)
+            if not page.data or not page.has_more:
+                break
+            after = page.data[-1].id
+        
+        for batch_id in pending:
+            statuses[batch_id] = self.check_batch_status(batch_id)
+        
+        return statuses
+    
+    async def wait_for_batch_async(
+        self,
+        batch_id: str,
+        initial: float = 2,
+        max_interval: float = 60,
+        max_wait: int = 86400
+    ) -> Dict[str, Any]:
+        """
+        Wait for batch to complete without blocking the event loop.
+        
+        Polls with exponential backoff (x1.5 per check) starting at
+        ``initial`` seconds and capped at ``max_interval``, so short batches
+        are picked up quickly while long ones cost few API calls. Several
+        batches can be awaited concurrently with ``asyncio.gather``.
+        
+        Args:
+            batch_id: Batch ID
+            initial: Seconds before the first re-check
+            max_interval: Upper bound on seconds between status checks
+            max_wait: Maximum seconds to wait (default 24h)
+        
+        Returns:
+            Final batch status
+        """
+        logger.info(f"Waiting for batch {batch_id} to complete...")
+        
+        start_time = time.monotonic()
+        interval = initial
+        
+        while True:
+            status = await asyncio.to_thread(self.check_batch_status, batch_id)
+            
+            logger.info(f"Batch {batch_id}: {status['status']} "
+                       f"({status['request_counts']['completed']}/{status['request_counts']['total']} completed)")
+            
+            if status['status'] in _TERMINAL_STATUSES:
+                logger.info(f"Batch {batch_id} finished with status: {status['status']}")
+                return status
+            
+            elapsed = time.monotonic() - start_time
+            if elapsed > max_wait:
+                logger.warning(f"Batch {batch_id} exceeded max wait time ({max_wait}s)")
+                return status
+            
+            await asyncio.sleep(interval)
+            interval = min(max_interval, interval * 1.5)
+    
     def wait_for_batch(
         self,
         batch_id: str,
@@ -264,6 +486,9 @@ Return JSON:
         """
         Wait for batch to complete (blocking).
         
+        Safe to call from code that is already running an event loop; async
+        callers that should not block can use wait_for_batch_async instead.
+        
         Args:
             batch_id: Batch ID
             check_interval: Seconds between status checks
@@ -274,25 +499,81 @@ Return JSON:
         """
         logger.info(f"Waiting for batch {batch_id} to complete...")
         
-        start_time = time.time()
+        start_time = time.monotonic()
         
         while True:
             status = self.check_batch_status(batch_id)
-            
+        
             logger.info(f"Batch {batch_id}: {status['status']} "
                        f"({status['request_counts']['completed']}/{status['request_counts']['total']} completed)")
-            
-            if status['status'] in ['completed', 'failed', 'expired', 'cancelled']:
+        
+            if status['status'] in _TERMINAL_STATUSES:
                 logger.info(f"Batch {batch_id} finished with status: {status['status']}")
                 return status
-            
-            elapsed = time.time() - start_time
+        
+            elapsed = time.monotonic() - start_time
             if elapsed > max_wait:
                 logger.warning(f"Batch {batch_id} exceeded max wait time ({max_wait}s)")
                 return status
-            
+        
             time.sleep(check_interval)
     
+    async def wait_for_batches_async(
+        self,
+        batch_ids: Set[str],
+        initial: float = 2,
+        max_interval: float = 60,
+        max_wait: int = 86400
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Wait for several batches, polling all of them with one check_many per tick.
+        
+        Args:
+            batch_ids: Batch IDs to wait for
+            initial: Seconds before the first re-check
+            max_interval: Upper bound on seconds between status checks
+            max_wait: Maximum seconds to wait (default 24h)
+        
+        Returns:
+            Mapping of batch ID to its last observed status
+        """
+        logger.info(f"Waiting for {len(batch_ids)} batches to complete...")
+        
+        start_time = time.monotonic()
+        interval = initial
+        pending = set(batch_ids)
+        statuses: Dict[str, Dict[str, Any]] = {}
+        
+        while True:
+            statuses.update(await asyncio.to_thread(self.check_many, pending))
+            pending = {b for b in pending if statuses[b]['status'] not in _TERMINAL_STATUSES}
+            
+            logger.info(f"Batches finished: {len(batch_ids) - len(pending)}/{len(batch_ids)}")
+            
+            if not pending:
+                return statuses
+            
+            elapsed = time.monotonic() - start_time
+            if elapsed > max_wait:
+                logger.warning(f"{len(pending)} batches exceeded max wait time ({max_wait}s)")
+                return statuses
+            
+            await asyncio.sleep(interval)
+            interval = min(max_interval, interval * 1.5)
+    
+    def _download_file(self, file_id: str, destination: Path):
+        """Write an OpenAI file to disk in 1 MiB chunks without buffering it all."""
+        streaming = getattr(self.client.files, 'with_streaming_response', None)
+        
+        with open(destination, 'wb') as f:
+            if streaming is None:
+                f.write(self.client.files.content(file_id).read())
+                return
+            
+            with streaming.content(file_id) as response:
+                for chunk in response.iter_bytes(chunk_size=1 << 20):
+                    f.write(chunk)
+    
     def download_results(self, batch_id: str) -> str:
         """
         Download batch results to local file.
@@ -310,69 +591,98 @@ Return JSON:
         
         logger.info(f"Downloading results from batch {batch_id}")
         
-        # Download results
-        file_response = self.client.files.content(status['output_file_id'])
-        
-        # Save to file
+        # Stream results straight to disk
         output_file = self.output_dir / f"batch_output_{batch_id}.jsonl"
-        with open(output_file, 'w') as f:
-            f.write(file_response.text)
+        self._download_file(status['output_file_id'], output_file)
         
         logger.info(f"Results saved to: {output_file}")
         
+        dup_map = self.output_dir / f"dup_map_{status['input_file_id']}.json"
+        if dup_map.exists():
+            shutil.copyfile(dup_map, _dup_map_path(output_file))
+        
         # Download error file if exists
         if status['error_file_id']:
             logger.info(f"Downloading error file from batch {batch_id}")
-            error_response = self.client.files.content(status['error_file_id'])
             error_file = self.output_dir / f"batch_errors_{batch_id}.jsonl"
-            with open(error_file, 'w') as f:
-                f.write(error_response.text)
+            self._download_file(status['error_file_id'], error_file)
             logger.info(f"Errors saved to: {error_file}")
         
         return str(output_file)
     
-    def parse_results(self, results_file: str) -> List[Dict[str, Any]]:
+    def iter_results(self, results_file: str) -> Iterator[Dict[str, Any]]:
         """
-        Parse batch results file into structured data.
+        Stream parsed results from a batch results file, one line at a time.
+        
+        Results for deduplicated prompts are repeated for every duplicate
+        custom_id recorded when the input file was created.
         
         Args:
             results_file: Path to results .jsonl file
         
-        Returns:
-            List of parsed results
+        Yields:
+            Parsed result dictionaries
         """
         logger.info(f"Parsing results from: {results_file}")
         
-        results = []
-        with open(results_file, 'r') as f:
+        # Invert the duplicate map: canonical custom_id -> duplicate custom_ids
+        fan_out: Dict[str, List[str]] = {}
+        dup_map = _dup_map_path(results_file)
+        if dup_map.exists():
+            with open(dup_map, 'rb') as f:
+                for duplicate_id, canonical_id in _loads(f.read()).items():
+                    fan_out.setdefault(canonical_id, []).append(duplicate_id)
+        
+        count = 0
+        with open(results_file, 'rb') as f:
             for line in f:
-                if line.strip():
-                    result = json.loads(line)
-                    
-                    # Extract key data
-                    parsed = {
-                        'custom_id': result.get('custom_id'),
-                        'status_code': result['response']['status_code'],
-                        'success': result['error'] is None,
-                    }
-                    
-                    if parsed['success']:
-                        # Parse response content
-                        content = result['response']['body']['choices'][0]['message']['content']
-                        try:
-                            parsed['data'] = json.loads(content)
-                        except json.JSONDecodeError:
-                            parsed['data'] = {'raw_content': content}
-                        
-                        # Add usage stats
-                        parsed['tokens_used'] = result['response']['body']['usage']['total_tokens']
-                    else:
-                        parsed['error'] = result['error']
+                if not line.strip():
+                    continue
+                result = _loads(line)
+                resp = result['response']
+                error = result['error']
+                
+                # Extract key data
+                parsed = {
+                    'custom_id': result.get('custom_id'),
+                    'status_code': resp['status_code'],
+                    'success': error is None,
+                }
+                
+                if error is None:
+                    # Parse response content
+                    body = resp['body']
+                    content = body['choices'][0]['message']['content']
+                    try:
+                        parsed['data'] = _loads(content)
+                    except json.JSONDecodeError:
+                        parsed['data'] = {'raw_content': content}
                     
-                    results.append(parsed)
+                    # Add usage stats
+                    parsed['tokens_used'] = body['usage']['total_tokens']
+                else:
+                    parsed['error'] = error
+                
+                count += 1
+                yield parsed
+                
+                for duplicate_id in fan_out.get(parsed['custom_id'], ()):
+                    count += 1
+                    yield {**parsed, 'custom_id': duplicate_id}
+        
+        logger.info(f"Parsed {count} results")
+    
+    def parse_results(self, results_file: str) -> List[Dict[str, Any]]:
+        """
+        Parse batch results file into structured data.
+        
+        Args:
+            results_file: Path to results .jsonl file
         
-        logger.info(f"Parsed {len(results)} results")
-        return results
+        Returns:
+            List of parsed results
+        """
+        return list(self.iter_results(results_file))
     
     def cancel_batch(self, batch_id: str) -> Dict[str, Any]:
         """
@@ -438,9 +748,12 @@ def process_jobs_batch(
     """
     agent = BatchProcessorAgent()
     
-    # Step 1: Create input file
+    # Step 1: Create input file while the upload connection is being set up
     logger.info(f"Creating batch for {len(job_postings)} jobs (task: {task_type})")
-    input_file = agent.create_batch_input_file(job_postings, task_type, model)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        warm_up = pool.submit(agent.warm_up)
+        input_file = agent.create_batch_input_file(job_postings, task_type, model)
+        warm_up.result()
     
     # Step 2: Upload
     file_id = agent.upload_batch_file(input_file)
@@ -2,48 +2,612 @@
 Client Agent for AI/LLM interactions.
 Wraps OpenAI GPT API for reasoning tasks like parsing, analysis, and scoring.
 """
+import asyncio
+import functools
+import hashlib
 import json
-from typing import List, Dict, Any, Optional
-from openai import OpenAI
-from tenacity import retry, stop_after_attempt, wait_exponential
+import random
+import re
+import sqlite3
+import threading
+import time
+from array import array
+from collections import Counter, OrderedDict, deque
+from itertools import islice
+from types import MappingProxyType
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
+import openai
+from openai import AsyncOpenAI, OpenAI
 import tiktoken
+from pydantic import ValidationError
 
 from config import Config
 from utils import get_logger
-from models import JobAnalysis
+from models import CompanyData, JobAnalysis
 
 logger = get_logger(__name__)
 
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+try:
+    import httpx
+except ImportError:  # openai falls back to its own default HTTP client
+    httpx = None
+
+try:
+    import numpy as np
+except ImportError:  # embeddings fall back to array('f'); get_embedding_matrix needs numpy
+    np = None
+
+try:
+    import h2  # noqa: F401  (enables httpx HTTP/2 support)
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+if httpx is not None:
+    _HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+    _HTTP_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode read-only mappings (the shared system messages) as objects."""
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps_bytes(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default)
+    return json.dumps(obj, default=_json_default).encode('utf-8')
+
+
+def _loads(data: Union[str, bytes]) -> Any:
+    """Deserialize JSON text or bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Transient failures worth retrying (429, 5xx, timeouts, dropped connections);
+# other 4xx errors fail fast
+_RETRYABLE_ERRORS = (openai.RateLimitError, openai.InternalServerError, openai.APIConnectionError)
+_MAX_ATTEMPTS = 3
+
+_EMBEDDING_MODEL = "text-embedding-ada-002"
+
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential backoff with jitter, capped at 10 seconds."""
+    return min(10.0, 2 ** (attempt + 1) + random.random())
+
+
+@functools.lru_cache(maxsize=1)
+def _get_http_client() -> Optional["httpx.Client"]:
+    """Keep-alive connection pool shared by every ClientAgent's sync client."""
+    if httpx is None:
+        return None
+    return httpx.Client(limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT, http2=_HTTP2)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_async_http_client() -> Optional["httpx.AsyncClient"]:
+    """Keep-alive connection pool shared by every ClientAgent's async client."""
+    if httpx is None:
+        return None
+    return httpx.AsyncClient(limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT, http2=_HTTP2)
+
+
+# All async API traffic runs on one long-lived background event loop. Pooled
+# connections belong to the loop that opened them, so a single loop means one
+# async client for the life of the process, and blocking wrappers work from
+# any thread, including ones that are already running an event loop.
+_async_loop: Optional[asyncio.AbstractEventLoop] = None
+_async_loop_lock = threading.Lock()
+
+
+def _get_async_loop() -> asyncio.AbstractEventLoop:
+    """Start the background event loop on first use."""
+    global _async_loop
+    with _async_loop_lock:
+        if _async_loop is None:
+            _async_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_async_loop.run_forever,
+                name="client-agent-loop",
+                daemon=True
+            ).start()
+    return _async_loop
+
+
+def _in_async_loop() -> bool:
+    """True when called from a coroutine running on the background loop."""
+    try:
+        return asyncio.get_running_loop() is _async_loop
+    except RuntimeError:
+        return False
+
+
+def _run_sync(coro):
+    """Run a coroutine on the background loop and block until it finishes."""
+    if _in_async_loop():
+        coro.close()
+        raise RuntimeError("Blocking agent call made from the shared event loop; await the async method")
+    return asyncio.run_coroutine_threadsafe(coro, _get_async_loop()).result()
+
+
+async def _await_in_async_loop(coro):
+    """Await a coroutine on the background loop from whichever loop is running."""
+    if _in_async_loop():
+        return await coro
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, _get_async_loop()))
+
+
+_CRITERIA_CACHE_SIZE = 16
+_criteria_cache: Dict[Any, Tuple[str, str]] = {}
+
+
+def _freeze(value: Any) -> Any:
+    """Hashable, type-exact stand-in for a criteria value (lists and dicts become tuples)."""
+    if isinstance(value, dict):
+        return ("dict",) + tuple((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__,) + tuple(_freeze(v) for v in value)
+    if isinstance(value, set):
+        return frozenset(_freeze(v) for v in value)
+    # Tag scalars with their type so 1, 1.0 and True stay distinct
+    return (type(value), value)
+
+
+def _criteria_parts(criteria: Optional[Dict[str, Any]]) -> Tuple[str, str]:
+    """
+    Return (criteria_text, fingerprint) for prompts and result-cache keys.
+
+    A scoring run reuses the same criteria for every posting, so both are
+    built once per distinct criteria rather than once per job.
+    """
+    if not criteria:
+        return "", json.dumps(criteria)
+
+    try:
+        key = _freeze(criteria)
+        parts = _criteria_cache.get(key)
+    except TypeError:  # unhashable leaf value; build without memoizing
+        key, parts = None, None
+
+    if parts is None:
+        text = "\n".join([f"- {k}: {v}" for k, v in criteria.items()])
+        try:
+            fingerprint = json.dumps(criteria, sort_keys=True, default=str)
+        except TypeError:  # mixed or non-string keys json can't sort; keep insertion order
+            fingerprint = repr(_freeze(criteria))
+        parts = (text, fingerprint)
+        if key is not None:
+            if len(_criteria_cache) >= _CRITERIA_CACHE_SIZE:
+                _criteria_cache.clear()
+            _criteria_cache[key] = parts
+    return parts
+
+
+@functools.lru_cache(maxsize=4)
+def _get_encoding(model: str = "gpt-4") -> tiktoken.Encoding:
+    """Load a tiktoken encoding once and share it across all agents."""
+    return tiktoken.encoding_for_model(model)
+
+
+# Prompt templates and read-only system messages shared by every call
+_SYS_PAIN_POINTS = MappingProxyType({"role": "system", "content": "You are an expert at analyzing job descriptions and identifying business pain points."})
+_TPL_PAIN_POINTS = """Analyze the following job description and identify the key pain points,
+problems, or challenges the company is trying to solve by hiring for this role.
+
+Focus on:
+- Business problems mentioned
+- Technical challenges
+- Growth or scaling issues
+- Team gaps or needs
+
+Job Description:
+{job_description}
+
+List each pain point as a short phrase, e.g. "Need to scale infrastructure".
+"""
+
+_SYS_SKILLS = MappingProxyType({"role": "system", "content": "You are an expert at parsing job requirements and extracting skills."})
+_TPL_SKILLS = """Analyze this job description and extract skills into two categories:
+1. Required skills (must-haves, requirements)
+2. Nice-to-have skills (preferred, bonus, nice-to-haves)
+
+Job Description:
+{job_description}
+"""
+
+_SYS_WORK_ARRANGEMENT = MappingProxyType({"role": "system", "content": "You are an expert at analyzing job requirements."})
+_TPL_WORK_ARRANGEMENT = """Based on this job description, determine the work arrangement.
+
+Job Description:
+{job_description}
+
+Respond with ONLY one word: "remote", "hybrid", or "onsite"
+"""
+
+_SYS_RELEVANCE = MappingProxyType({"role": "system", "content": "You are an expert at evaluating job match quality."})
+_TPL_RELEVANCE = """Score this job posting's relevance based on the following criteria.
+Return a score from 0.0 to 1.0, where 1.0 is a perfect match.
+
+Criteria:
+{criteria_text}
+
+Job Description:
+{job_description}
+"""
+
+_SYS_SUMMARY = MappingProxyType({"role": "system", "content": "You are an expert at summarizing job descriptions."})
+_TPL_SUMMARY = """Create a concise summary of this job posting in {max_length} characters or less.
+Focus on the role, key responsibilities, and main requirements.
+
+Job Description:
+{job_description}
+"""
+
+_SYS_COMPANY_EXTRACT = MappingProxyType({
+    "role": "system",
+    "content": "You are an expert at analyzing job postings to identify companies that need workforce analytics and forecasting software."
+})
+_TPL_COMPANY_EXTRACT = """Analyze this job posting and extract company information:
+
+Job Title: {job_title}
+
+Job Description:
+{job_description}
+
+Extract all relevant company details and assess if they're a good fit for workforce forecasting software (Forecasta)."""
+
+_SYS_FUSED = MappingProxyType({
+    "role": "system",
+    "content": "You are an expert at analyzing job descriptions, extracting skills, "
+               "identifying business pain points, and evaluating job match quality."
+})
+
+def _strict_schema(name: str, properties: Dict[str, Any]) -> Dict[str, Any]:
+    """Structured-output response_format requiring exactly the given properties."""
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": name,
+            "strict": True,
+            "schema": {
+                "type": "object",
+                "properties": properties,
+                "required": list(properties),
+                "additionalProperties": False
+            }
+        }
+    }
+
+
+_STRING_LIST = {"type": "array", "items": {"type": "string"}}
+_PAIN_POINTS_FORMAT = _strict_schema("pain_points", {"pain_points": _STRING_LIST})
+_SKILLS_FORMAT = _strict_schema("skills", {"required": _STRING_LIST, "nice_to_have": _STRING_LIST})
+_RELEVANCE_FORMAT = _strict_schema("relevance", {"score": {"type": "number"}})
+
+# Explicit work-arrangement phrases; unambiguous postings skip the API call
+_WORK_RE = re.compile(
+    r"\b(100% remote|fully remote|work from home|wfh|remote[- ]first|hybrid|on[- ]?site|in[- ]?office)\b",
+    re.IGNORECASE
+)
+_WORK_LABELS = {"hybrid": "hybrid", "onsite": "onsite", "on-site": "onsite", "on site": "onsite",
+                "in-office": "onsite", "in office": "onsite", "inoffice": "onsite"}
+
+# Function-calling schema for extract_company_info_structured, built once
+_EXTRACT_COMPANY_TOOLS = ({
+    "type": "function",
+    "function": {
+        "name": "extract_company_data",
+        "description": "Extract structured company information from a job posting",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "company_name": {
+                    "type": "string",
+                    "description": "Name of the hiring company"
+                },
+                "company_size": {
+                    "type": "string",
+                    "enum": ["1-10", "11-50", "51-200", "201-500", "501-1000", "1001-5000", "5000+", "unknown"],
+                    "description": "Estimated company size"
+                },
+                "industry": {
+                    "type": "string",
+                    "description": "Primary industry or sector"
+                },
+                "hiring_volume_signals": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Signals indicating high-volume hiring (e.g., 'multiple positions', 'hiring event')"
+                },
+                "pain_points": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Workforce challenges or pain points mentioned"
+                },
+                "growth_indicators": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Signs of company growth (expansion, new locations, etc.)"
+                },
+                "forecasta_fit_score": {
+                    "type": "integer",
+                    "description": "Score 0-10 indicating likelihood company needs workforce forecasting software",
+                    "minimum": 0,
+                    "maximum": 10
+                },
+                "forecasta_fit_reasoning": {
+                    "type": "string",
+                    "description": "Brief explanation of the fit score"
+                }
+            },
+            "required": ["company_name", "industry", "forecasta_fit_score", "forecasta_fit_reasoning"]
+        }
+    }
+},)
+_EXTRACT_COMPANY_TOOL_CHOICE = {"type": "function", "function": {"name": "extract_company_data"}}
+
+# Token budget for the job description in structured company extraction
+_COMPANY_EXTRACT_TOKEN_BUDGET = 800
+
+
+# In-memory LRU of raw model responses keyed by (model, task, content hash, ...),
+# shared by all agents so re-scraped postings with unchanged text cost nothing.
+_RESULT_CACHE_SIZE = 4096
+_result_cache: "OrderedDict[Tuple[Any, ...], str]" = OrderedDict()
+_result_cache_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_disk_cache():
+    """Optional persistent second level, enabled by LLM_CACHE_DIR and diskcache."""
+    if diskcache is None or not Config.LLM_CACHE_DIR:
+        return None
+    return diskcache.Cache(Config.LLM_CACHE_DIR)
+
+
+def _cache_get(key: Tuple[Any, ...]) -> Optional[str]:
+    with _result_cache_lock:
+        response = _result_cache.get(key)
+        if response is not None:
+            _result_cache.move_to_end(key)
+            return response
+
+    disk = _get_disk_cache()
+    if disk is None:
+        return None
+    response = disk.get(key)
+    if response is not None:
+        _cache_put(key, response, persist=False)
+    return response
+
+
+def _cache_put(key: Tuple[Any, ...], response: str, persist: bool = True):
+    with _result_cache_lock:
+        _result_cache[key] = response
+        _result_cache.move_to_end(key)
+        if len(_result_cache) > _RESULT_CACHE_SIZE:
+            _result_cache.popitem(last=False)
+
+    disk = _get_disk_cache() if persist else None
+    if disk is not None:
+        disk.set(key, response)
+
+
+# Embedding cache: float32 vectors in an in-memory LRU, optionally persisted
+# to SQLite (Config.EMBEDDING_CACHE_DB), keyed by "<model>:<content hash>"
+_EMBEDDING_CACHE_SIZE = 4096
+_embedding_cache: "OrderedDict[str, Any]" = OrderedDict()
+_embedding_cache_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_embedding_db() -> Optional[sqlite3.Connection]:
+    """Open the persistent embedding cache, if configured."""
+    if not Config.EMBEDDING_CACHE_DB:
+        return None
+    db = sqlite3.connect(Config.EMBEDDING_CACHE_DB, check_same_thread=False)
+    db.execute("CREATE TABLE IF NOT EXISTS embedding_cache (key TEXT PRIMARY KEY, vec BLOB)")
+    db.commit()
+    return db
+
+
+def _to_vector(values: Any) -> Any:
+    """float32 vector: a numpy array, or array('f') when numpy is not installed."""
+    if np is not None:
+        return np.asarray(values, dtype=np.float32)
+    return array('f', values)
+
+
+def _vector_from_bytes(blob: bytes) -> Any:
+    """Inverse of vector.tobytes() for either vector type."""
+    if np is not None:
+        return np.frombuffer(blob, dtype=np.float32)
+    vec = array('f')
+    vec.frombytes(blob)
+    return vec
+
+
+def _embedding_key(text: str, model: str) -> str:
+    return f"{model}:{hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()}"
+
+
+def _embedding_cache_get_many(keys: List[str]) -> Dict[str, Any]:
+    """Look keys up in memory, then in SQLite; SQLite hits are promoted to memory."""
+    found: Dict[str, Any] = {}
+    with _embedding_cache_lock:
+        for key in keys:
+            vec = _embedding_cache.get(key)
+            if vec is not None:
+                _embedding_cache.move_to_end(key)
+                found[key] = vec
+
+        db = _get_embedding_db()
+        missing = [key for key in keys if key not in found]
+        if db is not None and missing:
+            # Stay well under SQLite's bound-parameter limit
+            for i in range(0, len(missing), 500):
+                batch = missing[i:i + 500]
+                rows = db.execute(
+                    f"SELECT key, vec FROM embedding_cache WHERE key IN ({','.join('?' * len(batch))})",
+                    batch
+                ).fetchall()
+                for key, blob in rows:
+                    vec = _vector_from_bytes(blob)
+                    found[key] = vec
+                    _embedding_cache[key] = vec
+            while len(_embedding_cache) > _EMBEDDING_CACHE_SIZE:
+                _embedding_cache.popitem(last=False)
+    return found
+
+
+def _embedding_cache_put_many(items: Dict[str, Any]):
+    with _embedding_cache_lock:
+        for key, vec in items.items():
+            _embedding_cache[key] = vec
+            _embedding_cache.move_to_end(key)
+        while len(_embedding_cache) > _EMBEDDING_CACHE_SIZE:
+            _embedding_cache.popitem(last=False)
+
+        db = _get_embedding_db()
+        if db is not None:
+            db.executemany(
+                "INSERT OR REPLACE INTO embedding_cache (key, vec) VALUES (?, ?)",
+                [(key, vec.tobytes()) for key, vec in items.items()]
+            )
+            db.commit()
+
+
+def _parse_company_data(arguments: Union[str, bytes]) -> Dict[str, Any]:
+    """
+    Decode extract_company_data arguments, keeping only the keys the model returned.
+
+    Arguments that match CompanyData are parsed and validated in one pass
+    (pydantic-core). Replies that drift from the schema, such as a float
+    fit score, are returned as decoded rather than rejected, as long as they
+    are a JSON object; anything else raises ValueError.
+    """
+    try:
+        return CompanyData.model_validate_json(arguments).model_dump(exclude_unset=True)
+    except ValidationError:
+        data = _loads(arguments)
+    if not isinstance(data, dict):
+        raise ValueError(f"extract_company_data arguments are not an object: {type(data).__name__}")
+    return data
+
+
+_shared_agents: Dict[Optional[str], "ClientAgent"] = {}
+_shared_agents_lock = threading.Lock()
+
+
 class ClientAgent:
     """Agent for interacting with OpenAI GPT API with conversation state management."""
 
-    def __init__(self, model: Optional[str] = None, conversation_id: Optional[str] = None):
+    # Maximum in-flight requests per agent on the async path
+    ASYNC_CONCURRENCY = 8
+
+    def __init__(
+        self,
+        model: Optional[str] = None,
+        conversation_id: Optional[str] = None,
+        use_cache: bool = True
+    ):
         """
         Initialize the Client Agent.
 
         Args:
             model: OpenAI model to use (defaults to Config.OPENAI_MODEL)
             conversation_id: Optional conversation ID for persistent state
+            use_cache: Reuse extraction results for previously seen job descriptions
         """
         self.model = model or Config.OPENAI_MODEL
-        self.client = OpenAI(api_key=Config.OPENAI_API_KEY)
-        self.encoding = tiktoken.encoding_for_model("gpt-4")
+        self.use_cache = use_cache
+        self.client = OpenAI(api_key=Config.OPENAI_API_KEY, http_client=_get_http_client())
+        self._aclient: Optional[AsyncOpenAI] = None
+        self._semaphore = asyncio.Semaphore(self.ASYNC_CONCURRENCY)
+        self.encoding = _get_encoding()
         
         # Conversation state management
         self.conversation_id = conversation_id
         self.previous_response_id: Optional[str] = None
-        self.conversation_history: List[Dict[str, str]] = []
+        # Rolling window of recent turns; system prompts are kept separately so
+        # they are never evicted
+        self.conversation_history: Deque[Dict[str, str]] = deque(maxlen=Config.MAX_HISTORY or None)
+        self._system_messages: List[Dict[str, str]] = []
         self.total_tokens_used = 0
+        self._usage_lock = threading.Lock()
 
         logger.info(f"ClientAgent initialized with model: {self.model}")
         if conversation_id:
             logger.info(f"Using conversation: {conversation_id}")
 
+    @classmethod
+    def get_shared(cls, model: Optional[str] = None) -> "ClientAgent":
+        """
+        Get the process-wide agent for a model, creating it on first use.
+
+        Reusing one agent keeps its OpenAI clients and connection pools warm.
+        Use it for stateless extraction; conversational work that relies on
+        conversation_history or response chaining should create its own agent.
+        Untracked calls neither record nor forward previous_response_id, and
+        total_tokens_used counts every caller's usage.
+
+        Args:
+            model: OpenAI model to use (defaults to Config.OPENAI_MODEL)
+
+        Returns:
+            Shared ClientAgent instance
+        """
+        model = model or Config.OPENAI_MODEL
+        agent = _shared_agents.get(model)
+        if agent is None:
+            with _shared_agents_lock:
+                agent = _shared_agents.get(model)
+                if agent is None:
+                    agent = _shared_agents[model] = cls(model=model)
+        return agent
+
     def count_tokens(self, text: str) -> int:
         """Count the number of tokens in a text."""
         return len(self.encoding.encode(text))
     
+    def truncate_to_tokens(self, text: str, max_tokens: int) -> str:
+        """
+        Truncate text to at most max_tokens tokens.
+
+        Args:
+            text: Text to truncate
+            max_tokens: Token budget
+
+        Returns:
+            The text itself if it fits, otherwise its first max_tokens tokens
+        """
+        # Every token covers at least one character, so short text always fits
+        if len(text) <= max_tokens:
+            return text
+
+        # Tokens average ~4 characters; only tokenize a generous prefix
+        tokens = self.encoding.encode(text[:max_tokens * 8])
+        if len(tokens) <= max_tokens and len(text) <= max_tokens * 8:
+            return text
+        return self.encoding.decode(tokens[:max_tokens])
+
     def create_conversation(self) -> str:
         """
         Create a new conversation for persistent state management.
@@ -65,13 +629,14 @@ class ClientAgent:
         Get the current conversation history.
         
         Returns:
-            List of message dictionaries
+            List of message dictionaries, system messages first
         """
-        return self.conversation_history.copy()
+        return self._system_messages + list(self.conversation_history)
     
     def clear_conversation_history(self):
         """Clear the conversation history and reset state."""
-        self.conversation_history = []
+        self.conversation_history.clear()
+        self._system_messages.clear()
         self.previous_response_id = None
         self.total_tokens_used = 0
         logger.info("Conversation history cleared")
@@ -87,7 +652,9 @@ class ClientAgent:
         Returns:
             Dictionary with usage statistics
         """
-        total_tokens = sum(self.count_tokens(msg.get('content', '')) for msg in messages)
+        # One batched call tokenizes in parallel on the Rust side
+        contents = [msg.get('content') or '' for msg in messages]
+        total_tokens = sum(map(len, self.encoding.encode_batch(contents)))
         usage_percent = (total_tokens / max_context) * 100
         tokens_remaining = max_context - total_tokens
         
@@ -103,7 +670,8 @@ class ClientAgent:
     def truncate_conversation_history(self, keep_recent: int = 10) -> List[Dict[str, str]]:
         """
         Truncate conversation history to prevent context window overflow.
-        Keeps system message and most recent N messages.
+        Keeps system messages, a summary of the dropped messages, and the
+        most recent N messages.
         
         Args:
             keep_recent: Number of recent messages to keep
@@ -111,38 +679,168 @@ class ClientAgent:
         Returns:
             Truncated conversation history
         """
-        if len(self.conversation_history) <= keep_recent + 1:
-            return self.conversation_history
+        history_length = len(self.conversation_history)
+        if history_length <= keep_recent:
+            return self.get_conversation_history()
         
-        # Keep system message (if exists) and recent messages
-        system_messages = [msg for msg in self.conversation_history if msg.get('role') == 'system']
-        recent_messages = self.conversation_history[-keep_recent:]
+        # System messages are stored apart from the rolling window
+        dropped_count = history_length - keep_recent
+        dropped = list(islice(self.conversation_history, dropped_count))
+        recent_messages = list(islice(self.conversation_history, dropped_count, None))
+        summary = {"role": "system", "content": self._summarize_dropped_messages(dropped)}
         
-        truncated = system_messages + recent_messages
-        logger.info(f"Truncated conversation history from {len(self.conversation_history)} to {len(truncated)} messages")
+        truncated = self._system_messages + [summary] + recent_messages
+        logger.info(f"Truncated conversation history from {len(self._system_messages) + history_length} to {len(truncated)} messages")
         
         return truncated
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        reraise=True
-    )
+    @staticmethod
+    def _summarize_dropped_messages(dropped: List[Dict[str, Any]], max_topics: int = 5) -> str:
+        """
+        Describe truncated messages deterministically, without an extra API call.
+
+        Args:
+            dropped: Messages removed from the context
+            max_topics: Maximum topics listed per role
+
+        Returns:
+            One-line summary of the dropped messages
+        """
+        role_counts: Dict[str, int] = {}
+        user_topics: List[str] = []
+        assistant_topics: List[str] = []
+        tools: List[str] = []
+
+        for msg in dropped:
+            role = msg.get('role', 'unknown')
+            role_counts[role] = role_counts.get(role, 0) + 1
+
+            content = (msg.get('content') or '').strip()
+            if content:
+                topic = content.split('\n', 1)[0][:60]
+                topics = user_topics if role == 'user' else assistant_topics if role == 'assistant' else None
+                if topics is not None and len(topics) < max_topics and topic not in topics:
+                    topics.append(topic)
+
+            for call in msg.get('tool_calls') or []:
+                name = call.get('function', {}).get('name') if isinstance(call, dict) else None
+                if name and name not in tools:
+                    tools.append(name)
+            if role == 'tool' and msg.get('name') and msg['name'] not in tools:
+                tools.append(msg['name'])
+
+        roles = ", ".join(f"{count} {role}" for role, count in role_counts.items())
+        return (
+            f"[Summary of earlier conversation: {len(dropped)} msgs ({roles}); "
+            f"user asked about {'; '.join(user_topics) or 'nothing'}; "
+            f"assistant covered {'; '.join(assistant_topics) or 'nothing'}; "
+            f"tools used: {', '.join(tools) or 'none'}]"
+        )
+
+    def _build_request(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        response_format: Optional[Dict[str, Any]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[str] = None,
+        store: bool = False,
+        use_conversation: bool = False,
+        previous_response_id: Optional[str] = None,
+        track_history: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Build chat completion kwargs shared by _call_api and _acall_api.
+
+        The agent's own previous_response_id is only chained onto tracked
+        (multi-turn) calls; one-shot extractors on a shared agent never pick
+        up another caller's conversation.
+        """
+        kwargs = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+
+        if response_format:
+            kwargs["response_format"] = response_format
+            
+        if tools:
+            kwargs["tools"] = tools
+            
+        if tool_choice:
+            kwargs["tool_choice"] = tool_choice
+        
+        # Conversation state management
+        if store:
+            kwargs["store"] = True
+        
+        if use_conversation and self.conversation_id:
+            kwargs["conversation"] = self.conversation_id
+        
+        chain_id = previous_response_id or (self.previous_response_id if track_history else None)
+        if chain_id:
+            kwargs["previous_response_id"] = chain_id
+
+        return kwargs
+
+    def _record_response(
+        self,
+        messages: List[Dict[str, str]],
+        response: Any,
+        track_history: bool = False
+    ) -> str:
+        """Update response chaining and history (if tracked) and token usage; return the content."""
+        content = response.choices[0].message.content
+        
+        # Update response chaining and conversation history (multi-turn callers only)
+        if track_history:
+            self.previous_response_id = response.id
+            for message in messages:
+                if message.get('role') == 'system':
+                    if message not in self._system_messages:
+                        self._system_messages.append(message)
+                else:
+                    self.conversation_history.append(message)
+            if content:
+                self.conversation_history.append({"role": "assistant", "content": content})
+        
+        # Track token usage (usage is optional on ChatCompletion)
+        usage = response.usage
+        if usage is not None:
+            tokens_used = usage.total_tokens
+            total = self._add_tokens(tokens_used)
+            logger.debug(f"API call successful. Tokens used: {tokens_used} (Total: {total})")
+
+        return content
+
+    def _add_tokens(self, tokens: int) -> int:
+        """Add to total_tokens_used under a lock (the agent may be shared by threads); return the new total."""
+        with self._usage_lock:
+            self.total_tokens_used += tokens
+            return self.total_tokens_used
+
     def _call_api(
         self,
         messages: List[Dict[str, str]],
         temperature: float = 0.7,
         max_tokens: int = 2000,
-        response_format: Optional[Dict[str, str]] = None,
+        response_format: Optional[Dict[str, Any]] = None,
         tools: Optional[List[Dict[str, Any]]] = None,
         tool_choice: Optional[str] = None,
         store: bool = False,
         use_conversation: bool = False,
-        previous_response_id: Optional[str] = None
+        previous_response_id: Optional[str] = None,
+        track_history: bool = False
     ) -> str:
         """
         Make a call to the OpenAI API with retry logic and conversation state management.
 
+        Rate limits, server errors and timeouts are retried up to three times
+        with backoff; other errors are raised immediately.
+
         Args:
             messages: List of message dictionaries
             temperature: Sampling temperature (0-2)
@@ -153,60 +851,165 @@ class ClientAgent:
             store: Store response for 30 days (default False for privacy)
             use_conversation: Use conversation_id for persistent state
             previous_response_id: Chain to previous response for context
+            track_history: Append the exchange to conversation_history (for
+                multi-turn conversations; one-shot extractors leave it off)
 
         Returns:
             API response content
         """
-        try:
-            kwargs = {
-                "model": self.model,
-                "messages": messages,
-                "temperature": temperature,
-                "max_tokens": max_tokens,
-            }
+        kwargs = self._build_request(
+            messages, temperature, max_tokens, response_format, tools,
+            tool_choice, store, use_conversation, previous_response_id, track_history
+        )
 
-            if response_format:
-                kwargs["response_format"] = response_format
-                
-            if tools:
-                kwargs["tools"] = tools
-                
-            if tool_choice:
-                kwargs["tool_choice"] = tool_choice
-            
-            # Conversation state management
-            if store:
-                kwargs["store"] = True
-            
-            if use_conversation and self.conversation_id:
-                kwargs["conversation"] = self.conversation_id
-            
-            if previous_response_id or self.previous_response_id:
-                kwargs["previous_response_id"] = previous_response_id or self.previous_response_id
+        for attempt in range(_MAX_ATTEMPTS):
+            try:
+                response = self.client.chat.completions.create(**kwargs)
+                return self._record_response(messages, response, track_history)
+
+            except _RETRYABLE_ERRORS as e:
+                if attempt == _MAX_ATTEMPTS - 1:
+                    logger.error(f"API call failed: {e}")
+                    raise
+                delay = _retry_delay(attempt)
+                logger.warning(f"API call failed ({e}); retrying in {delay:.1f}s")
+                time.sleep(delay)
+
+            except Exception as e:
+                logger.error(f"API call failed: {e}")
+                raise
+
+    def _get_aclient(self) -> AsyncOpenAI:
+        """Async client over the shared pool, created on first use (background loop only)."""
+        if self._aclient is None:
+            self._aclient = AsyncOpenAI(api_key=Config.OPENAI_API_KEY, http_client=_get_async_http_client())
+        return self._aclient
+
+    async def _acall_api(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        response_format: Optional[Dict[str, Any]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[str] = None,
+        store: bool = False,
+        use_conversation: bool = False,
+        previous_response_id: Optional[str] = None,
+        track_history: bool = False
+    ) -> str:
+        """
+        Async counterpart of _call_api, bounded by ASYNC_CONCURRENCY in-flight calls.
 
-            response = self.client.chat.completions.create(**kwargs)
-            content = response.choices[0].message.content
-            
-            # Track response ID for chaining
-            if hasattr(response, 'id'):
-                self.previous_response_id = response.id
-            
-            # Update conversation history
-            self.conversation_history.extend(messages)
-            if content:
-                self.conversation_history.append({"role": "assistant", "content": content})
-            
-            # Track token usage
-            if hasattr(response, 'usage'):
-                tokens_used = response.usage.total_tokens
-                self.total_tokens_used += tokens_used
-                logger.debug(f"API call successful. Tokens used: {tokens_used} (Total: {self.total_tokens_used})")
+        Can be awaited from any event loop; the request itself is sent from
+        the background loop that owns the async client.
+        """
+        kwargs = self._build_request(
+            messages, temperature, max_tokens, response_format, tools,
+            tool_choice, store, use_conversation, previous_response_id, track_history
+        )
+        return await _await_in_async_loop(self._acreate(messages, kwargs, track_history))
 
-            return content
+    async def _acreate(
+        self,
+        messages: List[Dict[str, str]],
+        kwargs: Dict[str, Any],
+        track_history: bool
+    ) -> str:
+        """Send one chat completion from the background loop, retrying transient failures."""
+        aclient = self._get_aclient()
+
+        for attempt in range(_MAX_ATTEMPTS):
+            try:
+                async with self._semaphore:
+                    response = await aclient.chat.completions.create(**kwargs)
+                return self._record_response(messages, response, track_history)
+
+            except _RETRYABLE_ERRORS as e:
+                if attempt == _MAX_ATTEMPTS - 1:
+                    logger.error(f"API call failed: {e}")
+                    raise
+                delay = _retry_delay(attempt)
+                logger.warning(f"API call failed ({e}); retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+            except Exception as e:
+                logger.error(f"API call failed: {e}")
+                raise
+
+    def _result_key(self, task: str, text: str, *extra: Any) -> Tuple[Any, ...]:
+        """Cache key for a task on a text; includes the model so switching models invalidates."""
+        digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+        return (self.model, task, digest) + extra
+
+    def _call_api_cached(
+        self,
+        key: Tuple[Any, ...],
+        messages: List[Dict[str, str]],
+        parse: Callable[[str], Any],
+        **kwargs: Any
+    ) -> Any:
+        """
+        Call the API unless a response for key is cached, and parse the result.
 
-        except Exception as e:
-            logger.error(f"API call failed: {e}")
-            raise
+        Responses are only cached once parse succeeds, so a malformed reply is
+        retried on the next call instead of being served forever.
+        """
+        response = _cache_get(key) if self.use_cache else None
+        if response is not None:
+            try:
+                result = parse(response)
+                logger.debug(f"Result cache hit: {key[1]}")
+                return result
+            except Exception:
+                # Entry from an older response format; fetch a fresh one
+                logger.debug(f"Discarding unreadable cache entry: {key[1]}")
+
+        response = self._call_api(messages, **kwargs)
+        result = parse(response)
+        if self.use_cache:
+            _cache_put(key, response)
+        return result
+
+    async def _acall_api_cached(
+        self,
+        key: Tuple[Any, ...],
+        messages: List[Dict[str, str]],
+        parse: Callable[[str], Any],
+        **kwargs: Any
+    ) -> Any:
+        """Async counterpart of _call_api_cached."""
+        response = _cache_get(key) if self.use_cache else None
+        if response is not None:
+            try:
+                result = parse(response)
+                logger.debug(f"Result cache hit: {key[1]}")
+                return result
+            except Exception:
+                # Entry from an older response format; fetch a fresh one
+                logger.debug(f"Discarding unreadable cache entry: {key[1]}")
+
+        response = await self._acall_api(messages, **kwargs)
+        result = parse(response)
+        if self.use_cache:
+            _cache_put(key, response)
+        return result
+
+    @staticmethod
+    def clear_result_cache():
+        """Drop all cached extraction results held in memory."""
+        with _result_cache_lock:
+            _result_cache.clear()
+
+    def _pain_points_messages(self, job_description: str) -> List[Dict[str, str]]:
+        """Build messages for pain point extraction."""
+        return [_SYS_PAIN_POINTS, {"role": "user", "content": _TPL_PAIN_POINTS.format(job_description=job_description)}]
+
+    def _parse_pain_points(self, response: str) -> List[str]:
+        """Parse a pain point extraction response (shape enforced by _PAIN_POINTS_FORMAT)."""
+        pain_points = _loads(response)["pain_points"]
+        logger.info(f"Extracted {len(pain_points)} pain points")
+        return pain_points
 
     def extract_pain_points(self, job_description: str) -> List[str]:
         """
@@ -220,60 +1023,51 @@ class ClientAgent:
         """
         logger.info("Extracting pain points from job description")
 
-        prompt = f"""
-        Analyze the following job description and identify the key pain points,
-        problems, or challenges the company is trying to solve by hiring for this role.
-
-        Focus on:
-        - Business problems mentioned
-        - Technical challenges
-        - Growth or scaling issues
-        - Team gaps or needs
-
-        Job Description:
-        {job_description}
-
-        Return ONLY a JSON array of pain points as strings. Example:
-        ["Need to scale infrastructure", "Legacy codebase modernization"]
-        """
-
-        messages = [
-            {
-                "role": "system",
-                "content": "You are an expert at analyzing job descriptions and identifying business pain points."
-            },
-            {"role": "user", "content": prompt}
-        ]
-
         try:
-            response = self._call_api(
-                messages,
+            return self._call_api_cached(
+                self._result_key("pain_points", job_description),
+                self._pain_points_messages(job_description),
+                self._parse_pain_points,
                 temperature=0.3,
                 max_tokens=500,
-                response_format={"type": "json_object"}
+                response_format=_PAIN_POINTS_FORMAT
             )
 
-            # Parse JSON response
-            data = json.loads(response)
-
-            # Handle different possible JSON structures
-            if isinstance(data, list):
-                pain_points = data
-            elif "pain_points" in data:
-                pain_points = data["pain_points"]
-            elif "painPoints" in data:
-                pain_points = data["painPoints"]
-            else:
-                # Try to extract from first key
-                pain_points = list(data.values())[0] if data else []
+        except Exception as e:
+            logger.error(f"Failed to extract pain points: {e}")
+            return []
 
-            logger.info(f"Extracted {len(pain_points)} pain points")
-            return pain_points
+    async def _extract_pain_points_a(self, job_description: str) -> List[str]:
+        """Async counterpart of extract_pain_points."""
+        try:
+            return await self._acall_api_cached(
+                self._result_key("pain_points", job_description),
+                self._pain_points_messages(job_description),
+                self._parse_pain_points,
+                temperature=0.3,
+                max_tokens=500,
+                response_format=_PAIN_POINTS_FORMAT
+            )
 
         except Exception as e:
             logger.error(f"Failed to extract pain points: {e}")
             return []
 
+    def _skills_messages(self, job_description: str) -> List[Dict[str, str]]:
+        """Build messages for skill extraction."""
+        return [_SYS_SKILLS, {"role": "user", "content": _TPL_SKILLS.format(job_description=job_description)}]
+
+    def _parse_skills(self, response: str) -> Dict[str, List[str]]:
+        """Parse a skill extraction response (shape enforced by _SKILLS_FORMAT)."""
+        skills = _loads(response)
+
+        logger.info(
+            f"Extracted {len(skills['required'])} required skills, "
+            f"{len(skills['nice_to_have'])} nice-to-have skills"
+        )
+
+        return skills
+
     def extract_skills(
         self,
         job_description: str
@@ -289,56 +1083,64 @@ class ClientAgent:
         """
         logger.info("Extracting skills from job description")
 
-        prompt = f"""
-        Analyze this job description and extract skills into two categories:
-        1. Required skills (must-haves, requirements)
-        2. Nice-to-have skills (preferred, bonus, nice-to-haves)
-
-        Job Description:
-        {job_description}
-
-        Return a JSON object with this structure:
-        {{
-            "required": ["skill1", "skill2"],
-            "nice_to_have": ["skill3", "skill4"]
-        }}
-        """
-
-        messages = [
-            {
-                "role": "system",
-                "content": "You are an expert at parsing job requirements and extracting skills."
-            },
-            {"role": "user", "content": prompt}
-        ]
-
         try:
-            response = self._call_api(
-                messages,
+            return self._call_api_cached(
+                self._result_key("skills", job_description),
+                self._skills_messages(job_description),
+                self._parse_skills,
                 temperature=0.2,
                 max_tokens=800,
-                response_format={"type": "json_object"}
+                response_format=_SKILLS_FORMAT
             )
 
-            skills = json.loads(response)
-
-            # Ensure expected keys exist
-            if "required" not in skills:
-                skills["required"] = []
-            if "nice_to_have" not in skills:
-                skills["nice_to_have"] = []
+        except Exception as e:
+            logger.error(f"Failed to extract skills: {e}")
+            return {"required": [], "nice_to_have": []}
 
-            logger.info(
-                f"Extracted {len(skills['required'])} required skills, "
-                f"{len(skills['nice_to_have'])} nice-to-have skills"
+    async def _extract_skills_a(self, job_description: str) -> Dict[str, List[str]]:
+        """Async counterpart of extract_skills."""
+        try:
+            return await self._acall_api_cached(
+                self._result_key("skills", job_description),
+                self._skills_messages(job_description),
+                self._parse_skills,
+                temperature=0.2,
+                max_tokens=800,
+                response_format=_SKILLS_FORMAT
             )
 
-            return skills
-
         except Exception as e:
             logger.error(f"Failed to extract skills: {e}")
             return {"required": [], "nice_to_have": []}
 
+    def _work_arrangement_messages(self, job_description: str) -> List[Dict[str, str]]:
+        """Build messages for work arrangement classification."""
+        return [_SYS_WORK_ARRANGEMENT, {"role": "user", "content": _TPL_WORK_ARRANGEMENT.format(job_description=job_description)}]
+
+    def _parse_work_arrangement(self, response: str) -> str:
+        """Parse a work arrangement response, defaulting to onsite."""
+        arrangement = response.strip().lower()
+
+        if arrangement not in ["remote", "hybrid", "onsite"]:
+            arrangement = "onsite"  # Default
+
+        logger.info(f"Work arrangement: {arrangement}")
+        return arrangement
+
+    @staticmethod
+    def _match_work_arrangement(job_description: str) -> Optional[str]:
+        """
+        Classify work arrangement from explicit phrases, or None if unclear.
+
+        Remote together with hybrid/onsite wording (e.g. "work from home after
+        training, onsite first") is left to the model.
+        """
+        labels = {_WORK_LABELS.get(m.lower(), "remote") for m in _WORK_RE.findall(job_description)}
+        if not labels or ("remote" in labels and len(labels) > 1):
+            return None
+        # Hybrid postings usually mention office days as well
+        return "hybrid" if "hybrid" in labels else labels.pop()
+
     def analyze_work_arrangement(self, job_description: str) -> str:
         """
         Determine work arrangement (remote, hybrid, onsite).
@@ -351,42 +1153,58 @@ class ClientAgent:
         """
         logger.info("Analyzing work arrangement")
 
-        prompt = f"""
-        Based on this job description, determine the work arrangement.
-
-        Job Description:
-        {job_description}
-
-        Respond with ONLY one word: "remote", "hybrid", or "onsite"
-        """
-
-        messages = [
-            {
-                "role": "system",
-                "content": "You are an expert at analyzing job requirements."
-            },
-            {"role": "user", "content": prompt}
-        ]
+        arrangement = self._match_work_arrangement(job_description)
+        if arrangement:
+            logger.info(f"Work arrangement: {arrangement} (matched locally)")
+            return arrangement
 
         try:
-            response = self._call_api(
-                messages,
+            return self._call_api_cached(
+                self._result_key("work_arrangement", job_description),
+                self._work_arrangement_messages(job_description),
+                self._parse_work_arrangement,
                 temperature=0.1,
                 max_tokens=10
             )
 
-            arrangement = response.strip().lower()
-
-            if arrangement not in ["remote", "hybrid", "onsite"]:
-                arrangement = "onsite"  # Default
+        except Exception as e:
+            logger.error(f"Failed to analyze work arrangement: {e}")
+            return "onsite"
 
-            logger.info(f"Work arrangement: {arrangement}")
+    async def _analyze_work_arrangement_a(self, job_description: str) -> str:
+        """Async counterpart of analyze_work_arrangement."""
+        arrangement = self._match_work_arrangement(job_description)
+        if arrangement:
             return arrangement
 
+        try:
+            return await self._acall_api_cached(
+                self._result_key("work_arrangement", job_description),
+                self._work_arrangement_messages(job_description),
+                self._parse_work_arrangement,
+                temperature=0.1,
+                max_tokens=10
+            )
+
         except Exception as e:
             logger.error(f"Failed to analyze work arrangement: {e}")
             return "onsite"
 
+    def _relevance_messages(self, job_description: str, criteria: Dict[str, Any]) -> List[Dict[str, str]]:
+        """Build messages for relevance scoring."""
+        criteria_text, _ = _criteria_parts(criteria)
+        return [_SYS_RELEVANCE, {"role": "user", "content": _TPL_RELEVANCE.format(criteria_text=criteria_text, job_description=job_description)}]
+
+    def _parse_relevance(self, response: str) -> float:
+        """Parse a relevance scoring response into a clamped score."""
+        score = float(_loads(response)["score"])
+
+        # Strict schemas cannot bound numbers, so clamp here
+        score = max(0.0, min(1.0, score))
+
+        logger.info(f"Relevance score: {score:.2f}")
+        return score
+
     def score_relevance(
         self,
         job_description: str,
@@ -404,51 +1222,40 @@ class ClientAgent:
         """
         logger.info("Scoring job relevance")
 
-        criteria_text = "\n".join([f"- {k}: {v}" for k, v in criteria.items()])
-
-        prompt = f"""
-        Score this job posting's relevance based on the following criteria.
-        Return a score from 0.0 to 1.0, where 1.0 is a perfect match.
-
-        Criteria:
-        {criteria_text}
-
-        Job Description:
-        {job_description}
-
-        Return ONLY a JSON object with a "score" field (float between 0.0 and 1.0).
-        Example: {{"score": 0.85}}
-        """
-
-        messages = [
-            {
-                "role": "system",
-                "content": "You are an expert at evaluating job match quality."
-            },
-            {"role": "user", "content": prompt}
-        ]
-
         try:
-            response = self._call_api(
-                messages,
+            return self._call_api_cached(
+                self._result_key("relevance", job_description, _criteria_parts(criteria)[1]),
+                self._relevance_messages(job_description, criteria),
+                self._parse_relevance,
                 temperature=0.2,
                 max_tokens=50,
-                response_format={"type": "json_object"}
+                response_format=_RELEVANCE_FORMAT
             )
 
-            data = json.loads(response)
-            score = float(data.get("score", 0.5))
-
-            # Ensure score is in valid range
-            score = max(0.0, min(1.0, score))
+        except Exception as e:
+            logger.error(f"Failed to score relevance: {e}")
+            return 0.5  # Default mid-range score
 
-            logger.info(f"Relevance score: {score:.2f}")
-            return score
+    async def _score_relevance_a(self, job_description: str, criteria: Dict[str, Any]) -> float:
+        """Async counterpart of score_relevance."""
+        try:
+            return await self._acall_api_cached(
+                self._result_key("relevance", job_description, _criteria_parts(criteria)[1]),
+                self._relevance_messages(job_description, criteria),
+                self._parse_relevance,
+                temperature=0.2,
+                max_tokens=50,
+                response_format=_RELEVANCE_FORMAT
+            )
 
         except Exception as e:
             logger.error(f"Failed to score relevance: {e}")
             return 0.5  # Default mid-range score
 
+    def _summary_messages(self, job_description: str, max_length: int) -> List[Dict[str, str]]:
+        """Build messages for job summarization."""
+        return [_SYS_SUMMARY, {"role": "user", "content": _TPL_SUMMARY.format(max_length=max_length, job_description=job_description)}]
+
     def generate_summary(self, job_description: str, max_length: int = 200) -> str:
         """
         Generate a concise summary of the job posting.
@@ -462,30 +1269,14 @@ class ClientAgent:
         """
         logger.info("Generating job summary")
 
-        prompt = f"""
-        Create a concise summary of this job posting in {max_length} characters or less.
-        Focus on the role, key responsibilities, and main requirements.
-
-        Job Description:
-        {job_description}
-        """
-
-        messages = [
-            {
-                "role": "system",
-                "content": "You are an expert at summarizing job descriptions."
-            },
-            {"role": "user", "content": prompt}
-        ]
-
         try:
-            response = self._call_api(
-                messages,
+            summary = self._call_api_cached(
+                self._result_key("summary", job_description, max_length),
+                self._summary_messages(job_description, max_length),
+                str.strip,
                 temperature=0.3,
                 max_tokens=100
             )
-
-            summary = response.strip()
             logger.info("Summary generated successfully")
             return summary
 
@@ -493,6 +1284,250 @@ class ClientAgent:
             logger.error(f"Failed to generate summary: {e}")
             return job_description[:max_length] + "..."
 
+    async def _generate_summary_a(self, job_description: str, max_length: int = 200) -> str:
+        """Async counterpart of generate_summary."""
+        try:
+            return await self._acall_api_cached(
+                self._result_key("summary", job_description, max_length),
+                self._summary_messages(job_description, max_length),
+                str.strip,
+                temperature=0.3,
+                max_tokens=100
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to generate summary: {e}")
+            return job_description[:max_length] + "..."
+
+    def _fused_messages(
+        self,
+        job_description: str,
+        criteria: Optional[Dict[str, Any]] = None,
+        max_summary_length: int = 200
+    ) -> List[Dict[str, str]]:
+        """Build messages for the single-call multi-task job analysis."""
+        tasks = [
+            '"pain_points": key pain points, problems, or challenges the company is trying '
+            'to solve by hiring for this role (business problems, technical challenges, '
+            'growth or scaling issues, team gaps)',
+            '"required": required skills (must-haves, requirements)',
+            '"nice_to_have": nice-to-have skills (preferred, bonus)',
+            '"work_arrangement": exactly one of "remote", "hybrid", or "onsite"',
+            f'"summary": a concise summary in {max_summary_length} characters or less, '
+            'focused on the role, key responsibilities, and main requirements',
+        ]
+        schema = '{"pain_points": [], "required": [], "nice_to_have": [], "work_arrangement": "", "summary": ""'
+        criteria_block = ""
+        if criteria:
+            criteria_text, _ = _criteria_parts(criteria)
+            tasks.append('"score": relevance to the criteria below from 0.0 to 1.0, where 1.0 is a perfect match')
+            schema += ', "score": 0.0'
+            criteria_block = f"\nCriteria:\n{criteria_text}\n"
+        schema += "}"
+        task_list = "\n".join(f"- {task}" for task in tasks)
+
+        prompt = f"""
+        Analyze this job description and return a single JSON object with these fields:
+        {task_list}
+        {criteria_block}
+        Job Description:
+        {job_description}
+
+        Return ONLY a JSON object with this structure:
+        {schema}
+        """
+
+        return [_SYS_FUSED, {"role": "user", "content": prompt}]
+
+    def _parse_fused(
+        self,
+        job_url: str,
+        job_description: str,
+        data: Optional[Dict[str, Any]],
+        criteria: Optional[Dict[str, Any]] = None,
+        max_summary_length: int = 200
+    ) -> JobAnalysis:
+        """Build a JobAnalysis from a decoded fused response, using defaults for missing fields."""
+        pain_points: List[str] = []
+        required: List[str] = []
+        nice_to_have: List[str] = []
+        work_arrangement = "onsite"
+        summary = job_description[:max_summary_length] + "..."
+        relevance_score = 0.5
+
+        if data is not None:
+            try:
+                if isinstance(data.get("pain_points"), list):
+                    pain_points = data["pain_points"]
+                if isinstance(data.get("required"), list):
+                    required = data["required"]
+                if isinstance(data.get("nice_to_have"), list):
+                    nice_to_have = data["nice_to_have"]
+
+                arrangement = str(data.get("work_arrangement", "")).strip().lower()
+                if arrangement in ["remote", "hybrid", "onsite"]:
+                    work_arrangement = arrangement
+
+                if data.get("summary"):
+                    summary = str(data["summary"]).strip()
+
+                if criteria:
+                    relevance_score = max(0.0, min(1.0, float(data.get("score", 0.5))))
+
+            except Exception as e:
+                logger.error(f"Failed to parse fused job analysis for {job_url}: {e}")
+
+        return JobAnalysis(
+            job_url=job_url,
+            pain_points=pain_points,
+            required_skills=required,
+            nice_to_have_skills=nice_to_have,
+            work_arrangement=work_arrangement,
+            relevance_score=relevance_score,
+            summary=summary
+        )
+
+    def analyze_job_posting_fused(
+        self,
+        job_url: str,
+        job_description: str,
+        criteria: Optional[Dict[str, Any]] = None,
+        max_summary_length: int = 200
+    ) -> JobAnalysis:
+        """
+        Analyze a job posting with a single multi-task API call.
+
+        Pain points, skills, work arrangement, summary and (optionally) the
+        relevance score are requested together, so the description is sent
+        and tokenized once instead of once per extractor.
+
+        Args:
+            job_url: URL of the job posting
+            job_description: Full job description text
+            criteria: Optional criteria for relevance scoring
+            max_summary_length: Maximum length of summary in characters
+
+        Returns:
+            JobAnalysis object with all extracted information
+        """
+        logger.info(f"Performing fused analysis for job: {job_url}")
+
+        data = None
+        try:
+            data = self._call_api_cached(
+                self._result_key(
+                    "fused", job_description,
+                    _criteria_parts(criteria)[1], max_summary_length
+                ),
+                self._fused_messages(job_description, criteria, max_summary_length),
+                _loads,
+                temperature=0.2,
+                max_tokens=1200,
+                response_format={"type": "json_object"}
+            )
+        except Exception as e:
+            logger.error(f"Fused job analysis failed: {e}")
+
+        analysis = self._parse_fused(job_url, job_description, data, criteria, max_summary_length)
+
+        logger.info("Job analysis completed successfully")
+        return analysis
+
+    def analyze_job_postings_batch(
+        self,
+        jobs: List[Dict[str, Any]],
+        criteria: Optional[Dict[str, Any]] = None,
+        poll_interval: int = 30,
+        max_wait: int = 86400
+    ) -> List[JobAnalysis]:
+        """
+        Analyze many job postings through the OpenAI Batch API.
+
+        Requests run on the separate batch rate-limit pool at half price with a
+        24h completion window, so use this for offline/nightly runs rather than
+        interactive searches. Postings whose request fails get default values.
+
+        Args:
+            jobs: Job dictionaries with 'url' and 'description' keys
+            criteria: Optional criteria for relevance scoring
+            poll_interval: Seconds between status checks
+            max_wait: Maximum seconds to wait for the batch to finish
+
+        Returns:
+            JobAnalysis objects in the same order as jobs
+        """
+        if not jobs:
+            return []
+
+        logger.info(f"Submitting batch analysis for {len(jobs)} jobs")
+
+        # custom_id must be unique per line, so use the position rather than the URL
+        lines = []
+        for i, job in enumerate(jobs):
+            body = self._build_request(
+                self._fused_messages(job.get('description', ''), criteria),
+                temperature=0.2,
+                max_tokens=1200,
+                response_format={"type": "json_object"}
+            )
+            body.pop("previous_response_id", None)
+            lines.append(_dumps_bytes({
+                "custom_id": f"job-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": body
+            }))
+
+        input_file = self.client.files.create(
+            file=("job_analysis_batch.jsonl", b"\n".join(lines)),
+            purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        logger.info(f"Batch submitted: {batch.id}")
+
+        start = time.monotonic()
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            if time.monotonic() - start > max_wait:
+                raise TimeoutError(f"Batch {batch.id} did not complete within {max_wait}s")
+            time.sleep(poll_interval)
+            batch = self.client.batches.retrieve(batch.id)
+            logger.debug(f"Batch {batch.id} status: {batch.status}")
+
+        responses: Dict[str, Dict[str, Any]] = {}
+        if batch.status == "completed" and batch.output_file_id:
+            output = self.client.files.content(batch.output_file_id).content
+            for line in output.splitlines():
+                if not line.strip():
+                    continue
+                result = _loads(line)
+                response = result.get("response") or {}
+                if response.get("status_code") != 200:
+                    continue
+                body = response["body"]
+                self._add_tokens(body.get("usage", {}).get("total_tokens", 0))
+                try:
+                    responses[result["custom_id"]] = _loads(body["choices"][0]["message"]["content"])
+                except (KeyError, IndexError, TypeError, ValueError) as e:
+                    logger.error(f"Unreadable batch output for {result['custom_id']}: {e}")
+        else:
+            logger.error(f"Batch {batch.id} ended with status: {batch.status}")
+
+        logger.info(f"Batch {batch.id} returned {len(responses)}/{len(jobs)} analyses")
+
+        return [
+            self._parse_fused(
+                job.get('url', ''),
+                job.get('description', ''),
+                responses.get(f"job-{i}"),
+                criteria
+            )
+            for i, job in enumerate(jobs)
+        ]
+
     def analyze_job_posting(
         self,
         job_url: str,
@@ -502,6 +1537,8 @@ class ClientAgent:
         """
         Perform comprehensive analysis of a job posting.
 
+        Uses one fused API call; see analyze_job_posting_fused.
+
         Args:
             job_url: URL of the job posting
             job_description: Full job description text
@@ -510,18 +1547,41 @@ class ClientAgent:
         Returns:
             JobAnalysis object with all extracted information
         """
-        logger.info(f"Performing comprehensive analysis for job: {job_url}")
+        return self.analyze_job_posting_fused(job_url, job_description, criteria)
+    
+    async def analyze_job_posting_async(
+        self,
+        job_url: str,
+        job_description: str,
+        criteria: Optional[Dict[str, Any]] = None
+    ) -> JobAnalysis:
+        """
+        Analyze a job posting with the per-field extractors running concurrently.
 
-        # Extract all information
-        pain_points = self.extract_pain_points(job_description)
-        skills = self.extract_skills(job_description)
-        work_arrangement = self.analyze_work_arrangement(job_description)
-        summary = self.generate_summary(job_description)
+        Latency is the slowest single call rather than the sum of all of them.
 
-        # Calculate relevance score if criteria provided
-        relevance_score = 0.5
+        Args:
+            job_url: URL of the job posting
+            job_description: Full job description text
+            criteria: Optional criteria for relevance scoring
+
+        Returns:
+            JobAnalysis object with all extracted information
+        """
+        logger.info(f"Performing concurrent analysis for job: {job_url}")
+
+        calls = [
+            self._extract_pain_points_a(job_description),
+            self._extract_skills_a(job_description),
+            self._analyze_work_arrangement_a(job_description),
+            self._generate_summary_a(job_description),
+        ]
         if criteria:
-            relevance_score = self.score_relevance(job_description, criteria)
+            calls.append(self._score_relevance_a(job_description, criteria))
+
+        results = await asyncio.gather(*calls)
+        pain_points, skills, work_arrangement, summary = results[:4]
+        relevance_score = results[4] if criteria else 0.5
 
         analysis = JobAnalysis(
             job_url=job_url,
@@ -535,7 +1595,21 @@ class ClientAgent:
 
         logger.info("Job analysis completed successfully")
         return analysis
-    
+
+    def analyze_job_posting_parallel(
+        self,
+        job_url: str,
+        job_description: str,
+        criteria: Optional[Dict[str, Any]] = None
+    ) -> JobAnalysis:
+        """
+        Blocking wrapper around analyze_job_posting_async.
+
+        The analysis runs on the shared background loop, so this also works
+        from code that is already running an event loop.
+        """
+        return _run_sync(self.analyze_job_posting_async(job_url, job_description, criteria))
+
     def research_company_web(self, company_name: str, context: str = "") -> Dict[str, Any]:
         """
         Research a company using web search to gather additional intelligence.
@@ -614,6 +1688,9 @@ Provide a structured report with:
     def extract_company_info_structured(self, job_description: str, job_title: str = "") -> Dict[str, Any]:
         """
         Extract company information using structured function calling.
+
+        Results are cached on a hash of the full text and the title, so
+        repeated research or postings skip both tokenization and the API call.
         
         Args:
             job_description: Full job posting text
@@ -623,75 +1700,25 @@ Provide a structured report with:
             Structured company information
         """
         logger.info("Extracting company info via function calling")
-        
-        # Define the function schema
-        tools = [{
-            "type": "function",
-            "function": {
-                "name": "extract_company_data",
-                "description": "Extract structured company information from a job posting",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "company_name": {
-                            "type": "string",
-                            "description": "Name of the hiring company"
-                        },
-                        "company_size": {
-                            "type": "string",
-                            "enum": ["1-10", "11-50", "51-200", "201-500", "501-1000", "1001-5000", "5000+", "unknown"],
-                            "description": "Estimated company size"
-                        },
-                        "industry": {
-                            "type": "string",
-                            "description": "Primary industry or sector"
-                        },
-                        "hiring_volume_signals": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Signals indicating high-volume hiring (e.g., 'multiple positions', 'hiring event')"
-                        },
-                        "pain_points": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Workforce challenges or pain points mentioned"
-                        },
-                        "growth_indicators": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Signs of company growth (expansion, new locations, etc.)"
-                        },
-                        "forecasta_fit_score": {
-                            "type": "integer",
-                            "description": "Score 0-10 indicating likelihood company needs workforce forecasting software",
-                            "minimum": 0,
-                            "maximum": 10
-                        },
-                        "forecasta_fit_reasoning": {
-                            "type": "string",
-                            "description": "Brief explanation of the fit score"
-                        }
-                    },
-                    "required": ["company_name", "industry", "forecasta_fit_score", "forecasta_fit_reasoning"]
-                }
-            }
-        }]
+
+        key = self._result_key("company_extract", job_description, job_title)
+        cached = _cache_get(key) if self.use_cache else None
+        if cached is not None:
+            try:
+                function_args = _parse_company_data(cached)
+                logger.debug("Result cache hit: company_extract")
+                return function_args
+            except ValueError:
+                logger.debug("Discarding unreadable cache entry: company_extract")
         
         messages = [
-            {
-                "role": "system",
-                "content": "You are an expert at analyzing job postings to identify companies that need workforce analytics and forecasting software."
-            },
+            _SYS_COMPANY_EXTRACT,
             {
                 "role": "user",
-                "content": f"""Analyze this job posting and extract company information:
-
-Job Title: {job_title}
-
-Job Description:
-{job_description[:3000]}
-
-Extract all relevant company details and assess if they're a good fit for workforce forecasting software (Forecasta)."""
+                "content": _TPL_COMPANY_EXTRACT.format(
+                    job_title=job_title,
+                    job_description=self.truncate_to_tokens(job_description, _COMPANY_EXTRACT_TOKEN_BUDGET)
+                )
             }
         ]
         
@@ -699,14 +1726,17 @@ Extract all relevant company details and assess if they're a good fit for workfo
             response = self.client.chat.completions.create(
                 model=self.model,
                 messages=messages,
-                tools=tools,
-                tool_choice={"type": "function", "function": {"name": "extract_company_data"}},
+                tools=_EXTRACT_COMPANY_TOOLS,
+                tool_choice=_EXTRACT_COMPANY_TOOL_CHOICE,
                 temperature=0.3
             )
             
             # Parse function call result
             tool_call = response.choices[0].message.tool_calls[0]
-            function_args = json.loads(tool_call.function.arguments)
+            function_args = _parse_company_data(tool_call.function.arguments)
+            # Only arguments that decode to an object get this far
+            if self.use_cache:
+                _cache_put(key, tool_call.function.arguments)
             
             logger.info(f"Extracted company: {function_args.get('company_name', 'Unknown')}, Fit score: {function_args.get('forecasta_fit_score', 0)}/10")
             return function_args
@@ -826,26 +1856,17 @@ Style requirements:
         logger.info(f"Analyzing {len(job_postings)} job postings with Code Interpreter")
         
         # Prepare data summary for analysis
+        by_location = Counter(job.get('location', 'Unknown') for job in job_postings)
+        dates = (job.get('posted_date', job.get('date', 'Unknown')) for job in job_postings)
+        by_date = Counter(date for date in dates if date and date != 'Unknown')
+        
         data_summary = {
             "total_jobs": len(job_postings),
-            "by_location": {},
-            "by_date": {},
-            "titles": []
+            "by_location": dict(by_location),
+            "by_date": dict(by_date),
+            "titles": [job.get('title', '') for job in job_postings]
         }
         
-        for job in job_postings:
-            # Count by location
-            loc = job.get('location', 'Unknown')
-            data_summary["by_location"][loc] = data_summary["by_location"].get(loc, 0) + 1
-            
-            # Count by date
-            date = job.get('posted_date', job.get('date', 'Unknown'))
-            if date and date != 'Unknown':
-                data_summary["by_date"][date] = data_summary["by_date"].get(date, 0) + 1
-            
-            # Collect titles
-            data_summary["titles"].append(job.get('title', ''))
-        
         # Use Code Interpreter tool to analyze
         tools = [{"type": "code_interpreter"}]
         
@@ -863,7 +1884,7 @@ Style requirements:
 Total Jobs: {data_summary['total_jobs']}
 
 Jobs by Location:
-{', '.join([f'{loc}: {count}' for loc, count in sorted(data_summary['by_location'].items(), key=lambda x: x[1], reverse=True)[:10]])}
+{', '.join([f'{loc}: {count}' for loc, count in by_location.most_common(10)])}
 
 Job Titles (sample):
 {', '.join(data_summary['titles'][:20])}
@@ -980,12 +2001,114 @@ Provide detailed calculations with code."""
                 "error": str(e)
             }
 
-    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+    async def _aget_embeddings(
+        self,
+        texts: List[str],
+        chunk_size: int = 256,
+        concurrency: int = 20
+    ) -> List[List[float]]:
+        """
+        Embed texts in chunks, with up to concurrency requests in flight.
+
+        Can be awaited from any event loop; requests are sent from the
+        background loop that owns the async client.
+
+        Args:
+            texts: List of texts to embed
+            chunk_size: Maximum inputs per embeddings request
+            concurrency: Maximum concurrent requests
+
+        Returns:
+            List of embedding vectors, in the order of texts
+        """
+        return await _await_in_async_loop(self._aembed(texts, chunk_size, concurrency))
+
+    async def _aembed(
+        self,
+        texts: List[str],
+        chunk_size: int,
+        concurrency: int
+    ) -> List[List[float]]:
+        """Embed texts from the background loop; see _aget_embeddings."""
+        aclient = self._get_aclient()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def embed(chunk: List[str]) -> List[List[float]]:
+            for attempt in range(_MAX_ATTEMPTS):
+                try:
+                    async with semaphore:
+                        response = await aclient.embeddings.create(
+                            model=_EMBEDDING_MODEL,
+                            input=chunk
+                        )
+                    return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
+                except _RETRYABLE_ERRORS as e:
+                    if attempt == _MAX_ATTEMPTS - 1:
+                        raise
+                    delay = _retry_delay(attempt)
+                    logger.warning(f"Embeddings request failed ({e}); retrying in {delay:.1f}s")
+                    await asyncio.sleep(delay)
+
+        chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+        results = await asyncio.gather(*[embed(chunk) for chunk in chunks])
+        return [embedding for chunk_embeddings in results for embedding in chunk_embeddings]
+
+    def _embedding_vectors(
+        self,
+        texts: List[str],
+        chunk_size: int,
+        concurrency: int
+    ) -> List[Any]:
+        """
+        Embed texts as float32 vectors, serving previously embedded texts from the cache.
+
+        Args:
+            texts: List of texts to embed
+            chunk_size: Maximum inputs per embeddings request
+            concurrency: Maximum concurrent requests
+
+        Returns:
+            One float32 vector per text, in input order
+        """
+        keys = [_embedding_key(text, _EMBEDDING_MODEL) for text in texts]
+        vectors = _embedding_cache_get_many(keys) if self.use_cache else {}
+
+        # Embed each distinct uncached text once
+        misses: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in vectors:
+                misses.setdefault(key, text)
+
+        if misses:
+            fresh = _run_sync(self._aembed(list(misses.values()), chunk_size, concurrency))
+            new_vectors = {
+                key: _to_vector(embedding)
+                for key, embedding in zip(misses, fresh)
+            }
+            if self.use_cache:
+                _embedding_cache_put_many(new_vectors)
+            vectors.update(new_vectors)
+
+        logger.info(f"Generated {len(keys)} embeddings ({len(texts) - len(misses)} from cache)")
+        return [vectors[key] for key in keys]
+
+    def get_embeddings(
+        self,
+        texts: List[str],
+        chunk_size: int = 256,
+        concurrency: int = 20
+    ) -> List[List[float]]:
         """
         Generate embeddings for a list of texts using OpenAI's embedding model.
 
+        Previously embedded texts are served from the embedding cache; the
+        rest are split into chunks that are embedded concurrently.
+
         Args:
             texts: List of texts to embed
+            chunk_size: Maximum inputs per embeddings request
+            concurrency: Maximum concurrent requests
 
         Returns:
             List of embedding vectors
@@ -993,15 +2116,51 @@ Provide detailed calculations with code."""
         logger.info(f"Generating embeddings for {len(texts)} texts")
 
         try:
-            response = self.client.embeddings.create(
-                model="text-embedding-ada-002",
-                input=texts
-            )
+            return [vec.tolist() for vec in self._embedding_vectors(texts, chunk_size, concurrency)]
 
-            embeddings = [item.embedding for item in response.data]
+        except Exception as e:
+            logger.error(f"Failed to generate embeddings: {e}")
+            raise
+
+    def get_embedding_matrix(
+        self,
+        texts: List[str],
+        chunk_size: int = 256,
+        concurrency: int = 20,
+        dtype: Any = None
+    ) -> "np.ndarray":
+        """
+        Generate L2-normalized embeddings as one contiguous array.
+
+        Rows are unit length, so cosine similarity is a plain dot product
+        (matrix @ query_vector). float16 storage takes a quarter of the
+        memory of float32 and a small fraction of nested Python lists.
+        Requires numpy; get_embeddings works without it.
+
+        Args:
+            texts: List of texts to embed
+            chunk_size: Maximum inputs per embeddings request
+            concurrency: Maximum concurrent requests
+            dtype: Storage dtype of the returned array (default float16)
 
-            logger.info(f"Generated {len(embeddings)} embeddings")
-            return embeddings
+        Returns:
+            Array of shape (len(texts), dimensions)
+        """
+        if np is None:
+            raise ImportError("get_embedding_matrix requires numpy")
+        if dtype is None:
+            dtype = np.float16
+
+        logger.info(f"Generating embedding matrix for {len(texts)} texts")
+
+        try:
+            vectors = self._embedding_vectors(texts, chunk_size, concurrency)
+            if not vectors:
+                return np.empty((0, 0), dtype=dtype)
+            matrix = np.vstack(vectors)
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            matrix /= np.where(norms == 0, 1.0, norms)
+            return matrix.astype(dtype)
 
         except Exception as e:
             logger.error(f"Failed to generate embeddings: {e}")
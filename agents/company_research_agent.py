@@ -2,28 +2,234 @@
 Company Research Agent
 Performs multi-platform research to build comprehensive company profiles.
 """
-import re
-import requests
-from typing import List, Dict, Any, Optional
-from bs4 import BeautifulSoup
+import asyncio
+import functools
+import json
+import threading
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, Tuple, Union
 import time
+from collections import OrderedDict
+from urllib.parse import urlsplit
 from models_enhanced import (
     CompanyProfile,
     ResearchQuery,
     PlatformSearchResult
 )
-from agents.client_agent import ClientAgent
+from config import Config
+from models import CompanyData
+from agents.client_agent import ClientAgent, _run_sync
 from utils import get_logger
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
 logger = get_logger(__name__)
 
 
+def _dumps(obj: Any) -> str:
+    """Serialize to compact JSON text, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, separators=(',', ':'))
+
+
+def _loads(data: Union[str, bytes]) -> Any:
+    """Deserialize JSON text or bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Characters rewritten when turning a company name into a URL slug
+_SLUG_TRANS = str.maketrans({' ': '-', ',': '', '.': '', '/': '-'})
+
+
+def _slugify(name: str) -> str:
+    """Turn a company name into a LinkedIn/Crunchbase style URL slug."""
+    return name.lower().translate(_SLUG_TRANS)
+
+
+# Researched profiles are reused for Config.PROFILE_CACHE_TTL seconds from an
+# in-memory LRU, optionally shared across processes via Config.PROFILE_CACHE_DIR
+_PROFILE_CACHE_SIZE = 10_000
+_profile_cache: "OrderedDict[Tuple[Any, ...], Tuple[float, CompanyProfile]]" = OrderedDict()
+_profile_cache_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_profile_disk_cache():
+    """Optional persistent second level, enabled by PROFILE_CACHE_DIR and diskcache."""
+    if diskcache is None or not Config.PROFILE_CACHE_DIR:
+        return None
+    return diskcache.Cache(Config.PROFILE_CACHE_DIR)
+
+
+def _profile_cache_get(key: Tuple[Any, ...]) -> Optional[CompanyProfile]:
+    """Return a private copy of a fresh cached profile, or None."""
+    now = time.monotonic()
+    with _profile_cache_lock:
+        entry = _profile_cache.get(key)
+        if entry is not None:
+            expires_at, profile = entry
+            if expires_at > now:
+                _profile_cache.move_to_end(key)
+                return profile.model_copy(deep=True)
+            del _profile_cache[key]
+
+    disk = _get_profile_disk_cache()
+    if disk is None:
+        return None
+    data, expire_time = disk.get(key, expire_time=True)
+    if data is None:
+        return None
+    try:
+        profile = CompanyProfile.model_validate_json(data)
+    except ValueError:
+        return None
+    ttl = expire_time - time.time() if expire_time else Config.PROFILE_CACHE_TTL
+    _profile_cache_put(key, profile, ttl=ttl, persist=False)
+    return profile.model_copy(deep=True)
+
+
+def _profile_cache_put(
+    key: Tuple[Any, ...],
+    profile: CompanyProfile,
+    ttl: Optional[float] = None,
+    persist: bool = True
+) -> CompanyProfile:
+    """Store a copy of a researched profile and return the original."""
+    ttl = Config.PROFILE_CACHE_TTL if ttl is None else ttl
+    if ttl <= 0:
+        return profile
+
+    with _profile_cache_lock:
+        _profile_cache[key] = (time.monotonic() + ttl, profile.model_copy(deep=True))
+        _profile_cache.move_to_end(key)
+        if len(_profile_cache) > _PROFILE_CACHE_SIZE:
+            _profile_cache.popitem(last=False)
+
+    disk = _get_profile_disk_cache() if persist else None
+    if disk is not None:
+        disk.set(key, profile.model_dump_json(), expire=ttl)
+    return profile
+
+
+# Longest web research summary sent for structured extraction
+_MAX_RESEARCH_CHARS = 12_000
+
+
+def _trim_research_text(text: str, max_chars: int = _MAX_RESEARCH_CHARS) -> str:
+    """
+    Cut research text down to whole leading paragraphs within a character budget.
+
+    Args:
+        text: Web research summary
+        max_chars: Character budget
+
+    Returns:
+        The text unchanged if it fits, otherwise as many leading paragraphs as
+        fit (or a hard cut of the first paragraph if even that is too long)
+    """
+    if len(text) <= max_chars:
+        return text
+
+    kept = []
+    used = 0
+    for paragraph in text.split('\n\n'):
+        used += len(paragraph) + 2
+        if used > max_chars + 2:
+            break
+        kept.append(paragraph)
+    return '\n\n'.join(kept) if kept else text[:max_chars]
+
+
+# Representative employee count for each company_size range the extractor returns
+_EMPLOYEE_ESTIMATES = MappingProxyType({
+    "1-10": 5,
+    "11-50": 30,
+    "51-200": 125,
+    "201-500": 350,
+    "501-1000": 750,
+    "1001-5000": 3000,
+    "5000+": 10000,
+})
+
+# Companies described per chat completion by ai_enhance_profiles_batch
+_ENHANCE_BATCH_SIZE = 20
+_ENHANCE_TOKENS_PER_COMPANY = 150
+
+# Structured output for batched descriptions; "known" replaces matching on
+# "Unable to determine" in free text
+_ENHANCE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "company_descriptions",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "companies": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "id": {"type": "integer"},
+                            "description": {"type": "string"},
+                            "known": {"type": "boolean"}
+                        },
+                        "required": ["id", "description", "known"],
+                        "additionalProperties": False
+                    }
+                }
+            },
+            "required": ["companies"],
+            "additionalProperties": False
+        }
+    }
+}
+
+
 class CompanyResearchAgent:
     """
     Agent for researching companies across multiple platforms.
     Builds comprehensive profiles including size, tech stack, and contacts.
     """
 
+    # Profile field each platform's top result URL is stored in
+    _PLATFORM_URL_ATTR = {
+        "google": "company_website",
+        "linkedin": "linkedin_url",
+        "crunchbase": "crunchbase_url",
+        "glassdoor": None,
+    }
+
+    # Profile fields each platform search can fill; platforms whose fields are
+    # all populated already are skipped
+    _PLATFORM_FILLS = {
+        "google": ("domain", "company_website"),
+        "linkedin": ("linkedin_url",),
+        "crunchbase": ("crunchbase_url",),
+        "glassdoor": ("glassdoor_url",),
+    }
+
+    # Profile fields that add to the confidence score when populated
+    _CONFIDENCE_WEIGHTS = (
+        ("domain", 0.10),
+        ("description", 0.10),
+        ("linkedin_url", 0.10),
+        ("employee_count_estimate", 0.10),
+        ("industry", 0.10),
+        ("tech_stack", 0.05),
+    )
+
     def __init__(self, client_agent: Optional[ClientAgent] = None, use_web_search: bool = True):
         """
         Initialize the Company Research Agent.
@@ -32,29 +238,195 @@ class CompanyResearchAgent:
             client_agent: ClientAgent instance for AI calls
             use_web_search: Enable OpenAI web search (recommended)
         """
-        self.client = client_agent or ClientAgent()
+        self.client = client_agent or ClientAgent.get_shared()
         self.use_web_search = use_web_search
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        self._searchers = {
+            "google": self._search_google,
+            "linkedin": self._search_linkedin,
+            "crunchbase": self._search_crunchbase,
+            "glassdoor": self._search_glassdoor,
+        }
         logger.info(f"CompanyResearchAgent initialized (web_search={use_web_search})")
 
     def research_company(
         self,
-        query: ResearchQuery
+        query: ResearchQuery,
+        force_refresh: bool = False
     ) -> CompanyProfile:
         """
         Research a company across multiple platforms.
 
         Args:
             query: Research query with company details
+            force_refresh: Ignore any cached profile and research again
+
+        Returns:
+            Comprehensive company profile
+        """
+        return _run_sync(self.research_company_async(query, force_refresh=force_refresh))
+
+    async def research_company_async(
+        self,
+        query: ResearchQuery,
+        force_refresh: bool = False
+    ) -> CompanyProfile:
+        """
+        Research a company across multiple platforms without blocking the event loop.
+
+        Platform searches are gathered concurrently.
+
+        Args:
+            query: Research query with company details
+            force_refresh: Ignore any cached profile and research again
 
         Returns:
             Comprehensive company profile
         """
+        key = self._profile_key(query)
+        cached = None if force_refresh else _profile_cache_get(key)
+        if cached is not None:
+            logger.info(f"Using cached research for {query.company_name}")
+            return cached
+
         logger.info(f"Researching company: {query.company_name}")
 
+        profile = await self._gather_profile(query)
+        profile = await asyncio.to_thread(self._finish_profile, profile, query)
+        return _profile_cache_put(key, profile)
+
+    def research_companies(
+        self,
+        queries: List[ResearchQuery],
+        concurrency: int = 16,
+        force_refresh: bool = False
+    ) -> List[CompanyProfile]:
+        """
+        Research many companies at once (sync wrapper around research_companies_async).
+
+        Args:
+            queries: Research queries
+            concurrency: Maximum companies researched at the same time
+            force_refresh: Ignore any cached profiles and research again
+
+        Returns:
+            One profile per query, in input order
+        """
+        return _run_sync(self.research_companies_async(queries, concurrency, force_refresh))
+
+    async def research_companies_async(
+        self,
+        queries: List[ResearchQuery],
+        concurrency: int = 16,
+        force_refresh: bool = False
+    ) -> List[CompanyProfile]:
+        """
+        Research many companies concurrently with batched AI enhancement.
+
+        Web search and platform searches run for up to `concurrency`
+        companies at a time; descriptions for every profile that still needs
+        one are then generated together via ai_enhance_profiles_batch.
+
+        Args:
+            queries: Research queries
+            concurrency: Maximum companies researched at the same time
+            force_refresh: Ignore any cached profiles and research again
+
+        Returns:
+            One profile per query, in input order
+        """
+        keys = [self._profile_key(query) for query in queries]
+        profiles: Dict[Tuple[Any, ...], CompanyProfile] = {}
+        todo: Dict[Tuple[Any, ...], ResearchQuery] = {}
+        for key, query in zip(keys, queries):
+            cached = None if force_refresh or key in todo else _profile_cache_get(key)
+            if cached is not None:
+                profiles[key] = cached
+            else:
+                todo.setdefault(key, query)
+
+        logger.info(f"Researching {len(todo)} companies ({len(queries) - len(todo)} cached or repeated)")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def gather_one(query: ResearchQuery) -> CompanyProfile:
+            async with semaphore:
+                return await self._gather_profile(query)
+
+        gathered = await asyncio.gather(*(gather_one(query) for query in todo.values()))
+
+        await asyncio.to_thread(self.ai_enhance_profiles_batch, gathered)
+
+        for (key, query), profile in zip(todo.items(), gathered):
+            self._score_profile(profile, query)
+            profiles[key] = _profile_cache_put(key, profile)
+
+        # Repeated queries each get their own copy
+        seen = set()
+        results = []
+        for key in keys:
+            profile = profiles[key]
+            results.append(profile.model_copy(deep=True) if key in seen else profile)
+            seen.add(key)
+        return results
+
+    async def _gather_profile(self, query: ResearchQuery) -> CompanyProfile:
+        """
+        Collect web search and platform data for one company.
+
+        Platforms are skipped when web search alone was sufficient; either
+        way the profile still needs AI enhancement and scoring.
+
+        Args:
+            query: Research query with company details
+
+        Returns:
+            Profile from _research_web, with platform results applied when
+            web search was not sufficient
+        """
+        profile, complete = await asyncio.to_thread(self._research_web, query)
+        if complete:
+            return profile
+
+        # Only query platforms that can still fill an empty field
+        platforms = [
+            platform for platform in self._active_platforms(query)
+            if any(not getattr(profile, attr) for attr in self._PLATFORM_FILLS[platform])
+        ]
+        outcomes = await asyncio.gather(
+            *(self._searchers[platform](query) for platform in platforms),
+            return_exceptions=True
+        )
+        results = {}
+        for platform, outcome in zip(platforms, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Error researching on {platform}: {outcome}")
+            else:
+                results[platform] = outcome
+
+        self._apply_platform_results(profile, platforms, results)
+        return profile
+
+    def _profile_key(self, query: ResearchQuery) -> Tuple[Any, ...]:
+        """Cache key covering every query field that changes the researched profile."""
+        return (
+            query.company_name.lower().strip(),
+            (query.location or '').lower().strip(),
+            (query.domain or '').lower().strip(),
+            tuple(self._active_platforms(query)),
+            self.use_web_search,
+        )
+
+    def _research_web(self, query: ResearchQuery) -> Tuple[CompanyProfile, bool]:
+        """
+        Start a profile from OpenAI web search when enabled.
+
+        Args:
+            query: Research query with company details
+
+        Returns:
+            Tuple of (profile, complete) where complete means web search
+            provided enough data to skip platform scraping
+        """
         profile = CompanyProfile(
             name=query.company_name,
             location=query.location,
@@ -77,38 +449,40 @@ class CompanyResearchAgent:
                 logger.info(f"Web search completed for {query.company_name}")
                 
                 # Return early if web search provided sufficient data
-                if profile.employee_count or profile.revenue_range:
-                    return profile
+                if profile.employee_count_estimate or profile.revenue_estimate:
+                    return profile, True
                     
             except Exception as e:
                 logger.warning(f"Web search failed, falling back to manual scraping: {e}")
 
-        # FALLBACK: Manual platform scraping (slower)
-        # Research on each platform
-        for platform in query.search_platforms:
-            try:
-                if platform == "google":
-                    result = self._search_google(query)
-                    self._enrich_from_google(profile, result)
-                elif platform == "linkedin":
-                    result = self._search_linkedin(query)
-                    self._enrich_from_linkedin(profile, result)
-                elif platform == "crunchbase":
-                    result = self._search_crunchbase(query)
-                    self._enrich_from_crunchbase(profile, result)
-                elif platform == "glassdoor":
-                    result = self._search_glassdoor(query)
-                    self._enrich_from_glassdoor(profile, result)
-
-                time.sleep(1)  # Rate limiting
+        return profile, False
 
-            except Exception as e:
-                logger.error(f"Error researching on {platform}: {e}")
+    def _active_platforms(self, query: ResearchQuery) -> List[str]:
+        """Requested platforms that have a searcher, without duplicates."""
+        return [p for p in dict.fromkeys(query.search_platforms) if p in self._searchers]
 
+    def _apply_platform_results(
+        self,
+        profile: CompanyProfile,
+        platforms: List[str],
+        results: Dict[str, PlatformSearchResult]
+    ):
+        """Enrich in the requested platform order so profiles are deterministic."""
+        for platform in platforms:
+            if platform in results:
+                try:
+                    self._enrich_from_platform(profile, results[platform])
+                except Exception as e:
+                    logger.error(f"Error enriching from {platform}: {e}")
+
+    def _finish_profile(self, profile: CompanyProfile, query: ResearchQuery) -> CompanyProfile:
+        """Fill gaps with AI and score confidence once platform data is in."""
         # Use AI to enhance profile
         profile = self._ai_enhance_profile(profile)
+        return self._score_profile(profile, query)
 
-        # Calculate confidence score
+    def _score_profile(self, profile: CompanyProfile, query: ResearchQuery) -> CompanyProfile:
+        """Set the confidence score and log the finished research."""
         profile.confidence_score = self._calculate_confidence(profile)
 
         logger.info(
@@ -119,7 +493,7 @@ class CompanyResearchAgent:
 
         return profile
 
-    def _search_google(self, query: ResearchQuery) -> PlatformSearchResult:
+    async def _search_google(self, query: ResearchQuery) -> PlatformSearchResult:
         """
         Search Google for company information.
         Note: This is a simplified version. For production, use Google Custom Search API.
@@ -155,7 +529,7 @@ class CompanyResearchAgent:
 
         return result
 
-    def _search_linkedin(self, query: ResearchQuery) -> PlatformSearchResult:
+    async def _search_linkedin(self, query: ResearchQuery) -> PlatformSearchResult:
         """
         Search LinkedIn for company profile.
         Note: Requires LinkedIn API access or web scraping (with caution).
@@ -167,7 +541,7 @@ class CompanyResearchAgent:
 
         try:
             # Construct LinkedIn company URL guess
-            company_slug = query.company_name.lower().replace(' ', '-').replace(',', '')
+            company_slug = _slugify(query.company_name)
             linkedin_url = f"https://www.linkedin.com/company/{company_slug}"
 
             result.results = [{
@@ -184,7 +558,7 @@ class CompanyResearchAgent:
 
         return result
 
-    def _search_crunchbase(self, query: ResearchQuery) -> PlatformSearchResult:
+    async def _search_crunchbase(self, query: ResearchQuery) -> PlatformSearchResult:
         """
         Search Crunchbase for funding and company data.
         Note: Requires Crunchbase API key for production use.
@@ -197,7 +571,7 @@ class CompanyResearchAgent:
         try:
             # Placeholder for Crunchbase integration
             # In production, use Crunchbase API
-            company_slug = query.company_name.lower().replace(' ', '-')
+            company_slug = _slugify(query.company_name)
             crunchbase_url = f"https://www.crunchbase.com/organization/{company_slug}"
 
             result.results = [{
@@ -214,7 +588,7 @@ class CompanyResearchAgent:
 
         return result
 
-    def _search_glassdoor(self, query: ResearchQuery) -> PlatformSearchResult:
+    async def _search_glassdoor(self, query: ResearchQuery) -> PlatformSearchResult:
         """Search Glassdoor for company reviews and size."""
         result = PlatformSearchResult(
             platform="glassdoor",
@@ -234,124 +608,104 @@ class CompanyResearchAgent:
 
         return result
 
-    def _enrich_from_google(
+    def _enrich_from_platform(
         self,
         profile: CompanyProfile,
         result: PlatformSearchResult
     ):
-        """Enrich profile from Google search results."""
+        """Enrich profile from a platform search result."""
         if not result.success or not result.results:
             return
 
-        profile.data_sources.append("google")
+        profile.data_sources.append(result.platform)
 
-        # Extract domain from results
-        for item in result.results:
-            if 'url' in item and item['url']:
-                domain = self._extract_domain(item['url'])
-                if domain and not profile.domain:
-                    profile.domain = domain
-                    profile.company_website = item['url']
-
-    def _enrich_from_linkedin(
-        self,
-        profile: CompanyProfile,
-        result: PlatformSearchResult
-    ):
-        """Enrich profile from LinkedIn data."""
-        if not result.success or not result.results:
+        attr = self._PLATFORM_URL_ATTR.get(result.platform)
+        url = result.results[0].get('url')
+        if not attr or not url:
             return
 
-        profile.data_sources.append("linkedin")
+        # The company website also gives the domain; keep any domain already known
+        if attr == "company_website":
+            domain = self._extract_domain(url)
+            if not domain or profile.domain:
+                return
+            profile.domain = domain
 
-        for item in result.results:
-            if 'url' in item:
-                profile.linkedin_url = item['url']
+        setattr(profile, attr, url)
+
+    def _ai_enhance_profile(self, profile: CompanyProfile) -> CompanyProfile:
+        """Use AI to enhance and fill gaps in company profile."""
+        return self.ai_enhance_profiles_batch([profile])[0]
 
-    def _enrich_from_crunchbase(
+    def ai_enhance_profiles_batch(
         self,
-        profile: CompanyProfile,
-        result: PlatformSearchResult
-    ):
-        """Enrich profile from Crunchbase data."""
-        if not result.success or not result.results:
-            return
+        profiles: List[CompanyProfile],
+        batch_size: int = _ENHANCE_BATCH_SIZE
+    ) -> List[CompanyProfile]:
+        """
+        Generate descriptions for many profiles with one AI call per batch.
 
-        profile.data_sources.append("crunchbase")
+        Only profiles with a website but no description are sent; up to
+        batch_size companies share a single chat completion.
 
-        for item in result.results:
-            if 'url' in item:
-                profile.crunchbase_url = item['url']
+        Args:
+            profiles: Company profiles to enhance (updated in place)
+            batch_size: Maximum companies per AI request
 
-    def _enrich_from_glassdoor(
-        self,
-        profile: CompanyProfile,
-        result: PlatformSearchResult
-    ):
-        """Enrich profile from Glassdoor data."""
-        if not result.success or not result.results:
-            return
+        Returns:
+            The same list of profiles
+        """
+        pending = [p for p in profiles if not p.description and p.company_website]
 
-        profile.data_sources.append("glassdoor")
+        for start in range(0, len(pending), batch_size):
+            chunk = pending[start:start + batch_size]
+            companies = [
+                {"id": i, "name": p.name, "location": p.location or "unknown"}
+                for i, p in enumerate(chunk)
+            ]
+            prompt = f"""For each company below, provide a brief 2-3 sentence description of what it likely does, based on its name and location.
+            Keep it factual and professional. Set "known" to false if you don't have information about a company.
 
-    def _ai_enhance_profile(self, profile: CompanyProfile) -> CompanyProfile:
-        """Use AI to enhance and fill gaps in company profile."""
-        if not profile.description and profile.company_website:
-            try:
-                # Use AI to generate company description
-                prompt = f"""Based on the company name "{profile.name}" and location "{profile.location or 'unknown'}",
-                provide a brief 2-3 sentence description of what this company likely does.
-                Keep it factual and professional. If you don't have information, say "Unable to determine"."""
+            Companies:
+            {_dumps(companies)}"""
 
-                description = self.client._call_api(
+            try:
+                response = self.client._call_api(
                     messages=[
                         {"role": "system", "content": "You are a business analyst providing company insights."},
                         {"role": "user", "content": prompt}
                     ],
                     temperature=0.3,
-                    max_tokens=150
+                    max_tokens=_ENHANCE_TOKENS_PER_COMPANY * len(chunk),
+                    response_format=_ENHANCE_FORMAT
                 )
-
-                if "unable to determine" not in description.lower():
-                    profile.description = description.strip()
-
+                results = _loads(response)["companies"]
             except Exception as e:
                 logger.error(f"AI enhancement error: {e}")
+                continue
 
-        return profile
+            for item in results:
+                idx = item["id"]
+                description = item["description"].strip()
+                if item["known"] and description and 0 <= idx < len(chunk):
+                    chunk[idx].description = description
+
+        return profiles
 
     def _extract_domain(self, url: str) -> Optional[str]:
         """Extract domain from URL."""
-        match = re.search(r'https?://([^/]+)', url)
-        if match:
-            domain = match.group(1)
-            # Remove www prefix
-            domain = re.sub(r'^www\.', '', domain)
-            return domain
-        return None
+        try:
+            host = urlsplit(url).hostname
+        except ValueError:
+            return None
+        # Remove www prefix
+        return host.removeprefix("www.") if host else None
 
     def _calculate_confidence(self, profile: CompanyProfile) -> float:
         """Calculate confidence score based on data completeness."""
-        score = 0.0
-
-        # Data source diversity
-        source_count = len(profile.data_sources)
-        score += min(source_count * 0.15, 0.45)  # Max 0.45 for sources
-
-        # Profile completeness
-        if profile.domain:
-            score += 0.10
-        if profile.description:
-            score += 0.10
-        if profile.linkedin_url:
-            score += 0.10
-        if profile.employee_count_estimate:
-            score += 0.10
-        if profile.industry:
-            score += 0.10
-        if profile.tech_stack:
-            score += 0.05
-
+        # Data source diversity (max 0.45) plus profile completeness
+        score = min(len(profile.data_sources) * 0.15, 0.45)
+        score += sum(w for attr, w in self._CONFIDENCE_WEIGHTS if getattr(profile, attr))
         return min(score, 1.0)
 
     def find_decision_makers(
@@ -404,26 +758,20 @@ class CompanyResearchAgent:
         
         logger.info(f"Enriching profile from web search results ({len(research_text)} chars)")
         
-        # Use structured function calling to extract key data points
+        # Use structured function calling to extract key data points, unless
+        # the research already came back as company data JSON
         try:
-            company_data = self.client.extract_company_info_structured(
-                job_description=research_text,
-                job_title=f"Research: {profile.name}"
-            )
+            company_data = self._parse_company_json(research_text)
+            if company_data is None:
+                company_data = self.client.extract_company_info_structured(
+                    job_description=_trim_research_text(research_text),
+                    job_title=f"Research: {profile.name}"
+                )
             
             # Update profile with extracted data
             if 'company_size' in company_data and company_data['company_size'] != 'unknown':
                 # Convert size range to employee count estimate
-                size_map = {
-                    "1-10": 5,
-                    "11-50": 30,
-                    "51-200": 125,
-                    "201-500": 350,
-                    "501-1000": 750,
-                    "1001-5000": 3000,
-                    "5000+": 10000
-                }
-                profile.employee_count = size_map.get(company_data['company_size'], None)
+                profile.employee_count_estimate = _EMPLOYEE_ESTIMATES.get(company_data['company_size'])
             
             if 'industry' in company_data:
                 profile.industry = company_data['industry']
@@ -440,13 +788,23 @@ class CompanyResearchAgent:
             if 'forecasta_fit_score' in company_data:
                 profile.description = f"Forecasta Fit: {company_data['forecasta_fit_score']}/10 - {company_data.get('forecasta_fit_reasoning', '')}"
             
-            logger.info(f"Profile enriched: {profile.name} ({profile.employee_count} employees, {profile.industry})")
+            logger.info(f"Profile enriched: {profile.name} ({profile.employee_count_estimate} employees, {profile.industry})")
             
         except Exception as e:
             logger.error(f"Failed to extract structured data from web search: {e}")
         
         return profile
 
+    @staticmethod
+    def _parse_company_json(research_text: str) -> Optional[Dict[str, Any]]:
+        """Return research text as company data if it is already a matching JSON object."""
+        if not research_text.lstrip().startswith('{'):
+            return None
+        try:
+            return CompanyData.model_validate(_loads(research_text)).model_dump(exclude_unset=True)
+        except ValueError:
+            return None
+
     def enrich_with_tech_stack(
         self,
         profile: CompanyProfile
@@ -2,17 +2,24 @@
 Company Scoring Agent - Intelligent qualification and ranking of companies
 Uses comprehensive criteria to identify the best prospects for services.
 """
-from typing import List, Dict, Tuple
+from typing import Dict, Iterator, List, Tuple
+from collections import Counter
 from dataclasses import dataclass
+from itertools import islice
+from operator import attrgetter
 import re
 
 from utils import get_logger
 from models import RawJobPosting
+from agents.keyword_scanner import KeywordScannerMixin
 
 logger = get_logger(__name__)
 
+# Description placeholder left by quick scans; carries no signal
+_QUICK_SCAN_DESCRIPTION = "[Quick scan - full details not fetched]"
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class CompanyScore:
     """Detailed scoring breakdown for a company."""
     company_name: str
@@ -34,7 +41,22 @@ class CompanyScore:
     jobs: List[RawJobPosting]
 
 
-class CompanyScoringAgent:
+def _capped_score_table(max_count: int, points: float, cap: float) -> Tuple[float, ...]:
+    """
+    Precompute `min(count * points, cap)` for every possible match count.
+
+    Args:
+        max_count: Largest match count (the size of the keyword list)
+        points: Points per matched keyword
+        cap: Maximum score
+
+    Returns:
+        Tuple indexed by match count
+    """
+    return tuple(min(count * points, cap) for count in range(max_count + 1))
+
+
+class CompanyScoringAgent(KeywordScannerMixin):
     """Agent for scoring and ranking companies based on qualification criteria."""
 
     # Technical debt indicators (25 points max)
@@ -78,9 +100,38 @@ class CompanyScoringAgent:
         'technical challenges', 'struggling with', 'problems with'
     ]
 
+    # Funding language that doubles a company's score
+    FUNDING_KEYWORDS = ['funded', 'series a', 'series b', 'series c']
+
+    # Component scores indexed by match count
+    _DEBT_SCORES = _capped_score_table(len(TECH_DEBT_KEYWORDS), 5, 25.0)
+    _GROWTH_SCORES = _capped_score_table(len(GROWTH_KEYWORDS), 4, 20.0)
+    _TECH_SCORES = _capped_score_table(len(MODERN_TECH), 2, 15.0)
+
+    # Only the counted categories drop keywords found inside longer ones
+    # ('slow' in 'slow deployment'); presence checks such as the funding
+    # multiplier still see 'funded' in 'well-funded'
+    _SCANNER_LONGEST_MATCH = ('debt', 'growth', 'tech')
+
     def __init__(self):
+        self._scanner = self._get_scanner()
         logger.info("CompanyScoringAgent initialized")
 
+    @classmethod
+    def _scanner_categories(cls) -> Dict[str, List[str]]:
+        """Keyword lists scanned for each company, by category."""
+        return {
+            'debt': cls.TECH_DEBT_KEYWORDS,
+            'growth': cls.GROWTH_KEYWORDS,
+            'tech': cls.MODERN_TECH,
+            'senior': cls.SENIOR_KEYWORDS,
+            'junior': cls.JUNIOR_KEYWORDS,
+            'agency': cls.AGENCY_KEYWORDS,
+            'spam': cls.SPAM_KEYWORDS,
+            'pain': cls.PAIN_POINT_PATTERNS,
+            'funding': cls.FUNDING_KEYWORDS,
+        }
+
     def score_companies(
         self,
         company_jobs_dict: Dict[str, List[RawJobPosting]]
@@ -103,16 +154,14 @@ class CompanyScoringAgent:
                 scores.append(score)
 
         # Sort by total score descending
-        scores.sort(key=lambda x: x.total_score, reverse=True)
+        scores.sort(key=attrgetter('total_score'), reverse=True)
 
         # Log summary
-        hot = sum(1 for s in scores if s.tier == 'HOT')
-        qualified = sum(1 for s in scores if s.tier == 'QUALIFIED')
-        potential = sum(1 for s in scores if s.tier == 'POTENTIAL')
+        tiers = Counter(s.tier for s in scores)
 
         logger.info(
-            f"Scored companies: {hot} HOT, {qualified} QUALIFIED, "
-            f"{potential} POTENTIAL, {len(scores)} total"
+            f"Scored companies: {tiers['HOT']} HOT, {tiers['QUALIFIED']} QUALIFIED, "
+            f"{tiers['POTENTIAL']} POTENTIAL, {len(scores)} total"
         )
 
         return scores
@@ -124,20 +173,24 @@ class CompanyScoringAgent:
     ) -> CompanyScore:
         """Score a single company based on all criteria."""
 
-        # Check for red flags first
-        if self._has_red_flags(company_name, jobs):
-            logger.debug(f"Disqualified (red flags): {company_name}")
+        # Agency names are disqualified before any job text is read
+        if self._name_is_agency(company_name):
+            logger.debug(f"Disqualified (agency name): {company_name}")
             return None
 
-        # Combine all job text for analysis
-        all_text = self._get_combined_text(jobs)
+        # Find every keyword across the company's job text in one pass,
+        # stopping at the first red flag
+        hits = self._scanner.scan(self._iter_job_text(jobs), stop_categories=('agency', 'spam'))
+        if self._text_has_red_flags(hits):
+            logger.debug(f"Disqualified (red flags): {company_name}")
+            return None
 
         # Score components
         job_count_score = self._score_job_count(len(jobs))
-        tech_debt_score = self._score_technical_debt(all_text)
-        growth_score = self._score_growth_signals(all_text)
-        tech_stack_score = self._score_tech_stack(all_text)
-        seniority_score = self._score_seniority_mix(all_text)
+        tech_debt_score = self._score_technical_debt(hits)
+        growth_score = self._score_growth_signals(hits)
+        tech_stack_score = self._score_tech_stack(hits)
+        seniority_score = self._score_seniority_mix(hits)
 
         # Calculate base score
         # HIRING VELOCITY is now 70% of the score (max 70 pts out of 100)
@@ -154,12 +207,12 @@ class CompanyScoringAgent:
         multiplier = 1.0
 
         # 2x if funded
-        if any(keyword in all_text for keyword in ['funded', 'series a', 'series b', 'series c']):
+        if hits['funding']:
             multiplier *= 2.0
             logger.debug(f"{company_name}: Funding multiplier applied (2x)")
 
         # 1.5x if explicit pain points mentioned
-        if any(keyword in all_text for keyword in self.PAIN_POINT_PATTERNS):
+        if hits['pain']:
             multiplier *= 1.5
             logger.debug(f"{company_name}: Pain point multiplier applied (1.5x)")
 
@@ -176,9 +229,9 @@ class CompanyScoringAgent:
             tier = 'SKIP'
 
         # Extract insights
-        pain_points = self._extract_pain_points(all_text)
-        tech_stack = self._extract_tech_stack(all_text)
-        growth_indicators = self._extract_growth_indicators(all_text)
+        pain_points = self._extract_pain_points(hits)
+        tech_stack = self._extract_tech_stack(hits)
+        growth_indicators = self._extract_growth_indicators(hits)
 
         return CompanyScore(
             company_name=company_name,
@@ -196,29 +249,12 @@ class CompanyScoringAgent:
             jobs=jobs
         )
 
-    def _has_red_flags(self, company_name: str, jobs: List[RawJobPosting]) -> bool:
-        """Check if company should be disqualified."""
-        all_text = self._get_combined_text(jobs).lower()
-        company_lower = company_name.lower()
-
-        # Check for agency/staffing
-        if any(keyword in company_lower or keyword in all_text for keyword in self.AGENCY_KEYWORDS):
-            return True
-
-        # Check for spam
-        if any(keyword in all_text for keyword in self.SPAM_KEYWORDS):
-            return True
-
-        return False
-
-    def _get_combined_text(self, jobs: List[RawJobPosting]) -> str:
-        """Combine all job titles and descriptions into one text block."""
-        texts = []
+    def _iter_job_text(self, jobs: List[RawJobPosting]) -> Iterator[str]:
+        """Yield each job's lowercased title and description without concatenating them."""
         for job in jobs:
-            texts.append(job.title.lower())
-            if job.description and job.description != "[Quick scan - full details not fetched]":
-                texts.append(job.description.lower())
-        return ' '.join(texts)
+            yield job.title_lower
+            if job.description and job.description != _QUICK_SCAN_DESCRIPTION:
+                yield job.description_lower
 
     def _score_job_count(self, count: int) -> float:
         """
@@ -249,28 +285,28 @@ class CompanyScoringAgent:
         else:
             return 0.0   # SKIP
 
-    def _score_technical_debt(self, text: str) -> float:
+    def _score_technical_debt(self, hits: Dict[str, List[str]]) -> float:
         """Score technical debt indicators (max 25 points)."""
-        matches = sum(1 for keyword in self.TECH_DEBT_KEYWORDS if keyword in text)
+        matches = len(hits['debt'])
         # 5 points per keyword, cap at 25
-        return min(matches * 5, 25.0)
+        return self._DEBT_SCORES[matches]
 
-    def _score_growth_signals(self, text: str) -> float:
+    def _score_growth_signals(self, hits: Dict[str, List[str]]) -> float:
         """Score growth stage indicators (max 20 points)."""
-        matches = sum(1 for keyword in self.GROWTH_KEYWORDS if keyword in text)
+        matches = len(hits['growth'])
         # 4 points per keyword, cap at 20
-        return min(matches * 4, 20.0)
+        return self._GROWTH_SCORES[matches]
 
-    def _score_tech_stack(self, text: str) -> float:
+    def _score_tech_stack(self, hits: Dict[str, List[str]]) -> float:
         """Score modern tech stack (max 15 points)."""
-        matches = sum(1 for tech in self.MODERN_TECH if tech in text)
+        matches = len(hits['tech'])
         # 2 points per tech, cap at 15
-        return min(matches * 2, 15.0)
+        return self._TECH_SCORES[matches]
 
-    def _score_seniority_mix(self, text: str) -> float:
+    def _score_seniority_mix(self, hits: Dict[str, List[str]]) -> float:
         """Score seniority mix (max 10 points)."""
-        has_senior = any(keyword in text for keyword in self.SENIOR_KEYWORDS)
-        has_junior = any(keyword in text for keyword in self.JUNIOR_KEYWORDS)
+        has_senior = bool(hits['senior'])
+        has_junior = bool(hits['junior'])
 
         if has_senior and has_junior:
             return 10.0  # Full team building
@@ -281,34 +317,18 @@ class CompanyScoringAgent:
         else:
             return 0.0
 
-    def _extract_pain_points(self, text: str) -> List[str]:
+    def _extract_pain_points(self, hits: Dict[str, List[str]]) -> List[str]:
         """Extract mentioned pain points."""
-        found = []
-        for pattern in self.PAIN_POINT_PATTERNS:
-            if pattern in text:
-                found.append(pattern)
-
-        for keyword in self.TECH_DEBT_KEYWORDS:
-            if keyword in text and keyword not in found:
-                found.append(keyword)
-
+        found = list(dict.fromkeys(hits['pain'] + hits['debt']))
         return found[:10]  # Limit to top 10
 
-    def _extract_tech_stack(self, text: str) -> List[str]:
+    def _extract_tech_stack(self, hits: Dict[str, List[str]]) -> List[str]:
         """Extract mentioned technologies."""
-        found = []
-        for tech in self.MODERN_TECH:
-            if tech in text:
-                found.append(tech)
-        return found
+        return list(hits['tech'])
 
-    def _extract_growth_indicators(self, text: str) -> List[str]:
+    def _extract_growth_indicators(self, hits: Dict[str, List[str]]) -> List[str]:
         """Extract growth stage indicators."""
-        found = []
-        for indicator in self.GROWTH_KEYWORDS:
-            if indicator in text:
-                found.append(indicator)
-        return found
+        return list(hits['growth'])
 
     def get_top_companies(
         self,
@@ -328,9 +348,10 @@ class CompanyScoringAgent:
             Filtered and limited list
         """
         if tier_filter:
-            filtered = [c for c in scored_companies if c.tier == tier_filter]
+            filtered = (c for c in scored_companies if c.tier == tier_filter)
         else:
             # Skip "SKIP" tier by default
-            filtered = [c for c in scored_companies if c.tier != 'SKIP']
+            filtered = (c for c in scored_companies if c.tier != 'SKIP')
 
-        return filtered[:top_n]
+        # Stop once top_n are found; the list is already sorted
+        return list(islice(filtered, top_n))
@@ -9,18 +9,36 @@ Based on real Craigslist patterns that indicate actual business growth:
 - Capacity stress signals
 - Operational maturity indicators
 """
-from typing import List, Dict, Set, Optional
-from dataclasses import dataclass, field
-from collections import Counter
+from typing import List, Dict, FrozenSet, Optional, Set, Tuple
+from dataclasses import dataclass, field, replace
+from collections import Counter, OrderedDict
+import functools
+import hashlib
 import re
+import threading
 
+from config import Config
 from utils import get_logger
 from models import RawJobPosting
+from agents.keyword_scanner import KeywordScannerMixin
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
 
 logger = get_logger(__name__)
 
+# Scores are reused while a company's name and postings are unchanged, from an
+# in-memory LRU, optionally persisted across runs via Config.SCORE_CACHE_DIR.
+# Disqualified companies are cached as None.
+_SCORE_CACHE_SIZE = 10_000
+_score_cache: "OrderedDict[str, Optional[CompanyScore]]" = OrderedDict()
+_score_cache_lock = threading.Lock()
+_MISSING = object()
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GrowthSignals:
     """Detected growth signals for a company."""
     # Signal categories
@@ -30,12 +48,12 @@ class GrowthSignals:
     capacity_stress_signals: int = 0
     operational_maturity_signals: int = 0
 
-    # Detailed indicators
-    job_categories: Set[str] = field(default_factory=set)
-    expansion_phrases: List[str] = field(default_factory=list)
-    revenue_role_types: List[str] = field(default_factory=list)
-    stress_indicators: List[str] = field(default_factory=list)
-    maturity_indicators: List[str] = field(default_factory=list)
+    # Detailed indicators (immutable, as cached scores are shared)
+    job_categories: FrozenSet[str] = frozenset()
+    expansion_phrases: Tuple[str, ...] = ()
+    revenue_role_types: Tuple[str, ...] = ()
+    stress_indicators: Tuple[str, ...] = ()
+    maturity_indicators: Tuple[str, ...] = ()
 
     # Metadata
     wage_premium: bool = False
@@ -44,11 +62,11 @@ class GrowthSignals:
     high_volume_hiring: bool = False
 
     # Contact info (for cross-posting detection)
-    phone_numbers: Set[str] = field(default_factory=set)
-    email_addresses: Set[str] = field(default_factory=set)
+    phone_numbers: FrozenSet[str] = frozenset()
+    email_addresses: FrozenSet[str] = frozenset()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CompanyScore:
     """Enhanced scoring breakdown for a company."""
     company_name: str
@@ -70,13 +88,58 @@ class CompanyScore:
     tech_stack_score: float = 0.0
 
     # Extracted insights
-    pain_points: List[str] = field(default_factory=list)
-    tech_stack: List[str] = field(default_factory=list)
-    growth_indicators: List[str] = field(default_factory=list)
+    pain_points: Tuple[str, ...] = ()
+    tech_stack: Tuple[str, ...] = ()
+    growth_indicators: Tuple[str, ...] = ()
     jobs: List[RawJobPosting] = field(default_factory=list)
 
 
-class EnhancedCompanyScoringAgent:
+@functools.lru_cache(maxsize=None)
+def _open_score_disk_cache(directory: str):
+    """Open a score cache directory once per process."""
+    return diskcache.Cache(directory)
+
+
+def _get_score_disk_cache():
+    """Optional persistent second level, enabled by SCORE_CACHE_DIR and diskcache."""
+    if diskcache is None or not Config.SCORE_CACHE_DIR:
+        return None
+    return _open_score_disk_cache(Config.SCORE_CACHE_DIR)
+
+
+def _score_cache_get(key: str):
+    """Return a cached score (None if disqualified), or _MISSING."""
+    with _score_cache_lock:
+        score = _score_cache.get(key, _MISSING)
+        if score is not _MISSING:
+            _score_cache.move_to_end(key)
+            return score
+
+    disk = _get_score_disk_cache()
+    if disk is None:
+        return _MISSING
+    score = disk.get(key, default=_MISSING)
+    if score is not _MISSING:
+        _score_cache_put(key, score, persist=False)
+    return score
+
+
+def _score_cache_put(key: str, score: Optional[CompanyScore], persist: bool = True) -> None:
+    """Store a score, without its job list, in the LRU and the optional disk cache."""
+    if score is not None:
+        score = replace(score, jobs=None)
+    with _score_cache_lock:
+        _score_cache[key] = score
+        _score_cache.move_to_end(key)
+        if len(_score_cache) > _SCORE_CACHE_SIZE:
+            _score_cache.popitem(last=False)
+
+    disk = _get_score_disk_cache() if persist else None
+    if disk is not None:
+        disk.set(key, score)
+
+
+class EnhancedCompanyScoringAgent(KeywordScannerMixin):
     """
     Enhanced agent using sophisticated growth detection.
 
@@ -157,14 +220,84 @@ class EnhancedCompanyScoringAgent:
         r'(\d+) positions', # "15 positions available"
         r'multiple (\w+)',  # "multiple movers"
     ]
+    _VOLUME_RES = tuple(re.compile(pattern) for pattern in VOLUME_PATTERNS)
+
+    # ==================== CONTACT INFO ====================
+    _PHONE_RE = re.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b')  # Simple US phone numbers
+    _EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+
+    # ==================== JOB CATEGORIES (Indicator #1) ====================
+    # Checked in order; a title takes the first category it matches
+    TITLE_CATEGORIES = {
+        'sales': ['sales', 'account executive', 'business development'],
+        'marketing': ['marketing', 'content', 'social media'],
+        'operations': ['operations', 'coordinator', 'project manager'],
+        'admin': ['admin', 'assistant', 'receptionist'],
+        'drivers': ['driver', 'delivery', 'courier'],
+        'technicians': ['technician', 'installer', 'repair'],
+        'customer_service': ['customer service', 'support', 'customer success'],
+        'fulfillment': ['warehouse', 'fulfillment', 'logistics'],
+        'engineering': ['engineer', 'developer', 'software'],
+    }
+    # (keyword, category) in checking order, so the first keyword found in a
+    # title gives its category
+    _TITLE_KEYWORDS = tuple(
+        (keyword, category)
+        for category, keywords in TITLE_CATEGORIES.items()
+        for keyword in keywords
+    )
 
     # ==================== RED FLAGS ====================
     AGENCY_KEYWORDS = ['agency', 'staffing', 'recruiting', 'headhunter', 'placement']
     SPAM_KEYWORDS = ['make money from home', 'earn $', 'mlm', 'pyramid', 'commission only']
 
+    # Bump whenever weights, multipliers, tier thresholds or the cached score
+    # types change, so scores cached by an earlier version (including
+    # SCORE_CACHE_DIR) are not reused; test_score_cache.py pins the scoring
+    # code to this number
+    SCORING_VERSION = 2
+
+    # Overlapping phrases each count ('start immediately' inside
+    # 'need people to start immediately'), so keep every match
+    _SCANNER_LONGEST_MATCH = False
+
+    # Digest of SCORING_VERSION and the keyword tables, per class
+    _FINGERPRINT: Optional[bytes] = None
+
     def __init__(self):
+        self._scanner = self._get_scanner()
         logger.info("EnhancedCompanyScoringAgent initialized")
 
+    @classmethod
+    def _scanner_categories(cls) -> Dict[str, List[str]]:
+        """Growth signal and red flag phrases scanned for each company, by category."""
+        categories = {
+            'expansion': cls.EXPANSION_KEYWORDS,
+            'stress': cls.STRESS_SIGNALS,
+            'structured': cls.STRUCTURED_RECRUITING_SIGNALS,
+            'agency': cls.AGENCY_KEYWORDS,
+            'spam': cls.SPAM_KEYWORDS,
+        }
+        categories.update({f'revenue:{role}': kws for role, kws in cls.REVENUE_ROLES.items()})
+        categories.update({f'maturity:{cat}': tools for cat, tools in cls.MATURITY_SIGNALS.items()})
+        return categories
+
+    @classmethod
+    def _get_fingerprint(cls) -> bytes:
+        """Digest everything a score depends on besides the postings themselves."""
+        fingerprint = cls.__dict__.get('_FINGERPRINT')
+        if fingerprint is None:
+            tables = (
+                cls.__qualname__, cls.SCORING_VERSION,
+                cls.EXPANSION_KEYWORDS, cls.REVENUE_ROLES, cls.STRESS_SIGNALS,
+                cls.MATURITY_SIGNALS, cls.STRUCTURED_RECRUITING_SIGNALS,
+                cls.VOLUME_PATTERNS, cls.TITLE_CATEGORIES,
+                cls.AGENCY_KEYWORDS, cls.SPAM_KEYWORDS, cls._SCANNER_LONGEST_MATCH,
+            )
+            fingerprint = hashlib.blake2b(repr(tables).encode('utf-8'), digest_size=16).digest()
+            cls._FINGERPRINT = fingerprint
+        return fingerprint
+
     def score_companies(
         self,
         company_jobs_dict: Dict[str, List[RawJobPosting]]
@@ -172,11 +305,25 @@ class EnhancedCompanyScoringAgent:
         """Score companies using advanced growth signal detection."""
         logger.info(f"Scoring {len(company_jobs_dict)} companies with enhanced signals")
 
-        scores = []
-        for company_name, jobs in company_jobs_dict.items():
-            score = self._score_company(company_name, jobs)
-            if score:  # Skip if None (disqualified)
-                scores.append(score)
+        all_items = list(company_jobs_dict.items())
+        keys = [self._score_key(company_name, jobs) for company_name, jobs in all_items]
+        cached = [_score_cache_get(key) for key in keys]
+        todo = [i for i, score in enumerate(cached) if score is _MISSING]
+        if len(todo) < len(all_items):
+            logger.info(f"Reusing cached scores for {len(all_items) - len(todo)} unchanged companies")
+
+        results = [self._score_company(*all_items[i]) for i in todo]
+
+        for i, score in zip(todo, results):
+            _score_cache_put(keys[i], score)
+            cached[i] = score
+
+        # Skip if None (disqualified); every result gets the caller's job list
+        scores = [
+            score if score.jobs is jobs else replace(score, jobs=jobs)
+            for (_, jobs), score in zip(all_items, cached)
+            if score
+        ]
 
         # Sort by total score descending
         scores.sort(key=lambda x: x.total_score, reverse=True)
@@ -193,6 +340,16 @@ class EnhancedCompanyScoringAgent:
 
         return scores
 
+    def _score_key(self, company_name: str, jobs: List[RawJobPosting]) -> str:
+        """Cache key covering everything a company's score is computed from."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self._get_fingerprint())
+        for text in [company_name] + [
+            part for job in jobs for part in (job.title, job.description, job.location or '')
+        ]:
+            digest.update(b'\x1f' + text.encode('utf-8'))
+        return digest.hexdigest()
+
     def _score_company(
         self,
         company_name: str,
@@ -200,13 +357,21 @@ class EnhancedCompanyScoringAgent:
     ) -> Optional[CompanyScore]:
         """Score a single company with enhanced signal detection."""
 
-        # Check for red flags first
-        if self._has_red_flags(company_name, jobs):
+        # Check for red flags first, the company name before its postings
+        if self._name_is_agency(company_name):
+            logger.debug(f"Disqualified (agency name): {company_name}")
+            return None
+
+        # Combine (and lowercase) the job text once, then find every phrase
+        # of every signal category, red flags included, in a single scan
+        all_text = self._get_combined_text(jobs)
+        hits = self._scanner.scan((all_text,))
+        if self._text_has_red_flags(hits):
             logger.debug(f"Disqualified (red flags): {company_name}")
             return None
 
         # Detect growth signals
-        growth_signals = self._detect_growth_signals(jobs)
+        growth_signals = self._detect_growth_signals(jobs, all_text, hits)
 
         # Calculate score components
         hiring_velocity_score = self._score_hiring_velocity(len(jobs))
@@ -253,7 +418,7 @@ class EnhancedCompanyScoringAgent:
             tier = 'SKIP'
 
         # Extract insights
-        pain_points = self._extract_pain_points(jobs)
+        pain_points = self._extract_pain_points(growth_signals)
 
         return CompanyScore(
             company_name=company_name,
@@ -270,62 +435,60 @@ class EnhancedCompanyScoringAgent:
             jobs=jobs
         )
 
-    def _detect_growth_signals(self, jobs: List[RawJobPosting]) -> GrowthSignals:
-        """Detect all growth signals from job postings."""
-        signals = GrowthSignals()
-        all_text = self._get_combined_text(jobs).lower()
-
+    def _detect_growth_signals(
+        self,
+        jobs: List[RawJobPosting],
+        all_text: str,
+        hits: Dict[str, List[str]]
+    ) -> GrowthSignals:
+        """Detect all growth signals from job postings and their keyword hits."""
         # 1. Cross-functional hiring (multiple categories)
         categories = self._detect_job_categories(jobs)
-        signals.job_categories = categories
-        signals.cross_functional_hiring = len(categories) >= 2
 
         # 2. Expansion language
-        for keyword in self.EXPANSION_KEYWORDS:
-            if keyword in all_text:
-                signals.expansion_language_found = True
-                signals.expansion_phrases.append(keyword)
-
-        # 3. Revenue-driving roles
-        for role_type, keywords in self.REVENUE_ROLES.items():
-            for keyword in keywords:
-                if keyword in all_text:
-                    signals.revenue_roles += 1
-                    signals.revenue_role_types.append(role_type)
-                    break  # Count each role type once
-
-        # 4. High-volume hiring
-        signals.high_volume_hiring = self._detect_high_volume(all_text)
+        expansion_phrases = hits['expansion']
+
+        # 3. Revenue-driving roles, each role type counted once
+        revenue_role_types = [
+            role_type for role_type in self.REVENUE_ROLES
+            if hits[f'revenue:{role_type}']
+        ]
 
         # 7. Capacity stress signals
-        for signal in self.STRESS_SIGNALS:
-            if signal in all_text:
-                signals.capacity_stress_signals += 1
-                signals.stress_indicators.append(signal)
+        stress_indicators = hits['stress']
 
         # 8. Operational maturity
-        for category, tools in self.MATURITY_SIGNALS.items():
-            for tool in tools:
-                if tool in all_text:
-                    signals.operational_maturity_signals += 1
-                    signals.maturity_indicators.append(tool)
-                    break
+        maturity_indicators = []
+        for category in self.MATURITY_SIGNALS:
+            tools = hits[f'maturity:{category}']
+            if tools:
+                maturity_indicators.append(tools[0])
+        operational_maturity_signals = len(maturity_indicators)
 
         # 9. Structured recruiting
-        for signal in self.STRUCTURED_RECRUITING_SIGNALS:
-            if signal in all_text:
-                signals.structured_recruiting = True
-                signals.maturity_indicators.append(signal)
-                break
-
-        # 6. Multi-location indicators
-        signals.multi_location = self._detect_multi_location(jobs)
-
-        # Extract contact info (for future cross-posting detection)
-        signals.phone_numbers = self._extract_phone_numbers(all_text)
-        signals.email_addresses = self._extract_emails(all_text)
-
-        return signals
+        if hits['structured']:
+            maturity_indicators.append(hits['structured'][0])
+
+        return GrowthSignals(
+            cross_functional_hiring=len(categories) >= 2,
+            expansion_language_found=bool(expansion_phrases),
+            revenue_roles=len(revenue_role_types),
+            capacity_stress_signals=len(stress_indicators),
+            operational_maturity_signals=operational_maturity_signals,
+            job_categories=frozenset(categories),
+            expansion_phrases=tuple(expansion_phrases),
+            revenue_role_types=tuple(revenue_role_types),
+            stress_indicators=tuple(stress_indicators),
+            maturity_indicators=tuple(maturity_indicators),
+            # 6. Multi-location indicators
+            multi_location=self._detect_multi_location(jobs),
+            structured_recruiting=bool(hits['structured']),
+            # 4. High-volume hiring
+            high_volume_hiring=self._detect_high_volume(all_text),
+            # Extract contact info (for future cross-posting detection)
+            phone_numbers=self._extract_phone_numbers(all_text),
+            email_addresses=self._extract_emails(all_text),
+        )
 
     def _score_hiring_velocity(self, count: int) -> float:
         """
@@ -414,34 +577,20 @@ class EnhancedCompanyScoringAgent:
         categories = set()
 
         for job in jobs:
-            title_lower = job.title.lower()
-
-            # Map titles to categories
-            if any(kw in title_lower for kw in ['sales', 'account executive', 'business development']):
-                categories.add('sales')
-            elif any(kw in title_lower for kw in ['marketing', 'content', 'social media']):
-                categories.add('marketing')
-            elif any(kw in title_lower for kw in ['operations', 'coordinator', 'project manager']):
-                categories.add('operations')
-            elif any(kw in title_lower for kw in ['admin', 'assistant', 'receptionist']):
-                categories.add('admin')
-            elif any(kw in title_lower for kw in ['driver', 'delivery', 'courier']):
-                categories.add('drivers')
-            elif any(kw in title_lower for kw in ['technician', 'installer', 'repair']):
-                categories.add('technicians')
-            elif any(kw in title_lower for kw in ['customer service', 'support', 'customer success']):
-                categories.add('customer_service')
-            elif any(kw in title_lower for kw in ['warehouse', 'fulfillment', 'logistics']):
-                categories.add('fulfillment')
-            elif any(kw in title_lower for kw in ['engineer', 'developer', 'software']):
-                categories.add('engineering')
+            title_lower = job.title_lower
+            for keyword, category in self._TITLE_KEYWORDS:
+                if keyword in title_lower:
+                    categories.add(category)
+                    break
+            if len(categories) == len(self.TITLE_CATEGORIES):
+                break  # Every category already seen
 
         return categories
 
     def _detect_high_volume(self, text: str) -> bool:
         """Detect high-volume hiring indicators."""
-        for pattern in self.VOLUME_PATTERNS:
-            matches = re.findall(pattern, text)
+        for pattern in self._VOLUME_RES:
+            matches = pattern.findall(text)
             if matches:
                 # Check if number >= 5
                 for match in matches:
@@ -460,54 +609,28 @@ class EnhancedCompanyScoringAgent:
                 locations.add(job.location.lower())
         return len(locations) >= 2
 
-    def _extract_phone_numbers(self, text: str) -> Set[str]:
+    def _extract_phone_numbers(self, text: str) -> FrozenSet[str]:
         """Extract phone numbers from text."""
-        # Simple regex for US phone numbers
-        pattern = r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b'
-        matches = re.findall(pattern, text)
-        return set(matches)
+        return frozenset(self._PHONE_RE.findall(text))
 
-    def _extract_emails(self, text: str) -> Set[str]:
+    def _extract_emails(self, text: str) -> FrozenSet[str]:
         """Extract email addresses from text."""
-        pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        matches = re.findall(pattern, text)
-        return set(matches)
-
-    def _has_red_flags(self, company_name: str, jobs: List[RawJobPosting]) -> bool:
-        """Check if company should be disqualified."""
-        all_text = self._get_combined_text(jobs).lower()
-        company_lower = company_name.lower()
-
-        # Check for agency/staffing
-        if any(keyword in company_lower or keyword in all_text for keyword in self.AGENCY_KEYWORDS):
-            return True
-
-        # Check for spam
-        if any(keyword in all_text for keyword in self.SPAM_KEYWORDS):
-            return True
-
-        return False
+        if '@' not in text:  # Most postings have none; skip the regex scan
+            return frozenset()
+        return frozenset(self._EMAIL_RE.findall(text))
 
     def _get_combined_text(self, jobs: List[RawJobPosting]) -> str:
-        """Combine all job titles and descriptions."""
+        """Combine all job titles and descriptions, lowercased."""
         texts = []
         for job in jobs:
-            texts.append(job.title.lower())
+            texts.append(job.title_lower)
             if job.description and job.description != "[Quick scan - full details not fetched]":
-                texts.append(job.description.lower())
+                texts.append(job.description_lower)
         return ' '.join(texts)
 
-    def _extract_pain_points(self, jobs: List[RawJobPosting]) -> List[str]:
-        """Extract pain points from jobs."""
-        pain_points = []
-        all_text = self._get_combined_text(jobs)
-
-        stress_found = [sig for sig in self.STRESS_SIGNALS if sig in all_text]
-        expansion_found = [kw for kw in self.EXPANSION_KEYWORDS if kw in all_text]
-
-        pain_points.extend(stress_found[:5])  # Top 5
-        pain_points.extend(expansion_found[:5])  # Top 5
-
+    def _extract_pain_points(self, signals: GrowthSignals) -> Tuple[str, ...]:
+        """Extract pain points from the stress and expansion phrases already detected."""
+        pain_points = signals.stress_indicators[:5] + signals.expansion_phrases[:5]  # Top 5 of each
         return pain_points[:10]
 
     def get_top_companies(
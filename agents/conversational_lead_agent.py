@@ -78,7 +78,8 @@ Format as JSON."""
             max_tokens=1000,
             response_format={"type": "json_object"},
             store=True,
-            use_conversation=True
+            use_conversation=True,
+            track_history=True
         )
         
         import json
@@ -129,7 +130,8 @@ Format as JSON."""
             max_tokens=800,
             response_format={"type": "json_object"},
             store=True,
-            use_conversation=True
+            use_conversation=True,
+            track_history=True
         )
         
         import json
@@ -177,7 +179,8 @@ Format as JSON with detailed reasoning."""
             max_tokens=1000,
             response_format={"type": "json_object"},
             store=True,
-            use_conversation=True
+            use_conversation=True,
+            track_history=True
         )
         
         import json
@@ -216,7 +219,8 @@ Write the email (not JSON)."""
             temperature=0.7,  # Higher for creative writing
             max_tokens=500,
             store=True,
-            use_conversation=True
+            use_conversation=True,
+            track_history=True
         )
         
         return response
@@ -249,7 +253,8 @@ Format as JSON."""
             max_tokens=800,
             response_format={"type": "json_object"},
             store=True,
-            use_conversation=True
+            use_conversation=True,
+            track_history=True
         )
         
         import json
@@ -281,7 +286,8 @@ Format as JSON."""
             temperature=0.5,
             max_tokens=600,
             store=True,
-            use_conversation=True
+            use_conversation=True,
+            track_history=True
         )
         
         return response
@@ -293,7 +299,7 @@ Format as JSON."""
         Returns:
             Context usage statistics
         """
-        return self.client.estimate_context_usage(self.client.conversation_history)
+        return self.client.estimate_context_usage(self.client.get_conversation_history())
     
     def export_conversation(self) -> Dict[str, Any]:
         """
@@ -31,7 +31,7 @@ class ExternalSearchAgent:
             client_agent: ClientAgent for AI calls
             use_web_search: Enable web search (required for this agent)
         """
-        self.client = client_agent or ClientAgent()
+        self.client = client_agent or ClientAgent.get_shared()
         self.research_agent = CompanyResearchAgent(client_agent=self.client, use_web_search=use_web_search)
         
         if not use_web_search:
@@ -25,7 +25,7 @@ class FileSearchAgent:
             client_agent: ClientAgent instance for AI calls
             leads_dir: Directory containing lead JSON files
         """
-        self.client = client_agent or ClientAgent()
+        self.client = client_agent or ClientAgent.get_shared()
         self.leads_dir = Path(leads_dir)
         self.leads_dir.mkdir(parents=True, exist_ok=True)
         logger.info(f"FileSearchAgent initialized (leads_dir={leads_dir})")
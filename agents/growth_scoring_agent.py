@@ -42,7 +42,7 @@ class GrowthScoringAgent:
             client_agent: ClientAgent for AI calls
             use_web_search: Enable web search (required for scoring)
         """
-        self.client = client_agent or ClientAgent()
+        self.client = client_agent or ClientAgent.get_shared()
         self.use_web_search = use_web_search
         
         if not use_web_search:
@@ -19,7 +19,7 @@ class OutreachAgent:
 
     def __init__(self, client_agent: Optional[ClientAgent] = None):
         """Initialize the Outreach Agent."""
-        self.client = client_agent or ClientAgent()
+        self.client = client_agent or ClientAgent.get_shared()
         logger.info("OutreachAgent initialized")
 
     def generate_email(
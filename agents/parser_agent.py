@@ -23,7 +23,7 @@ class ParserAgent:
             client_agent: ClientAgent instance for AI-powered parsing
             use_structured_extraction: Use function calling for better data extraction
         """
-        self.client = client_agent or ClientAgent()
+        self.client = client_agent or ClientAgent.get_shared()
         self.use_structured_extraction = use_structured_extraction
         logger.info(f"ParserAgent initialized (structured_extraction={use_structured_extraction})")
 
@@ -140,7 +140,7 @@ class ServiceMatcherAgent:
 
     def __init__(self, client_agent: ClientAgent = None):
         """Initialize the Service Matcher Agent."""
-        self.client = client_agent or ClientAgent()
+        self.client = client_agent or ClientAgent.get_shared()
         logger.info("ServiceMatcherAgent initialized")
 
     def identify_opportunities(
@@ -25,7 +25,7 @@ class VisualizationAgent:
             client_agent: ClientAgent instance for AI calls
             output_dir: Directory to save generated images
         """
-        self.client = client_agent or ClientAgent()
+        self.client = client_agent or ClientAgent.get_shared()
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         logger.info(f"VisualizationAgent initialized (output_dir={output_dir})")
@@ -36,6 +36,24 @@ class Config:
     # User Agent for requests
     USER_AGENT: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
 
+    # Messages kept in ClientAgent's rolling conversation window (0 = unbounded)
+    MAX_HISTORY: int = int(os.getenv("MAX_HISTORY", "40"))
+
+    # Optional persistent cache directory for LLM extraction results (requires diskcache)
+    LLM_CACHE_DIR: str = os.getenv("LLM_CACHE_DIR", "")
+
+    # Optional SQLite file for persisting embeddings across runs
+    EMBEDDING_CACHE_DB: str = os.getenv("EMBEDDING_CACHE_DB", "")
+
+    # How long researched company profiles are reused, and an optional
+    # directory to share them across processes (requires diskcache)
+    PROFILE_CACHE_TTL: int = int(os.getenv("PROFILE_CACHE_TTL", "86400"))
+    PROFILE_CACHE_DIR: str = os.getenv("PROFILE_CACHE_DIR", "")
+
+    # Optional directory for persisting enhanced company scores across runs
+    # (requires diskcache)
+    SCORE_CACHE_DIR: str = os.getenv("SCORE_CACHE_DIR", "")
+
     # Logging Configuration
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
 
@@ -106,7 +106,7 @@ def init_agents():
     try:
         if not client_agent:
             print("Initializing ClientAgent...")
-            client_agent = ClientAgent()
+            client_agent = ClientAgent.get_shared()
             print("✓ ClientAgent initialized")
             
         if not scraper_agent:
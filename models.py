@@ -3,10 +3,15 @@ Data models for the Craigslist Agent system.
 Uses Pydantic for data validation and serialization.
 """
 from datetime import datetime
+from functools import cached_property
 from typing import Optional, List, Dict, Any
 from pydantic import BaseModel, Field, HttpUrl
 
 
+# Fields with a lowercased cached_property on RawJobPosting
+_LOWERED_FIELDS = {'title': 'title_lower', 'description': 'description_lower'}
+
+
 class RawJobPosting(BaseModel):
     """Raw job posting data from scraper."""
 
@@ -19,6 +24,32 @@ class RawJobPosting(BaseModel):
     scraped_at: datetime = Field(default_factory=datetime.utcnow)
     raw_html: Optional[str] = None
 
+    # Lowercased copies for keyword matching, computed on first use and
+    # dropped whenever the source field changes. They aren't fields, so they
+    # are never serialized or compared.
+    @cached_property
+    def title_lower(self) -> str:
+        """Lowercased title."""
+        return self.title.lower()
+
+    @cached_property
+    def description_lower(self) -> str:
+        """Lowercased description."""
+        return self.description.lower()
+
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        if name in _LOWERED_FIELDS:
+            self.__dict__.pop(_LOWERED_FIELDS[name], None)
+
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> "RawJobPosting":
+        """Copy the posting; lowercased copies of updated fields are recomputed."""
+        copied = super().model_copy(update=update, deep=deep)
+        for name in update or ():
+            if name in _LOWERED_FIELDS:
+                copied.__dict__.pop(_LOWERED_FIELDS[name], None)
+        return copied
+
 
 class ParsedJobPosting(BaseModel):
     """Parsed and structured job posting data."""
@@ -106,6 +137,19 @@ class JobAnalysis(BaseModel):
     analyzed_at: datetime = Field(default_factory=datetime.utcnow)
 
 
+class CompanyData(BaseModel):
+    """Company information returned by the extract_company_data function call."""
+
+    company_name: str
+    company_size: Optional[str] = None  # "1-10" ... "5000+", or "unknown"
+    industry: str
+    hiring_volume_signals: Optional[List[str]] = None
+    pain_points: Optional[List[str]] = None
+    growth_indicators: Optional[List[str]] = None
+    forecasta_fit_score: int  # 0-10
+    forecasta_fit_reasoning: str
+
+
 class JobSignal(BaseModel):
     """
     Signal data extracted from Craigslist job posting.
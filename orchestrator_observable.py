@@ -3,7 +3,7 @@ Observable Orchestrator with Real-time Progress Tracking
 NEW: Signal-based growth detection (NOT direct lead extraction from Craigslist)
 """
 from orchestrator_simple import SimpleProspectingOrchestrator
-from agent_progress import PipelineProgress, set_current_progress, clear_current_progress
+from agent_progress import PipelineProgress, set_current_progress, reset_current_progress, clear_current_progress
 from typing import Dict, Any, List
 from utils import get_logger
 from models_enhanced import CompanyProfile, ProspectLead, JobPostingEnhanced
@@ -49,7 +49,7 @@ class ObservableOrchestrator(SimpleProspectingOrchestrator):
         """
         # Create progress tracker
         self.progress = PipelineProgress()
-        set_current_progress(self.progress)
+        progress_token = set_current_progress(self.progress)
 
         # Define pipeline stages (NEW SIGNAL-BASED WORKFLOW)
         scraper_agent = self.progress.add_agent("scraper", "Scanning Craigslist for job signals")
@@ -103,7 +103,6 @@ class ObservableOrchestrator(SimpleProspectingOrchestrator):
             job_signals = []
             for idx, raw_job in enumerate(raw_jobs, 1):
                 signal_agent.update(current=idx, message=f"Extracting signals {idx}/{len(raw_jobs)}...")
-                self.progress.notify()
 
                 try:
                     signal = self.parser_agent.extract_job_signal(raw_job, use_ai=self.use_ai_parsing)
@@ -182,7 +181,6 @@ class ObservableOrchestrator(SimpleProspectingOrchestrator):
                     current=idx,
                     message=f"Scoring {company_data.get('company_name', 'Unknown')}..."
                 )
-                self.progress.notify()
 
             # Batch scoring
             scored_companies = growth_scorer.score_companies(discovered_companies)
@@ -242,7 +240,7 @@ class ObservableOrchestrator(SimpleProspectingOrchestrator):
             return {'success': False, 'error': str(e), 'companies': [], 'signals': []}
 
         finally:
-            clear_current_progress()
+            reset_current_progress(progress_token)
 
     def _save_signal_results(self, results: Dict[str, Any]):
         """Save signal and company results to files."""
@@ -268,7 +266,6 @@ class ObservableOrchestrator(SimpleProspectingOrchestrator):
             companies_with_growth = []
             for i, company_data in enumerate(parsed_companies_data, 1):
                 growth_agent.update(current=i, message=f"Analyzing {company_data['company_score'].company_name}...")
-                self.progress.notify()
 
                 company_score = company_data['company_score']
                 parsed_jobs = company_data['parsed_jobs']
@@ -321,7 +318,6 @@ class ObservableOrchestrator(SimpleProspectingOrchestrator):
             prospects = []
             for i, company_data in enumerate(companies_with_growth, 1):
                 matcher_agent.update(current=i, message=f"Matching services for {company_data['profile'].name}...")
-                self.progress.notify()
 
                 # Include the hiring velocity score in the prospect
                 velocity_score = company_data['velocity_score']
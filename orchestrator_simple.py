@@ -56,7 +56,7 @@ class SimpleProspectingOrchestrator:
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
         # Initialize agents
-        self.client_agent = ClientAgent() if use_ai_parsing else None
+        self.client_agent = ClientAgent.get_shared() if use_ai_parsing else None
         self.parser_agent = ParserAgent(self.client_agent)
         self.growth_analyzer = GrowthSignalAnalyzerAgent()
         self.company_researcher = CompanyResearchAgent(self.client_agent)
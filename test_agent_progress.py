@@ -0,0 +1,131 @@
+"""
+Tests for progress notifications in agent_progress.
+Subscribers should hear about status changes and meaningful progress moves,
+not every single item update.
+"""
+from agent_progress import PipelineProgress
+
+
+def _pipeline_with_agent(total_items=1000):
+    """Pipeline with one started agent and a callback recording progress."""
+    pipeline = PipelineProgress()
+    seen = []
+    pipeline.on_update(lambda p: seen.append(round(p.overall_progress, 4)))
+    agent = pipeline.add_agent('scraper', 'Scrape postings')
+    agent.start(total_items=total_items)
+    return pipeline, agent, seen
+
+
+def test_status_change_notifies():
+    """Starting, completing and failing an agent always notify."""
+    pipeline, agent, seen = _pipeline_with_agent()
+    assert seen == [0.0]
+
+    agent.complete()
+    assert seen == [0.0, 1.0]
+
+    other = pipeline.add_agent('parser', 'Parse postings')
+    other.fail('boom')
+    assert len(seen) == 3
+
+
+def test_small_progress_steps_are_coalesced():
+    """Updates below min_delta are skipped until they add up."""
+    pipeline, agent, seen = _pipeline_with_agent()
+
+    for current in range(1, 5):
+        agent.update(current)
+    assert seen == [0.0]
+
+    agent.update(5)
+    assert seen == [0.0, 0.005]
+
+    agent.update(9)
+    assert seen == [0.0, 0.005]
+
+    agent.update(10)
+    assert seen == [0.0, 0.005, 0.01]
+
+
+def test_message_only_update_does_not_notify():
+    """A new message without progress or status change is not pushed."""
+    pipeline, agent, seen = _pipeline_with_agent()
+
+    agent.update(message='still working')
+    assert seen == [0.0]
+    assert agent.message == 'still working'
+
+
+def test_explicit_notify_resets_baseline():
+    """notify() always fires and becomes the reference for later deltas."""
+    pipeline, agent, seen = _pipeline_with_agent()
+
+    agent.update(3)
+    pipeline.notify()
+    assert seen == [0.0, 0.003]
+
+    agent.update(7)
+    assert seen == [0.0, 0.003]
+
+    agent.update(8)
+    assert seen == [0.0, 0.003, 0.008]
+
+
+def test_custom_min_delta():
+    """A smaller min_delta reports moves the default one skips."""
+    pipeline, agent, seen = _pipeline_with_agent()
+
+    agent.update(3)
+    assert seen == [0.0]
+
+    pipeline.notify_if_changed(min_delta=0.01)
+    assert seen == [0.0]
+
+    pipeline.notify_if_changed(min_delta=0.001)
+    assert seen == [0.0, 0.003]
+
+
+def test_no_callbacks_is_a_no_op():
+    """Without subscribers nothing is recorded as notified."""
+    pipeline = PipelineProgress()
+    agent = pipeline.add_agent('scraper', 'Scrape postings')
+    agent.start(total_items=10)
+    agent.update(5)
+
+    assert pipeline._last_notified_progress is None
+    assert pipeline.overall_progress == 0.5
+
+
+def test_first_subscriber_hears_next_change():
+    """A callback added mid-run is notified on the next move, however small."""
+    pipeline = PipelineProgress()
+    agent = pipeline.add_agent('scraper', 'Scrape postings')
+    agent.start(total_items=1000)
+    agent.update(500)
+
+    seen = []
+    pipeline.on_update(lambda p: seen.append(round(p.overall_progress, 4)))
+    agent.update(501)
+    assert seen == [0.501]
+
+    agent.update(502)
+    assert seen == [0.501]
+
+
+def test_failing_callback_is_unregistered():
+    """A callback that raises is dropped and the others still run."""
+    pipeline = PipelineProgress()
+    seen = []
+
+    def broken(progress):
+        raise RuntimeError('subscriber went away')
+
+    pipeline.on_update(broken)
+    pipeline.on_update(lambda p: seen.append(p.completed_agents))
+    agent = pipeline.add_agent('scraper', 'Scrape postings')
+    agent.start()
+    agent.complete()
+
+    assert seen == [0, 1]
+    assert len(pipeline.callbacks) == 1
+    assert broken not in pipeline.callbacks
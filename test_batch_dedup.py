@@ -0,0 +1,124 @@
+"""
+Tests for duplicate-prompt handling in the BatchProcessorAgent.
+Runs the full create -> upload -> download -> parse chain against a fake
+OpenAI client and checks that every duplicate custom_id gets a result.
+"""
+import json
+from types import SimpleNamespace
+
+import pytest
+
+import agents.batch_processor_agent as batch_processor_agent
+from agents.batch_processor_agent import BatchProcessorAgent
+
+
+class _FakeFiles:
+    """Files API that keeps uploads in memory and answers every request."""
+
+    def __init__(self):
+        self.uploads = {}
+
+    def create(self, file, purpose):
+        file_id = f"file-{len(self.uploads)}"
+        self.uploads[file_id] = file.read()
+        return SimpleNamespace(id=file_id)
+
+    def content(self, file_id):
+        lines = []
+        for line in self.uploads['file-0'].splitlines():
+            request = json.loads(line)
+            answer = {'answered': request['custom_id']}
+            lines.append(json.dumps({
+                'custom_id': request['custom_id'],
+                'error': None,
+                'response': {
+                    'status_code': 200,
+                    'body': {
+                        'choices': [{'message': {'content': json.dumps(answer)}}],
+                        'usage': {'total_tokens': 10},
+                    },
+                },
+            }))
+        return SimpleNamespace(read=lambda: '\n'.join(lines).encode('utf-8'))
+
+
+class _FakeOpenAI:
+    """Just enough of the OpenAI client for one completed batch."""
+
+    def __init__(self, api_key=None, http_client=None):
+        self.files = _FakeFiles()
+        self.batches = SimpleNamespace(retrieve=self._retrieve)
+
+    def _retrieve(self, batch_id):
+        return SimpleNamespace(
+            id=batch_id,
+            status='completed',
+            created_at=0,
+            completed_at=1,
+            failed_at=None,
+            expired_at=None,
+            request_counts=SimpleNamespace(total=1, completed=1, failed=0),
+            input_file_id='file-0',
+            output_file_id='file-out',
+            error_file_id=None,
+        )
+
+
+@pytest.fixture
+def agent(tmp_path, monkeypatch):
+    monkeypatch.setattr(batch_processor_agent, 'OpenAI', _FakeOpenAI)
+    return BatchProcessorAgent(output_dir=str(tmp_path))
+
+
+def _job(url, description='Need a plumber, start Monday'):
+    return {
+        'url': url,
+        'title': 'Plumber',
+        'company_name': 'Acme Plumbing',
+        'location': 'Birmingham',
+        'description': description,
+    }
+
+
+def test_duplicate_results_follow_the_file_chain(agent, tmp_path):
+    """Duplicates are sent once and fanned back out after download."""
+    jobs = [_job('a'), _job('b'), _job('c', 'Hiring drivers')]
+
+    input_file = agent.create_batch_input_file(jobs)
+    with open(input_file) as f:
+        assert [json.loads(line)['custom_id'] for line in f] == ['analyze_a', 'analyze_c']
+    assert batch_processor_agent._dup_map_path(input_file).exists()
+
+    file_id = agent.upload_batch_file(input_file)
+    assert not batch_processor_agent._dup_map_path(input_file).exists()
+    assert (tmp_path / f"dup_map_{file_id}.json").exists()
+
+    results_file = agent.download_results('batch-1')
+    assert (tmp_path / 'batch_output_batch-1.dups.json').exists()
+
+    results = {r['custom_id']: r for r in agent.parse_results(results_file)}
+    assert sorted(results) == ['analyze_a', 'analyze_b', 'analyze_c']
+    assert results['analyze_b']['data'] == {'answered': 'analyze_a'}
+    assert results['analyze_c']['data'] == {'answered': 'analyze_c'}
+    assert all(r['success'] for r in results.values())
+
+
+def test_no_dup_map_without_duplicates(agent, tmp_path):
+    """Distinct prompts leave no duplicate map anywhere in the chain."""
+    jobs = [_job('a'), _job('c', 'Hiring drivers')]
+
+    input_file = agent.create_batch_input_file(jobs)
+    agent.upload_batch_file(input_file)
+    results_file = agent.download_results('batch-2')
+
+    assert not list(tmp_path.glob('*dup*'))
+    assert [r['custom_id'] for r in agent.parse_results(results_file)] == ['analyze_a', 'analyze_c']
+
+
+def test_deduplicate_off_sends_every_prompt(agent):
+    """With deduplicate=False every job gets its own request line."""
+    input_file = agent.create_batch_input_file([_job('a'), _job('b')], deduplicate=False)
+
+    with open(input_file) as f:
+        assert len(f.readlines()) == 2
+    assert not batch_processor_agent._dup_map_path(input_file).exists()
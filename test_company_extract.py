@@ -0,0 +1,62 @@
+"""
+Tests for ClientAgent.extract_company_info_structured.
+Tool-call arguments are cached only when they decode to a JSON object, and a
+malformed reply falls back to the "Unknown" result instead of raising.
+"""
+from collections import OrderedDict
+from types import SimpleNamespace
+
+import pytest
+
+import agents.client_agent as client_agent
+from agents.client_agent import ClientAgent
+from config import Config
+
+
+def _reply(arguments):
+    """Chat completion carrying one extract_company_data tool call."""
+    tool_call = SimpleNamespace(function=SimpleNamespace(arguments=arguments))
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(tool_calls=[tool_call]))])
+
+
+@pytest.fixture
+def agent(monkeypatch):
+    """ClientAgent answering from a list of canned tool-call arguments."""
+    monkeypatch.setattr(Config, 'OPENAI_API_KEY', 'test-key')
+    monkeypatch.setattr(Config, 'LLM_CACHE_DIR', '')
+    monkeypatch.setattr(client_agent, '_get_encoding', lambda *args: None)
+    monkeypatch.setattr(client_agent, '_result_cache', OrderedDict())
+    client_agent._get_disk_cache.cache_clear()
+
+    agent = ClientAgent()
+    agent.replies = []
+    agent.truncate_to_tokens = lambda text, max_tokens: text
+    agent.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(
+        create=lambda **kwargs: _reply(agent.replies.pop(0))
+    )))
+    yield agent
+    client_agent._get_disk_cache.cache_clear()
+
+
+def test_object_reply_is_cached(agent):
+    """A lenient (float fit score) object reply is returned and reused."""
+    agent.replies = ['{"company_name": "Acme", "forecasta_fit_score": 7.5}']
+
+    first = agent.extract_company_info_structured('Plumber wanted', 'Plumber')
+    second = agent.extract_company_info_structured('Plumber wanted', 'Plumber')
+
+    assert first == second == {'company_name': 'Acme', 'forecasta_fit_score': 7.5}
+    assert agent.replies == []
+
+
+@pytest.mark.parametrize('arguments', ['[]', '"Acme"', 'not json'])
+def test_non_object_reply_falls_back_uncached(agent, arguments):
+    """Replies that aren't a JSON object give the fallback and are not cached."""
+    agent.replies = [arguments, '{"company_name": "Acme"}']
+
+    first = agent.extract_company_info_structured('Plumber wanted', 'Plumber')
+    second = agent.extract_company_info_structured('Plumber wanted', 'Plumber')
+
+    assert first['company_name'] == 'Unknown'
+    assert first['forecasta_fit_score'] == 0
+    assert second == {'company_name': 'Acme'}
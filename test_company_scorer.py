@@ -0,0 +1,44 @@
+"""
+Tests for the CompanyScoringAgent.
+Keywords nested inside longer ones must not be counted twice, but they must
+still trigger the presence-based multipliers.
+"""
+from agents.company_scorer import CompanyScoringAgent
+from models import RawJobPosting
+
+
+def _jobs(description, count=3):
+    return [
+        RawJobPosting(
+            title='Software Engineer',
+            url=f'https://bham.craigslist.org/sof/{i}.html',
+            description=description,
+            location='Birmingham',
+            category='software'
+        )
+        for i in range(count)
+    ]
+
+
+def test_well_funded_gets_the_funding_multiplier():
+    """'well-funded' doubles the score just like 'funded' does."""
+    agent = CompanyScoringAgent()
+
+    well_funded = agent._score_company('Acme', _jobs('well-funded startup with legacy code'))
+    funded = agent._score_company('Acme', _jobs('funded startup with legacy code'))
+
+    assert well_funded.total_score == funded.total_score == 84.0
+    assert well_funded.tier == funded.tier == 'HOT'
+
+
+def test_nested_keywords_are_counted_once():
+    """'slow deployment' counts as a pain point, not also as 'slow' tech debt."""
+    agent = CompanyScoringAgent()
+
+    nested = agent._score_company('Acme', _jobs('our slow deployment needs work'))
+    separate = agent._score_company('Acme', _jobs('slow builds and a slow deployment'))
+
+    assert nested.technical_debt_score == 0.0
+    assert nested.pain_points == ['slow deployment']
+    assert separate.technical_debt_score == 5.0
+    assert separate.pain_points == ['slow deployment', 'slow']
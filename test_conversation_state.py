@@ -127,7 +127,7 @@ def test_response_chaining():
         {"role": "user", "content": "Tell me what makes a company a good fit for workforce analytics software."}
     ]
     
-    response1 = client._call_api(messages1, store=True)
+    response1 = client._call_api(messages1, store=True, track_history=True)
     print(f"   ✅ Response 1 ID: {client.previous_response_id}")
     print(f"   Preview: {response1[:100]}...")
     
@@ -137,7 +137,7 @@ def test_response_chaining():
     ]
     
     # This automatically uses previous_response_id for context
-    response2 = client._call_api(messages2, store=True)
+    response2 = client._call_api(messages2, store=True, track_history=True)
     print(f"   ✅ Response 2 ID: {client.previous_response_id}")
     print(f"   Preview: {response2[:100]}...")
     
@@ -146,7 +146,7 @@ def test_response_chaining():
         {"role": "user", "content": "What's the estimated ROI for that company?"}
     ]
     
-    response3 = client._call_api(messages3, store=True)
+    response3 = client._call_api(messages3, store=True, track_history=True)
     print(f"   ✅ Response 3 ID: {client.previous_response_id}")
     print(f"   Preview: {response3[:100]}...")
     
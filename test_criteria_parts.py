@@ -0,0 +1,36 @@
+"""
+Tests for the criteria text and fingerprint shared by relevance scoring calls.
+Any dict that formats into a prompt must also give a stable cache fingerprint.
+"""
+import pytest
+
+import agents.client_agent as client_agent
+from agents.client_agent import _criteria_parts
+
+
+@pytest.fixture(autouse=True)
+def empty_criteria_cache(monkeypatch):
+    monkeypatch.setattr(client_agent, '_criteria_cache', {})
+
+
+def test_key_order_does_not_change_fingerprint():
+    """Equal criteria written in a different order share a fingerprint."""
+    text, fingerprint = _criteria_parts({'skills': ['python'], 'location': 'Birmingham'})
+    _, reordered = _criteria_parts({'location': 'Birmingham', 'skills': ['python']})
+
+    assert text == "- skills: ['python']\n- location: Birmingham"
+    assert fingerprint == reordered
+
+
+@pytest.mark.parametrize('criteria', [
+    {1: 'remote', 'skills': 'python'},
+    {'nested': {2: 'a', 'b': 3}},
+    {('min', 'max'): (10, 20)},
+])
+def test_keys_json_cannot_sort(criteria):
+    """Mixed or non-string keys still give text and a distinct fingerprint."""
+    text, fingerprint = _criteria_parts(criteria)
+
+    assert text == "\n".join(f"- {k}: {v}" for k, v in criteria.items())
+    assert _criteria_parts(dict(criteria)) == (text, fingerprint)
+    assert fingerprint != _criteria_parts({'skills': 'python'})[1]
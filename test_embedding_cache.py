@@ -0,0 +1,110 @@
+"""
+Tests for the ClientAgent embedding cache.
+Vectors live in an in-memory LRU and, when EMBEDDING_CACHE_DB is set, in a
+SQLite file that survives across processes.
+"""
+from collections import OrderedDict
+
+import pytest
+
+import agents.client_agent as client_agent
+from agents.client_agent import ClientAgent
+from config import Config
+
+
+@pytest.fixture
+def embedding_cache(tmp_path, monkeypatch):
+    """Fresh memory cache backed by a temporary SQLite file."""
+    monkeypatch.setattr(Config, 'EMBEDDING_CACHE_DB', str(tmp_path / 'embeddings.sqlite'))
+    monkeypatch.setattr(client_agent, '_embedding_cache', OrderedDict())
+    client_agent._get_embedding_db.cache_clear()
+    yield client_agent._embedding_cache
+    db = client_agent._get_embedding_db()
+    if db is not None:
+        db.close()
+    client_agent._get_embedding_db.cache_clear()
+
+
+def _restart(monkeypatch):
+    """Forget everything held in memory, as a new process would."""
+    db = client_agent._get_embedding_db()
+    if db is not None:
+        db.close()
+    client_agent._get_embedding_db.cache_clear()
+    monkeypatch.setattr(client_agent, '_embedding_cache', OrderedDict())
+
+
+def test_vectors_survive_a_restart(embedding_cache, monkeypatch):
+    """Stored vectors are read back from SQLite as float32 with the same values."""
+    key = client_agent._embedding_key('plumber wanted', 'text-embedding-3-small')
+    client_agent._embedding_cache_put_many({key: client_agent._to_vector([0.5, -1.25, 3.0])})
+
+    _restart(monkeypatch)
+    found = client_agent._embedding_cache_get_many([key, 'missing'])
+
+    assert list(found) == [key]
+    assert list(found[key]) == [0.5, -1.25, 3.0]
+    assert found[key].tobytes() == client_agent._to_vector([0.5, -1.25, 3.0]).tobytes()
+    # SQLite hits are promoted to memory
+    assert key in client_agent._embedding_cache
+
+
+def test_lru_evicts_from_memory_only(embedding_cache, monkeypatch):
+    """Keys pushed out of the memory LRU are still served from SQLite."""
+    monkeypatch.setattr(client_agent, '_EMBEDDING_CACHE_SIZE', 2)
+    vectors = {f'm:{i}': client_agent._to_vector([float(i)]) for i in range(3)}
+    client_agent._embedding_cache_put_many(vectors)
+
+    assert list(embedding_cache) == ['m:1', 'm:2']
+    found = client_agent._embedding_cache_get_many(['m:0'])
+    assert list(found['m:0']) == [0.0]
+
+
+def test_memory_only_without_db(monkeypatch):
+    """With EMBEDDING_CACHE_DB unset the cache works from memory alone."""
+    monkeypatch.setattr(Config, 'EMBEDDING_CACHE_DB', '')
+    monkeypatch.setattr(client_agent, '_embedding_cache', OrderedDict())
+    client_agent._get_embedding_db.cache_clear()
+    try:
+        assert client_agent._get_embedding_db() is None
+        client_agent._embedding_cache_put_many({'m:a': client_agent._to_vector([1.0])})
+        assert list(client_agent._embedding_cache_get_many(['m:a'])['m:a']) == [1.0]
+    finally:
+        client_agent._get_embedding_db.cache_clear()
+
+
+@pytest.fixture
+def agent(monkeypatch):
+    """ClientAgent whose embeddings requests are recorded instead of sent."""
+    monkeypatch.setattr(Config, 'OPENAI_API_KEY', 'test-key')
+    monkeypatch.setattr(client_agent, '_get_encoding', lambda *args: None)
+    requests = []
+
+    async def fake_aembed(self, texts, chunk_size, concurrency):
+        requests.append(list(texts))
+        return [[float(len(text))] for text in texts]
+
+    monkeypatch.setattr(ClientAgent, '_aembed', fake_aembed)
+    agent = ClientAgent()
+    agent.requests = requests
+    return agent
+
+
+def test_only_uncached_texts_are_embedded(embedding_cache, agent):
+    """Each distinct text is embedded once, across calls."""
+    first = agent._embedding_vectors(['ab', 'abcd', 'ab'], chunk_size=256, concurrency=4)
+    second = agent._embedding_vectors(['abcd', 'abc'], chunk_size=256, concurrency=4)
+
+    assert agent.requests == [['ab', 'abcd'], ['abc']]
+    assert [list(v) for v in first] == [[2.0], [4.0], [2.0]]
+    assert [list(v) for v in second] == [[4.0], [3.0]]
+
+
+def test_use_cache_false_always_embeds(embedding_cache, agent):
+    """Agents created with use_cache=False neither read nor fill the cache."""
+    agent.use_cache = False
+    agent._embedding_vectors(['ab'], chunk_size=256, concurrency=4)
+    agent._embedding_vectors(['ab'], chunk_size=256, concurrency=4)
+
+    assert agent.requests == [['ab'], ['ab']]
+    assert not embedding_cache
@@ -0,0 +1,155 @@
+"""
+Tests for the KeywordScanner used by both company scorers.
+Every matcher backend (RE2, hyperscan, pyahocorasick, substring tests) must
+report exactly the same keywords.
+"""
+import pickle
+import random
+
+import pytest
+
+import agents.keyword_scanner as keyword_scanner
+from agents.keyword_scanner import KeywordScanner
+
+BACKENDS = ['re2', 'hyperscan', 'ahocorasick', None]
+
+# 'slow deployment' overlaps keywords of its own category ('slow') and of
+# another one ('deployment'); 'expanding' is listed in two categories
+CATEGORIES = {
+    'debt': ['slow', 'slow deployment', 'legacy'],
+    'growth': ['deployment', 'expanding', 'we are expanding'],
+    'hiring': ['expanding', 'hiring'],
+    'agency': ['staffing'],
+    'spam': ['mlm'],
+}
+
+
+@pytest.fixture(params=BACKENDS, ids=lambda backend: backend or 'substring')
+def backend(request, monkeypatch):
+    """Leave only one matcher module importable for scanners built in the test."""
+    if request.param is not None and getattr(keyword_scanner, request.param) is None:
+        pytest.skip(f"{request.param} not installed")
+    for name in BACKENDS[:-1]:
+        if name != request.param:
+            monkeypatch.setattr(keyword_scanner, name, None)
+    return request.param
+
+
+def _substring_scanner(categories, longest_match=True):
+    """Build a scanner on the plain substring backend, as the reference."""
+    with pytest.MonkeyPatch.context() as patch:
+        for name in BACKENDS[:-1]:
+            patch.setattr(keyword_scanner, name, None)
+        return KeywordScanner(categories, longest_match=longest_match)
+
+
+def test_backend_is_used(backend):
+    """The scanner compiles the matcher it was left with."""
+    scanner = KeywordScanner(CATEGORIES)
+    compiled = {
+        're2': scanner._re2_set,
+        'hyperscan': scanner._hs_db,
+        'ahocorasick': scanner._automaton,
+    }
+    for name, matcher in compiled.items():
+        assert (matcher is not None) == (name == backend)
+
+
+def test_longest_match_drops_covered_keywords(backend):
+    """Keywords found only inside a longer keyword are dropped, across categories."""
+    scanner = KeywordScanner(CATEGORIES)
+
+    hits = scanner.scan(['our slow deployment process', 'we are expanding'])
+    assert hits['debt'] == ['slow deployment']
+    assert hits['growth'] == ['we are expanding']
+    assert hits['hiring'] == []
+
+    # A second, standalone occurrence still counts
+    hits = scanner.scan(['slow deployment and a slow build', 'expanding fast'])
+    assert hits['debt'] == ['slow', 'slow deployment']
+    assert hits['growth'] == ['expanding']
+    assert hits['hiring'] == ['expanding']
+
+
+def test_all_matches_without_longest_match(backend):
+    """Overlapping keywords are all reported when longest_match is off."""
+    scanner = KeywordScanner(CATEGORIES, longest_match=False)
+
+    hits = scanner.scan(['our slow deployment process, we are expanding'])
+    assert hits['debt'] == ['slow', 'slow deployment']
+    assert hits['growth'] == ['deployment', 'expanding', 'we are expanding']
+    assert hits['hiring'] == ['expanding']
+
+
+def test_longest_match_limited_to_categories(backend):
+    """Categories left out of longest_match still report covered keywords."""
+    scanner = KeywordScanner(CATEGORIES, longest_match=('debt',))
+
+    hits = scanner.scan(['our slow deployment process, we are expanding'])
+    assert hits['debt'] == ['slow deployment']
+    assert hits['growth'] == ['deployment', 'expanding', 'we are expanding']
+    assert hits['hiring'] == ['expanding']
+
+    # A stop category outside longest_match stops on a covered keyword too
+    scanner = KeywordScanner(
+        {'agency': ['staff'], 'growth': ['staffing up', 'hiring']},
+        longest_match=('growth',)
+    )
+    hits = scanner.scan(['staffing up fast', 'hiring'], stop_categories=('agency',))
+    assert hits['agency'] == ['staff']
+    assert hits['growth'] == ['staffing up']
+
+
+def test_keywords_do_not_span_chunks(backend):
+    """Chunks are searched separately, never joined."""
+    scanner = KeywordScanner(CATEGORIES)
+
+    hits = scanner.scan(['we had a slow', 'deployment'])
+    assert hits['debt'] == ['slow']
+    assert hits['growth'] == ['deployment']
+
+
+def test_stop_categories_end_scan(backend):
+    """A hit in a stop category stops reading the remaining chunks."""
+    scanner = KeywordScanner(CATEGORIES)
+    chunks = ['legacy systems', 'staffing firm', 'hiring now', 'mlm']
+
+    hits = scanner.scan(iter(chunks), stop_categories=('agency', 'spam'))
+    assert hits['debt'] == ['legacy']
+    assert hits['agency'] == ['staffing']
+    assert hits['hiring'] == []
+    assert hits['spam'] == []
+
+    hits = scanner.scan(iter(chunks))
+    assert hits['hiring'] == ['hiring']
+    assert hits['spam'] == ['mlm']
+
+
+def test_pickled_scanner_rebuilds_matcher(backend):
+    """A pickled scanner compiles its matcher again and finds the same keywords."""
+    scanner = KeywordScanner(CATEGORIES)
+    copy = pickle.loads(pickle.dumps(scanner))
+
+    chunks = ['our slow deployment process', 'staffing and mlm']
+    assert copy.scan(chunks) == scanner.scan(chunks)
+
+
+@pytest.mark.parametrize('longest_match', [True, False, ('debt', 'hiring')])
+def test_backends_match_substring_reference(backend, longest_match):
+    """Random texts give the same hits as the substring backend."""
+    keywords = sorted({kw for kws in CATEGORIES.values() for kw in kws})
+    filler = ['and', 'our', 'slow', 'deploy', 'ment', 'we are', 'café', 'x']
+    rnd = random.Random(0)
+
+    reference = _substring_scanner(CATEGORIES, longest_match)
+    scanner = KeywordScanner(CATEGORIES, longest_match=longest_match)
+    for _ in range(300):
+        chunks = [
+            ' '.join(rnd.choice(keywords + filler) for _ in range(rnd.randint(0, 8)))
+            for _ in range(rnd.randint(1, 3))
+        ]
+        assert scanner.scan(chunks) == reference.scan(chunks), chunks
+        assert (
+            scanner.scan(chunks, stop_categories=('agency',))
+            == reference.scan(chunks, stop_categories=('agency',))
+        ), chunks
@@ -0,0 +1,122 @@
+"""
+Tests for the CompanyResearchAgent profile cache.
+Researched profiles are reused for PROFILE_CACHE_TTL seconds, from memory and
+optionally from a diskcache directory shared across processes.
+"""
+import time
+from collections import OrderedDict
+
+import pytest
+
+import agents.company_research_agent as company_research_agent
+from agents.company_research_agent import CompanyResearchAgent
+from config import Config
+from models_enhanced import CompanyProfile, ResearchQuery
+
+KEY = ('acme plumbing', 'birmingham', '', ('google',), False)
+
+
+class _Clock:
+    """Stand-in for the time module with a clock the test moves by hand."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Empty memory cache, no disk cache, and a manual clock."""
+    monkeypatch.setattr(Config, 'PROFILE_CACHE_DIR', '')
+    monkeypatch.setattr(Config, 'PROFILE_CACHE_TTL', 60)
+    monkeypatch.setattr(company_research_agent, '_profile_cache', OrderedDict())
+    company_research_agent._get_profile_disk_cache.cache_clear()
+    clock = _Clock()
+    monkeypatch.setattr(company_research_agent, 'time', clock)
+    yield clock
+    company_research_agent._get_profile_disk_cache.cache_clear()
+
+
+def _profile(**fields):
+    return CompanyProfile(name='Acme Plumbing', data_sources=['google'], **fields)
+
+
+def test_hit_within_ttl_is_a_private_copy(clock):
+    """Fresh entries are returned as copies the caller may modify."""
+    profile = _profile(tech_stack=['quickbooks'])
+    assert company_research_agent._profile_cache_put(KEY, profile) is profile
+
+    clock.now += 59
+    cached = company_research_agent._profile_cache_get(KEY)
+    assert cached == profile
+    cached.tech_stack.append('excel')
+    assert company_research_agent._profile_cache_get(KEY).tech_stack == ['quickbooks']
+
+
+def test_entry_expires_after_ttl(clock):
+    """Stale entries are dropped on lookup."""
+    company_research_agent._profile_cache_put(KEY, _profile())
+
+    clock.now += 61
+    assert company_research_agent._profile_cache_get(KEY) is None
+    assert KEY not in company_research_agent._profile_cache
+
+
+def test_zero_ttl_disables_caching(clock, monkeypatch):
+    """PROFILE_CACHE_TTL=0 turns the cache off."""
+    monkeypatch.setattr(Config, 'PROFILE_CACHE_TTL', 0)
+    company_research_agent._profile_cache_put(KEY, _profile())
+
+    assert company_research_agent._profile_cache_get(KEY) is None
+
+
+def test_disk_cache_is_shared_across_processes(clock, tmp_path, monkeypatch):
+    """Profiles persisted to PROFILE_CACHE_DIR are found after memory is cleared."""
+    pytest.importorskip('diskcache')
+    monkeypatch.setattr(Config, 'PROFILE_CACHE_DIR', str(tmp_path))
+    monkeypatch.setattr(company_research_agent, 'time', time)
+    company_research_agent._get_profile_disk_cache.cache_clear()
+    try:
+        company_research_agent._profile_cache_put(KEY, _profile(domain='acme.com'))
+        monkeypatch.setattr(company_research_agent, '_profile_cache', OrderedDict())
+
+        cached = company_research_agent._profile_cache_get(KEY)
+        assert cached is not None and cached.domain == 'acme.com'
+        # Promoted to memory for the next lookup
+        assert KEY in company_research_agent._profile_cache
+    finally:
+        company_research_agent._get_profile_disk_cache().close()
+
+
+@pytest.fixture
+def agent(clock, monkeypatch):
+    """Research agent whose platform research is counted instead of performed."""
+    researched = []
+
+    async def fake_gather(self, query):
+        researched.append(query.company_name)
+        return _profile()
+
+    monkeypatch.setattr(CompanyResearchAgent, '_gather_profile', fake_gather)
+    monkeypatch.setattr(CompanyResearchAgent, '_ai_enhance_profile', lambda self, profile: profile)
+    agent = CompanyResearchAgent(client_agent=object(), use_web_search=False)
+    agent.researched = researched
+    return agent
+
+
+def test_research_company_reuses_profile(agent):
+    """Repeated research is served from the cache unless force_refresh is set."""
+    query = ResearchQuery(company_name='Acme Plumbing', location='Birmingham')
+
+    first = agent.research_company(query)
+    second = agent.research_company(ResearchQuery(company_name=' ACME plumbing ', location='birmingham'))
+    assert agent.researched == ['Acme Plumbing']
+    assert second == first and second is not first
+
+    agent.research_company(query, force_refresh=True)
+    assert agent.researched == ['Acme Plumbing', 'Acme Plumbing']
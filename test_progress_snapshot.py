@@ -0,0 +1,78 @@
+"""
+Tests for PipelineProgress snapshots.
+A snapshot reads the monotonic clock once and derives every duration in it
+from that single reading.
+"""
+import pytest
+
+import agent_progress
+from agent_progress import PipelineProgress
+
+
+class _Clock:
+    """Stand-in for the time module that counts monotonic reads."""
+
+    def __init__(self):
+        self.now = 100.0
+        self.reads = 0
+
+    def monotonic(self):
+        self.reads += 1
+        return self.now
+
+    def time(self):
+        return 1_700_000_000.0 + self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(agent_progress, 'time', clock)
+    return clock
+
+
+def _pipeline(clock):
+    """Started pipeline with one finished, one running and one idle agent."""
+    pipeline = PipelineProgress()
+    pipeline.start()
+    done = pipeline.add_agent('scraper', 'Scrape postings')
+    running = pipeline.add_agent('parser', 'Parse postings')
+    pipeline.add_agent('scorer', 'Score companies')
+
+    done.start(total_items=4)
+    clock.now += 5
+    done.complete()
+    running.start(total_items=4)
+    clock.now += 10
+    running.update(2)
+    return pipeline
+
+
+def test_snapshot_reads_clock_once(clock):
+    """to_dict reads time.monotonic once, whatever the number of agents."""
+    pipeline = _pipeline(clock)
+
+    clock.reads = 0
+    pipeline.to_dict()
+    assert clock.reads == 1
+
+    for i in range(20):
+        pipeline.add_agent(f'extra-{i}', 'Extra')
+    clock.reads = 0
+    pipeline.to_dict()
+    assert clock.reads == 1
+
+
+def test_snapshot_durations_share_one_reading(clock):
+    """Elapsed and remaining times agree with each other and with the agents."""
+    pipeline = _pipeline(clock)
+    snapshot = pipeline.to_dict()
+
+    assert snapshot['elapsed_time'] == 15.0
+    assert snapshot['overall_progress'] == 0.5
+    assert snapshot['estimated_time_remaining'] == 15.0
+    elapsed = {a['name']: a.get('elapsed_time') for a in snapshot['agents']}
+    assert elapsed == {'scraper': 5.0, 'parser': 10.0, 'scorer': None}
+    # Finished agents and the live properties use the same clock
+    assert pipeline.elapsed_time == 15.0
+    assert pipeline.estimated_time_remaining == 15.0
@@ -0,0 +1,179 @@
+"""
+Tests for the EnhancedCompanyScoringAgent score cache.
+Companies whose name and postings are unchanged reuse their previous score,
+from memory or from SCORE_CACHE_DIR, until the scoring tables change.
+"""
+import hashlib
+import inspect
+from collections import OrderedDict
+
+import pytest
+
+import agents.company_scorer_enhanced as company_scorer_enhanced
+from agents.company_scorer_enhanced import EnhancedCompanyScoringAgent
+from config import Config
+from models import RawJobPosting
+
+# Cache keys only cover SCORING_VERSION and the keyword tables, so the code
+# that turns postings into a score is pinned here per version. When
+# test_scoring_code_is_pinned_to_version fails: bump SCORING_VERSION if the
+# change can alter any score, then record the new digest for it.
+SCORING_CODE_DIGESTS = {
+    2: '448d5a7fb3e468fbe22bf65b51386c19',
+}
+
+# Members that only route work through the cache (or hold per-process
+# state) and never change a score
+_CACHE_PLUMBING = {
+    '__init__', '__dict__', '__weakref__', '_SCANNER', '_FINGERPRINT',
+    '_get_fingerprint', '_score_key', 'score_companies', 'get_top_companies',
+}
+
+
+def _job(title, description, location='Birmingham'):
+    return RawJobPosting(
+        title=title,
+        url=f'https://bham.craigslist.org/{title}',
+        description=description,
+        location=location,
+        category='jobs'
+    )
+
+
+def _companies():
+    return {
+        'Acme Plumbing': [
+            _job('Service Technician', "We're expanding! Start immediately, overtime available"),
+            _job('Dispatcher', 'Due to increased demand we need 6 techs. Salesforce experience a plus'),
+        ],
+        'Bright Staffing': [_job('Warehouse Picker', 'Staffing agency placement')],
+    }
+
+
+class _CountingAgent(EnhancedCompanyScoringAgent):
+    """Records every company actually scored instead of served from cache."""
+
+    def __init__(self):
+        super().__init__()
+        self.scored = []
+
+    def _score_company(self, company_name, jobs):
+        self.scored.append(company_name)
+        return super()._score_company(company_name, jobs)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    """Fresh memory cache and no disk cache for every test."""
+    monkeypatch.setattr(Config, 'SCORE_CACHE_DIR', '')
+    monkeypatch.setattr(company_scorer_enhanced, '_score_cache', OrderedDict())
+
+
+def test_unchanged_companies_are_not_rescored():
+    """A second run over the same postings scores nothing, disqualified included."""
+    companies = _companies()
+    agent = _CountingAgent()
+
+    first = agent.score_companies(companies)
+    assert sorted(agent.scored) == ['Acme Plumbing', 'Bright Staffing']
+    assert [s.company_name for s in first] == ['Acme Plumbing']
+
+    agent.scored.clear()
+    second = agent.score_companies(companies)
+    assert agent.scored == []
+    assert second == first
+    # Cached scores carry the caller's job list
+    assert second[0].jobs is companies['Acme Plumbing']
+
+
+def test_changed_postings_are_rescored():
+    """Editing, adding or removing a posting invalidates that company only."""
+    companies = _companies()
+    agent = _CountingAgent()
+    agent.score_companies(companies)
+
+    agent.scored.clear()
+    companies['Acme Plumbing'][1] = _job('Dispatcher', 'Now hiring for new territory')
+    agent.score_companies(companies)
+    assert agent.scored == ['Acme Plumbing']
+
+    agent.scored.clear()
+    companies['Acme Plumbing'].append(_job('Driver', 'Route driver', 'Hoover'))
+    agent.score_companies(companies)
+    assert agent.scored == ['Acme Plumbing']
+
+
+def test_scoring_changes_invalidate_cached_scores():
+    """New keyword tables or a new SCORING_VERSION never reuse old scores."""
+    companies = _companies()
+    _CountingAgent().score_companies(companies)
+
+    class NewKeywords(_CountingAgent):
+        EXPANSION_KEYWORDS = EnhancedCompanyScoringAgent.EXPANSION_KEYWORDS + ['new territory']
+
+    class NewVersion(_CountingAgent):
+        SCORING_VERSION = EnhancedCompanyScoringAgent.SCORING_VERSION + 1
+
+    for cls in (NewKeywords, NewVersion):
+        agent = cls()
+        agent.score_companies(companies)
+        assert sorted(agent.scored) == ['Acme Plumbing', 'Bright Staffing']
+
+
+def test_scores_persist_in_score_cache_dir(tmp_path, monkeypatch):
+    """Scores written to SCORE_CACHE_DIR are reused after memory is cleared."""
+    pytest.importorskip('diskcache')
+    monkeypatch.setattr(Config, 'SCORE_CACHE_DIR', str(tmp_path))
+    companies = _companies()
+    try:
+        first = _CountingAgent().score_companies(companies)
+
+        monkeypatch.setattr(company_scorer_enhanced, '_score_cache', OrderedDict())
+        agent = _CountingAgent()
+        second = agent.score_companies(companies)
+        assert agent.scored == []
+        assert second == first
+    finally:
+        company_scorer_enhanced._get_score_disk_cache().close()
+        company_scorer_enhanced._open_score_disk_cache.cache_clear()
+
+
+def _scoring_code_digest():
+    """Digest the source of every scorer method and the value of every constant."""
+    digest = hashlib.blake2b(digest_size=16)
+    for cls in EnhancedCompanyScoringAgent.__mro__[:-1]:  # Shared helpers included
+        for name, member in sorted(vars(cls).items()):
+            if name in _CACHE_PLUMBING:
+                continue
+            member = getattr(member, '__func__', member)
+            text = inspect.getsource(member) if inspect.isfunction(member) else f'{name} = {member!r}'
+            digest.update(text.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def test_scoring_code_is_pinned_to_version():
+    """Scoring code changes come with a SCORING_VERSION decision."""
+    version = EnhancedCompanyScoringAgent.SCORING_VERSION
+    assert SCORING_CODE_DIGESTS.get(version) == _scoring_code_digest(), (
+        "Scoring code changed: bump SCORING_VERSION if scores can change, "
+        "then pin the new digest in SCORING_CODE_DIGESTS"
+    )
+
+
+def test_cached_scores_cannot_be_mutated():
+    """Cache hits are shared, so their collections are immutable."""
+    companies = _companies()
+    agent = _CountingAgent()
+    agent.score_companies(companies)
+    score = agent.score_companies(companies)[0]
+
+    assert agent.scored == ['Acme Plumbing', 'Bright Staffing']
+    for value in (
+        score.pain_points,
+        score.growth_indicators,
+        score.growth_signals.expansion_phrases,
+        score.growth_signals.stress_indicators,
+        score.growth_signals.job_categories,
+        score.growth_signals.phone_numbers,
+    ):
+        assert isinstance(value, (tuple, frozenset))
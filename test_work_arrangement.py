@@ -0,0 +1,38 @@
+"""
+Tests for the local work arrangement matcher in ClientAgent.
+Explicit phrases are classified without an API call; anything ambiguous
+returns None so the model decides.
+"""
+import pytest
+
+from agents.client_agent import ClientAgent
+
+
+@pytest.mark.parametrize('description, expected', [
+    ("This is a fully remote role", "remote"),
+    ("100% Remote - WFH friendly", "remote"),
+    ("We are a remote-first team", "remote"),
+    ("Work from home, flexible hours", "remote"),
+    ("Hybrid schedule: 3 days in office", "hybrid"),
+    ("HYBRID role", "hybrid"),
+    ("On-site position in Birmingham", "onsite"),
+    ("Must be able to work onsite", "onsite"),
+    ("In office Monday to Friday", "onsite"),
+    ("on site training provided", "onsite"),
+])
+def test_explicit_phrases(description, expected):
+    """Unambiguous wording is classified locally."""
+    assert ClientAgent._match_work_arrangement(description) == expected
+
+
+@pytest.mark.parametrize('description', [
+    "Great pay and benefits, apply today",
+    "Work from home after training, onsite first",
+    "Fully remote or hybrid, your choice",
+    "Hybridization lab technician",
+    "Remote control car repair",
+    "",
+])
+def test_unclear_descriptions_are_left_to_the_model(description):
+    """No phrase, mixed remote/office wording, or partial words give None."""
+    assert ClientAgent._match_work_arrangement(description) is None